@@ -16,98 +16,30 @@
 import argparse
 import os
 import sys
-from time import sleep
 
-import keyboard
 import numpy as np
-import pandas
 import pyautogui
 import PySimpleGUI as sg
-import importlib
 
+from editor_utils.canvas import read_geometry
+from editor_utils.cost_model import HEIGHT_ORDERS, calibrate_costs, compare_options, default_costs, estimate_plan, format_estimate, read_summaries
+from editor_utils.drivers import DRIVERS, DriverBackend, get_driver
+from editor_utils.journal import ProgressJournal, read_journal, resume_plan
+from editor_utils.map_diff import format_diff_stats, format_initial_stats, mark_initial, mark_unchanged
+from editor_utils.map_format import is_map_bundle
+from editor_utils.map_stream import DEFAULT_PRODUCERS, stream_sessions
+from editor_utils.page_check import expected_squares, failed_squares, ground_start, page_ranges, read_references, repair_plan
+from editor_utils.pacing import AdaptivePacer, PacedBackend, PixelVerifier, default_budgets
+from editor_utils.plan import OP_KEY, read_plan, write_plan
+from editor_utils.planner import BRUSH_PLANNERS, KEY_SLEEP, PAGE_ORDERS, RESIZE_SLEEP, compile_plan, get_menu_dict, load_map
+from editor_utils.replay import replay_plan
+from editor_utils.telemetry import RunTelemetry
 from profiles import available_profiles
-# from profiles.cold_war.menu import MENU_DICT
-from profiles.general.buttons import *
-from profiles.general.constants import *
 
 DEBUG_MODE = False
 
 pyautogui.PAUSE = 0.05
 
-def set_height(current_height, target_height):
-    if current_height == target_height:
-        return
-    elif current_height < target_height:
-        n_diff = target_height - current_height
-        for i in range(n_diff):
-            if not DEBUG_MODE:
-                keyboard.send('+')
-                sleep(0.1)
-    else:
-        n_diff = current_height - target_height
-        print(n_diff)
-        for i in range(n_diff):
-            if not DEBUG_MODE:
-                keyboard.send('-')
-                sleep(0.1)
-
-
-def process_segment(grid, start_height):
-    values = grid.z.sort_values().unique()
-    min_height = grid[grid.z >= 0].z.min()
-    
-    if np.isnan(min_height):
-        return start_height
-    
-    set_height(start_height, min_height)
-    height = min_height
-
-    for val in values:
-        grid_extract = grid[grid.z == val]
-
-        set_height(height, val)
-
-        for ridx, row in grid_extract.iterrows():
-            idx0 = row.x
-            idx1 = row.y
-            x_pos = int(idx0 * SQUARE_SIZE_X + UPPER_LEFT_SQUARE.x)
-            y_pos = int(LOWER_RIGHT_SQUARE.y - idx1 * SQUARE_SIZE_Y)
-            height = val
-
-            if not DEBUG_MODE:
-                pyautogui.click(x=x_pos, y=y_pos)
-
-    return height
-
-def set_n_squares(start_n_x, start_n_y, n_x, n_y, mode='window'):
-    n_clicks_x = abs(int((start_n_x - n_x) / 2))
-    n_clicks_y = abs(int((start_n_y - n_y) / 2))
-
-    for i in range(n_clicks_x):
-        if not DEBUG_MODE:
-            if n_x <= start_n_x:
-                if mode in ('window', 'finish'):
-                    pyautogui.click(POS_HORIZONTAL_PLUS2, interval=0.05)
-                if mode in ('window', 'init'):
-                    pyautogui.click(POS_HORIZONTAL_MINUS, interval=0.05)
-            else:
-                if mode in ('window', 'init'):
-                    pyautogui.click(POS_HORIZONTAL_PLUS, interval=0.05)
-                if mode in ('window', 'finish'):
-                    pyautogui.click(POS_HORIZONTAL_MINUS2, interval=0.05)    
-    
-    for i in range(n_clicks_y):
-        if not DEBUG_MODE:
-            if n_y <= start_n_y:
-                if mode in ('window', 'finish'):
-                    pyautogui.click(POS_VERTICAL_PLUS2, interval=0.05)    
-                if mode in ('window', 'init'):
-                    pyautogui.click(POS_VERTICAL_MINUS, interval=0.05)
-            else:
-                if mode in ('window', 'init'):
-                    pyautogui.click(POS_VERTICAL_PLUS, interval=0.05)
-                if mode in ('window', 'finish'):
-                    pyautogui.click(POS_VERTICAL_MINUS2, interval=0.05)    
 
 def display_gui():
     # Construct window layout
@@ -125,10 +57,12 @@ def display_gui():
         [sg.Text('In case something goes wrong, move the mouse cursor to one of the screen corners.')],
         [sg.Text('')],
         [sg.Text('Select file: ')], 
-        [sg.Input(), sg.FileBrowse(key='filepath', file_types=(('CSV files', '*.csv'),))],
+        [sg.Input(), sg.FileBrowse(key='filepath', file_types=(('CSV files', '*.csv'), ('Map or plan files', '*.npz'), ('Parquet files', '*.parquet')))],
         [sg.Text('Countdown: '), sg.InputCombo(key='countdown',values=[5, 10, 15, 20, 25, 30], default_value=10)],
         [sg.Checkbox('Take start size from file (only for continueing a map!)', key='start_size_from_file', enable_events=True, default=False)],
+        [sg.Checkbox('Resume the stopped run of this file (leave the editor as it was)', key='resume', default=False)],
         [sg.Text('Min. time between clicks [s]: '), sg.InputCombo(key='min_time',values=[0.05, 0.1, 0.15, 0.2], default_value=0.05), sg.Text(' Only increase if CMAutoEditor skips items.')],
+        [sg.Checkbox('Adapt the time between clicks to how fast the editor reacts', key='adaptive_pacing', default=False)],
         [sg.Text(text='', key='error_text')],
         [sg.Push(), sg.Button('Start CMAutoEditor', key='start'), sg.Exit(), sg.Push()]]
 
@@ -154,175 +88,243 @@ def display_gui():
     window.close()
     # Start editor with UI inputs
     if start and values['filepath'] != '' and values['filepath'] != None:
-        start_editor(values['filepath'], values['countdown'], values['start_size_from_file'], values['min_time'], available_profiles[values['cm_profile']])
+        start_editor(values['filepath'], values['countdown'], start_size_from_file=values['start_size_from_file'], min_time=values['min_time'],
+                     profile=available_profiles[values['cm_profile']], resume=values['resume'], adaptive_pacing=values['adaptive_pacing'])
             
 
-def set_ground(df, map_df):
-    for group_info, group in df.groupby(by=['menu', 'cat1', 'cat2', 'direction']):
-        if group_info[0] not in MENU_DICT:
-            continue
-
-        if group_info[0] not in MENU_DICT or group_info[1] not in MENU_DICT:
-            continue
-        if not DEBUG_MODE:
-            pyautogui.click(MENU_DICT[group_info[0]])
-            pyautogui.click(MENU_DICT[group_info[1]])
-
-        if group_info[2] in MENU_DICT:
-            if not DEBUG_MODE:
-                pyautogui.click(MENU_DICT[group_info[2]])
-        if group_info[3] in MENU_DICT:
-            if not DEBUG_MODE:
-                pyautogui.click(MENU_DICT[group_info[3]])
-
-        if group_info[0].startswith('Ground') or group_info[0].startswith('Brush'): 
-            xmin, ymin = group.loc[:,['x','y']].min()
-            xmax, ymax = group.loc[:,['x','y']].max()
-
-            xy_mat = np.full((xmax-xmin+1, ymax-ymin+1), -1, dtype=int)
-            
-            for _, row in group.iterrows():
-                xy_mat[row.x - xmin, row.y - ymin] = row.name
-
-            group1 = pandas.DataFrame(columns=group.columns)
-            group3 = pandas.DataFrame(columns=group.columns)
-            group7 = pandas.DataFrame(columns=group.columns)
-            group15 = pandas.DataFrame(columns=group.columns)
-
-            brush_idx_lists = [[], [], [], []]
-
-            for step, brush_idx_list in ((15, brush_idx_lists[1]), (7, brush_idx_lists[2]), (3, brush_idx_lists[3])):
-                for x in range(step-1, xy_mat.shape[0]):
-                    for y in range(step-1, xy_mat.shape[1]):
-                        if not (xy_mat[x-step+1:x+1, y-step+1:y+1] < 0).any():
-                            brush_indices = xy_mat[x-step+1+int(step/2), y-step+1+int(step/2)]
-                            brush_idx_list.append(brush_indices)
+def load_input(filepath, applied_path=None, profile=None, elevation=True):
+    """
+    Map to compile and its changes against the previously applied map at applied_path (None without one). With
+    applied_path only the squares that differ from that map are left to do. Without applied_path but with a profile the
+    map goes onto a new map, the squares that already have the start elevation or the default ground of the profile are
+    left out (elevation=False keeps the elevation), see map_diff.mark_initial.
+    """
+    map_df = load_map(filepath)
+    if applied_path is None:
+        if profile is not None:
+            map_df, initial_stats = mark_initial(map_df, profile, elevation)
+            print('New map: {}'.format(format_initial_stats(initial_stats)))
+        return map_df, None
+    map_df, diff_stats = mark_unchanged(map_df, load_map(applied_path))
+    print('Changes against {}: {}'.format(applied_path, format_diff_stats(diff_stats)))
+    return map_df, diff_stats
+
+
+def compile_input(filepath, profile='cold_war', start_size_from_file=False, brush_planner='layered', applied_path=None, page_order='planned',
+                  elevation_error=None, height_order='sweep', geometry=None, all_squares=False):
+    map_df, diff_stats = load_input(filepath, applied_path, None if start_size_from_file or all_squares else profile, elevation_error is None)
+    # the previously applied map is still in the editor, so the run continues from its size
+    start_size_from_file = start_size_from_file or applied_path is not None
+
+    plan = compile_plan(map_df, profile, start_size_from_file, height_order=height_order, brush_planner=brush_planner,
+                        page_order=page_order, elevation_error=elevation_error, geometry=geometry)
+    if 'height_rows' in plan.meta:
+        print('Elevation squares: {planned} of {all}'.format(**plan.meta['height_rows']))
+    if diff_stats is not None:
+        plan.meta['diff'] = diff_stats
+    print('Elevation key presses: {planned} ({saved} saved by sweep order)'.format(
+        planned=plan.meta['height_keys']['planned'], saved=plan.meta['height_keys']['ascending'] - plan.meta['height_keys']['planned']))
+    print('Resize clicks: {planned} ({saved} saved by page order)'.format(
+        planned=plan.meta['resize_clicks']['planned'], saved=plan.meta['resize_clicks']['rows'] - plan.meta['resize_clicks']['planned']))
+
+    return plan
+
+
+def get_costs(summary_paths=None, default_summary_path=None, min_time=0.05):
+    """
+    Cost model for dry runs, fitted to the given run summaries or, if there are none, to default_summary_path if it exists.
+    """
+    costs = default_costs(min_time, KEY_SLEEP, RESIZE_SLEEP)
+    if summary_paths is None:
+        summary_paths = [default_summary_path] if default_summary_path is not None and os.path.exists(default_summary_path) else []
+    if len(summary_paths) == 0:
+        return costs
+
+    costs, fit = calibrate_costs(read_summaries(summary_paths), costs)
+    print('Cost model fitted to {pages} pages ({measured:.0f} s measured, {predicted:.0f} s predicted, {page_error:.1f} s mean error per page): '.format(**fit)
+          + ', '.join('{} {:.3f} s'.format(event, cost) for event, cost in costs.items()))
+    return costs
+
+
+def get_backend(min_time=0.05, adaptive_pacing=False, elevation_probe=None, pacing_log=None, driver_name='pyautogui', batch_size=200,
+                record_path=None):
+    """
+    Backend for the replay and the pacer (None if pacing is fixed). Input goes through the driver driver_name (see
+    editor_utils.drivers), in DEBUG_MODE it is dropped. Adaptive pacing checks the screen after every action, so it
+    cannot be combined with drivers that send batches. With adaptive pacing the fixed pause after clicks is switched
+    off and every action waits for the budget of its class instead, adapted to whether canvas, menu and brush clicks (and
+    key presses if the screen position of the elevation readout is given) visibly changed the editor.
+    """
+    pause = 0 if adaptive_pacing else min_time
+    pyautogui.PAUSE = pause
+    if DEBUG_MODE:
+        driver_name = 'null'
+    driver = get_driver(driver_name, batch_size, record_path)
+    if adaptive_pacing and driver.batch_size > 1 and not DEBUG_MODE:
+        raise ValueError('Adaptive pacing sends one action at a time and cannot be combined with the batching driver {}.'.format(driver_name))
+    if driver_name == 'pyautogui':
+        # pyautogui pauses after clicks and checks the fail safe itself before every click
+        backend = DriverBackend(driver)
+    else:
+        backend = DriverBackend(driver, pyautogui.failSafeCheck, pause)
+    if not adaptive_pacing:
+        return backend, None
+
+    pacer = AdaptivePacer(default_budgets(min_time, KEY_SLEEP, RESIZE_SLEEP), log_path=pacing_log)
+    probe_points = {OP_KEY: tuple(elevation_probe)} if elevation_probe is not None else None
+    verifier = PixelVerifier(pyautogui.pixel, probe_points=probe_points) if not DEBUG_MODE else None
+    return PacedBackend(backend, pacer, verifier), pacer
+
+
+def verify_page(plan, page_start, end, references, backend, menu_dict, after_action, rounds=2, elevation=True):
+    """
+    Compare a screenshot of the page up to action end with the squares the plan set on it and click the squares that
+    failed again, up to rounds times. elevation=False leaves out the elevations, which have to be checked before the
+    first menu click of the page, afterwards the editor cannot set them any more.
+    """
+    expected = expected_squares(plan, page_start, end)
+    if not elevation:
+        expected = {square: label for square, label in expected.items() if not label.startswith('z')}
+    for i in range(rounds):
+        failed = failed_squares(np.array(pyautogui.screenshot()), references, expected, geometry=plan.meta.get('geometry'))
+        if len(failed) == 0:
+            return
+        print('Page {}: {} of {} squares failed, clicking them again'.format(plan.ops[page_start, 3], len(failed), len(expected)))
+        replay_plan(repair_plan(plan, failed, end, menu_dict), backend, menu_dict, after_action=after_action)
+
+
+def open_journal(plan, journal_path, input_path, resume=False):
+    """
+    Journal of the run of the plan and, when resuming, the prelude that restores the editor state and the index of the
+    action to continue with. Returns (None, None, len(plan)) if the resumed run has already finished.
+    """
+    if not resume:
+        journal = ProgressJournal(journal_path)
+        journal.write('start', n_ops=len(plan), input=input_path, profile=plan.profile)
+        return journal, None, 0
+
+    entries = read_journal(journal_path)
+    prelude, start = resume_plan(plan, entries)
+    if start >= len(plan):
+        return None, None, start
+    journal = ProgressJournal(journal_path, {key: entries[-1][key] for key in ('window', 'height')})
+    journal.write('resume', start)
+    print('Resuming at action {} of {}'.format(start, len(plan)))
+    return journal, prelude, start
+
+
+def run_plan(plan, backend, journal, telemetry_path, prelude=None, start=0, references_path=None):
+    """
+    Replay the plan from start, after the prelude of a resumed run, recording the progress in the journal (which is
+    closed afterwards) and the run summary at telemetry_path. Returns False if the run was stopped by the fail safe.
+    """
+    menu_dict = get_menu_dict(plan.profile)
+    telemetry = RunTelemetry(plan, start)
+
+    def after_action(index, op, a, b, c):
+        journal(index, op, a, b, c)
+        telemetry(index, op, a, b, c)
+
+    # actions that are not part of the plan (resume prelude, repairs) are recorded without index
+    def after_extra_action(index, op, a, b, c):
+        after_action(None, op, a, b, c)
+
+    finished = True
+    try:
+        if prelude is not None:
+            replay_plan(prelude, backend, menu_dict, after_action=after_extra_action)
+        if references_path is None or DEBUG_MODE:
+            replay_plan(plan, backend, menu_dict, start=start, after_action=after_action)
+        else:
+            references = read_references(references_path)
+            for page_start, begin, end in page_ranges(plan, start):
+                # the elevations of a page with ground are checked before its first menu or brush click
+                split = ground_start(plan, page_start, end) if page_start is not None else None
+                if split is not None and begin < split:
+                    replay_plan(plan, backend, menu_dict, start=begin, end=split, after_action=after_action)
+                    verify_page(plan, page_start, split, references, backend, menu_dict, after_extra_action)
+                    begin = split
+                replay_plan(plan, backend, menu_dict, start=begin, end=end, after_action=after_action)
+                if page_start is not None:
+                    verify_page(plan, page_start, end, references, backend, menu_dict, after_extra_action, elevation=split is None)
+        journal.write('finish', len(plan))
 
-                            xy_mat[x-step+1:x+1, y-step+1:y+1] = -1
+    except pyautogui.FailSafeException:
+        print('Stopped, continue with --resume (progress is kept in {})'.format(journal.path))
+        finished = False
+
+    journal.close()
+    telemetry.write(telemetry_path)
+    print(telemetry.progress())
+    print('Time per phase: {}, run summary in {}'.format(
+        ', '.join('{} {:.0f} s'.format(phase, counts['time']) for phase, counts in telemetry.phases.items()), telemetry_path))
+    return finished
+
+
+def start_editor(filepath, countdown, start_size_from_file=False, min_time=0.05, profile='cold_war', brush_planner='layered',
+                 resume=False, journal_path=None, applied_path=None, page_order='planned', elevation_error=None,
+                 adaptive_pacing=False, elevation_probe=None, pacing_log=None, references_path=None, telemetry_path=None,
+                 driver_name='pyautogui', batch_size=200, record_path=None, height_order='sweep', geometry=None, all_squares=False):
+    backend, pacer = get_backend(min_time, adaptive_pacing, elevation_probe, pacing_log, driver_name=driver_name, batch_size=batch_size,
+                                 record_path=record_path)
+    if filepath.endswith('.npz') and not is_map_bundle(filepath):
+        plan = read_plan(filepath)
+    else:
+        plan = compile_input(filepath, profile, start_size_from_file, brush_planner, applied_path, page_order, elevation_error,
+                             height_order=height_order, geometry=geometry, all_squares=all_squares)
 
-            brush_idx_lists[0].extend(xy_mat[xy_mat >= 0])
+    if journal_path is None:
+        journal_path = filepath + '.journal'
+    if telemetry_path is None:
+        telemetry_path = filepath + '.telemetry.json'
 
-            group1 = group[group.index.isin(brush_idx_lists[0])]
-            group3 = group[group.index.isin(brush_idx_lists[3])]
-            group7 = group[group.index.isin(brush_idx_lists[2])]
-            group15 = group[group.index.isin(brush_idx_lists[1])]
+    journal, prelude, start = open_journal(plan, journal_path, filepath, resume)
+    if journal is None:
+        pyautogui.alert(text='The run recorded in {} has already finished.'.format(journal_path), title='CMAutoEditor')
+        return
 
-            brush_groups = []
-            for brush_group in [(BRUSH_1, group1), (BRUSH_3, group3), (BRUSH_7, group7), (BRUSH_15, group15)]:
-                if len(brush_group[1]) > 0:
-                    brush_groups.append(brush_group)
+    if not DEBUG_MODE:
+        pyautogui.countdown(countdown)
+    run_plan(plan, backend, journal, telemetry_path, prelude, start, references_path)
+    if pacer is not None:
+        print('Pacing: {}'.format(pacer.summary()))
+        pacer.close()
 
-            
-        else:
-            brush_groups = [(BRUSH_1, group)]
+    pyautogui.alert(text='CMAutoEditor has finished processing the input data.', title='CMAutoEditor')
 
-        for brush_button, brush_group in brush_groups:
-            if not DEBUG_MODE:
-                pyautogui.click(brush_button)
-            for row_idx, row in brush_group.iterrows():
-                x_pos = int(row.x * SQUARE_SIZE_X + UPPER_LEFT_SQUARE.x)
-                y_pos = int(LOWER_RIGHT_SQUARE.y - row.y * SQUARE_SIZE_Y)
-                if not DEBUG_MODE:
-                    pyautogui.click(x=x_pos, y=y_pos)
 
-            map_df.loc[row_idx, 'done'] = 1
+def stream_editor(stream_path, countdown, producers=None, start_size_from_file=False, min_time=0.05, profile='cold_war',
+                  brush_planner='layered', resume=False, page_order='planned', adaptive_pacing=False, elevation_probe=None,
+                  pacing_log=None, references_path=None, driver_name='pyautogui', batch_size=200, record_path=None,
+                  height_order='sweep', poll_interval=1.0, geometry=None, all_squares=False):
+    """
+    Click a map stream (see editor_utils.map_stream) while the converters are still publishing it: every session is
+    clicked as soon as its parts are there, with its journal and run summary next to its plan in the stream directory.
+    With resume the sessions that finished are skipped and a stopped one is resumed from its journal.
+    """
+    backend, pacer = get_backend(min_time, adaptive_pacing, elevation_probe, pacing_log, driver_name=driver_name, batch_size=batch_size,
+                                 record_path=record_path)
+    if not DEBUG_MODE:
+        pyautogui.countdown(countdown)
+
+    for session in stream_sessions(stream_path, producers, profile, start_size_from_file, poll_interval, resume, not all_squares,
+                                   brush_planner=brush_planner, page_order=page_order, height_order=height_order, geometry=geometry):
+        base_path = os.path.join(stream_path, session['name'])
+        journal, prelude, start = open_journal(session['plan'], base_path + '.journal', base_path + '.plan.npz',
+                                               resume and os.path.exists(base_path + '.journal'))
+        if journal is None:
+            print('Session {} has already finished'.format(session['name']))
+            continue
+        print('Session {}: {} actions'.format(session['name'], len(session['plan'])))
+        if not run_plan(session['plan'], backend, journal, base_path + '.telemetry.json', prelude, start, references_path):
+            break
 
-    
-def start_editor(filepath, countdown, start_size_from_file=False, min_time=0.05, profile='cold_war'):
-    global MENU_DICT
-    MENU_DICT = importlib.import_module('profiles.{}.menu'.format(profile)).MENU_DICT
-    pyautogui.PAUSE = min_time
-    map_df = pandas.read_csv(filepath)
-    map_df.z = map_df.z.round().astype(int)
-
-    if 'done' not in map_df:
-        map_df['done'] = 0
-
-    start_i_page_x = 0
-    start_i_page_y = 0
-    if start_size_from_file:
-        prev_n_x = np.floor(map_df.x.max()).astype(int) + PAGE_RIGHT_MARGIN
-        prev_n_y = np.floor(map_df.y.max()).astype(int) + PAGE_BOTTOM_MARGIN
-    else:
-        prev_n_x = START_N_SQUARES_X
-        prev_n_y = START_N_SQUARES_Y
-
-    try:    
-        map_df = map_df[map_df['done'] == 0]
-        total_n_squares_x = int(map_df.x.max()) + 1
-        total_n_squares_y = int(map_df.y.max()) + 1
-
-        n_pages_x, n_x_remain = np.divmod(total_n_squares_x, PAGE_N_SQUARES_X - PAGE_RIGHT_MARGIN, dtype=int)
-        n_pages_y, n_y_remain = np.divmod(total_n_squares_y, PAGE_N_SQUARES_Y - PAGE_TOP_MARGIN - PAGE_BOTTOM_MARGIN, dtype=int)
-        n_x_remain = (np.floor(n_x_remain / 2) * 2).astype(int)
-        n_y_remain = (np.floor(n_y_remain / 2) * 2).astype(int)
-
-        map_df = map_df[(map_df.x >= 0) & (map_df.y >= 0) & (map_df.x < (n_pages_x * PAGE_N_SQUARES_X + n_x_remain)) & (map_df.y < (n_pages_y * PAGE_N_SQUARES_Y + n_y_remain))]
-                        
-        total_n_squares_x = n_pages_x * (PAGE_N_SQUARES_X - PAGE_RIGHT_MARGIN) + n_x_remain
-        total_n_squares_y = n_pages_y * (PAGE_N_SQUARES_Y - PAGE_TOP_MARGIN - PAGE_BOTTOM_MARGIN) + n_y_remain
-
-        height = START_HEIGHT
-
-        if not DEBUG_MODE:
-            pyautogui.countdown(countdown)
-
-        for i_page_y in range(n_pages_y + 1):
-            for i_page_x in range(n_pages_x + 1):
-                if i_page_x < n_pages_x:
-                    n_squares_x = (i_page_x + 1) * PAGE_N_SQUARES_X - i_page_x * PAGE_RIGHT_MARGIN
-                    xmax = total_n_squares_x - i_page_x * (PAGE_N_SQUARES_X - PAGE_RIGHT_MARGIN)
-                    xmin = xmax - (PAGE_N_SQUARES_X - PAGE_RIGHT_MARGIN)
-                    origin_x = total_n_squares_x - (i_page_x + 1) * (PAGE_N_SQUARES_X - PAGE_RIGHT_MARGIN)
-                else:
-                    n_squares_x = i_page_x * PAGE_N_SQUARES_X - (i_page_x - 1) * PAGE_RIGHT_MARGIN + n_x_remain #  ?
-                    xmax = n_x_remain
-                    xmin = 0
-                    origin_x = 0
-                if i_page_y < n_pages_y:
-                    n_squares_y = (i_page_y + 1) * PAGE_N_SQUARES_Y - i_page_y * (PAGE_TOP_MARGIN + PAGE_BOTTOM_MARGIN)
-                    ymax = (i_page_y + 1) * (PAGE_N_SQUARES_Y - PAGE_TOP_MARGIN - PAGE_BOTTOM_MARGIN)
-                    ymin = ymax - (PAGE_N_SQUARES_Y - PAGE_TOP_MARGIN - PAGE_BOTTOM_MARGIN)
-                    origin_y = i_page_y * (PAGE_N_SQUARES_Y - PAGE_TOP_MARGIN) - (i_page_y + 1) * PAGE_BOTTOM_MARGIN
-                else:
-                    n_squares_y = i_page_y * PAGE_N_SQUARES_Y - (i_page_y - 1) * (PAGE_TOP_MARGIN + PAGE_BOTTOM_MARGIN) + n_y_remain
-                    ymax = total_n_squares_y
-                    ymin = total_n_squares_y - n_y_remain
-                    origin_y = total_n_squares_y - (PAGE_N_SQUARES_Y - PAGE_TOP_MARGIN)
-
-                if xmax == xmin or ymax == ymin:
-                    continue
-
-                if (prev_n_x == START_N_SQUARES_X and prev_n_y == START_N_SQUARES_Y) or start_size_from_file:
-                    mode = 'init'
-                else:
-                    mode = 'window'
-                set_n_squares(prev_n_x, prev_n_y, n_squares_x, n_squares_y, mode)
-                if start_size_from_file:
-                    set_n_squares(n_squares_x, n_squares_y, n_squares_x - 2, n_squares_y - 2, 'window')
-                    start_size_from_file = False
-
-                prev_n_x = n_squares_x
-                prev_n_y = n_squares_y
-
-                sub_df = map_df[map_df.x.between(xmin, xmax, inclusive='left') & map_df.y.between(ymin, ymax, inclusive='left')].copy(deep=True)
-                sub_df.x = sub_df.x - origin_x
-                sub_df.y = sub_df.y - origin_y
-                height = process_segment(sub_df, height)
-                if 'menu' in map_df.columns:
-                    set_ground(sub_df, map_df)
-
-        set_n_squares(total_n_squares_x, total_n_squares_y, PAGE_N_SQUARES_X, PAGE_N_SQUARES_Y, 'finish')
-        set_n_squares(total_n_squares_x, total_n_squares_y, total_n_squares_x, total_n_squares_y - PAGE_TOP_MARGIN, 'window')
+    if pacer is not None:
+        print('Pacing: {}'.format(pacer.summary()))
+        pacer.close()
 
-    except pyautogui.FailSafeException:
-        pass
-        # map_df.to_csv(args.input + '.checkpoint')
-        # meta_df = pandas.DataFrame({'prev_n_x': [prev_n_x], 'prev_n_y': [prev_n_y], 'start_i_page_x': [i_page_x], 'start_i_page_y': [i_page_y]})
-        # meta_df.to_csv(args.input + '.meta.checkpoint')
+    pyautogui.alert(text='CMAutoEditor has finished processing the map stream.', title='CMAutoEditor')
 
-    pyautogui.alert(text='CMAutoEditor has finished processing the input data.', title='CMAutoEditor')
-        
 if __name__ == '__main__':
     sg.theme('Dark')
     sg.theme_button_color('#002366')
@@ -332,15 +334,76 @@ if __name__ == '__main__':
         display_gui()
     else:
         arg_parser = argparse.ArgumentParser()
-        arg_parser.add_argument('-i', '--input', required=True, help='File containing input data in csv-Format. Data is coded in x, y and z columns.')
+        arg_parser.add_argument('-i', '--input', required=True, help='File containing input data in csv-Format. Data is coded in x, y and z columns. Typed maps (.npz map bundle or .parquet, '
+                                'see editor_utils.map_format) are read as well, a compiled plan (.npz) is replayed directly.')
         arg_parser.add_argument('-c', '--countdown', required=False, type=int, help='Countdown until CMAutoEditor starts clicking in CM.', default=5)
         arg_parser.add_argument('--start-size-from-file', required=False, action='store_true', help='If true take starting map size from file. Useful when continueing map creation.', default=False)
         arg_parser.add_argument('-p', '--profile', required=False, default='cold_war', type=str)
         arg_parser.add_argument('-t', '--min-time', required=False, default=0.05, type=float)
+        arg_parser.add_argument('--brush-planner', required=False, default='layered', choices=BRUSH_PLANNERS, help='\'layered\' lets large brushes paint over squares of other ground types that are painted again afterwards, \'greedy\' only uses them on squares of one type.')
+        arg_parser.add_argument('--page-order', required=False, default='planned', choices=PAGE_ORDERS, help='\'planned\' skips pages without changes and visits the pages in the order with the fewest resize clicks, \'rows\' visits all pages row by row.')
+        arg_parser.add_argument('--height-order', required=False, default='sweep', choices=HEIGHT_ORDERS, help='\'sweep\' alternates ascending and descending elevations from page to page to save key presses, \'ascending\' always starts at the lowest.')
+        arg_parser.add_argument('--elevation-error', required=False, type=float, help='Only set the squares the editor needs to interpolate the elevation within this error [m], instead of every square.')
+        arg_parser.add_argument('--applied', required=False, type=str, help='Map csv-file that was applied to the map in the editor before. Only squares whose elevation or ground differs from it are clicked.')
+        arg_parser.add_argument('--journal', required=False, type=str, help='Progress journal of the run, by default the input file name with .journal appended.')
+        arg_parser.add_argument('--resume', required=False, action='store_true', default=False, help='Continue the run recorded in the journal where it stopped. The input and options have to be the same as for that run.')
+        arg_parser.add_argument('--adaptive-pacing', required=False, action='store_true', default=False, help='Adapt the delays after key presses, canvas, menu and resize clicks '
+                                'separately to how fast the editor reacts, checked on the screen. -t sets the start delay of clicks.')
+        arg_parser.add_argument('--elevation-probe', required=False, type=int, nargs=2, help='Screen position (x y) of a pixel that changes with the elevation, '
+                                'lets adaptive pacing check key presses as well.')
+        arg_parser.add_argument('--pacing-log', required=False, type=str, help='Append every change of the adaptive delays to this file (JSON lines).')
+        arg_parser.add_argument('--verify-pages', required=False, type=str, help='Reference patches (.npz, see editor_utils.page_check). After each page the '
+                                'squares are compared with them on a screenshot and the failed ones are clicked again.')
+        arg_parser.add_argument('--telemetry', required=False, type=str, help='Run summary (JSON) with counts and times per page and phase, by default the input file name with .telemetry.json appended.')
+        arg_parser.add_argument('--driver', required=False, default='pyautogui', choices=DRIVERS, help='Input driver: \'pyautogui\' (default), \'xdotool\' or \'xtest\' '
+                                'send clicks in batches (X11 only, not with --adaptive-pacing), \'null\' drops them, \'record\' only writes them to --record.')
+        arg_parser.add_argument('--batch-size', required=False, default=200, type=int, help='Maximum number of input events per batch for drivers that support batches.')
+        arg_parser.add_argument('--record', required=False, type=str, help='Record all input events to this file (JSON lines).')
+        arg_parser.add_argument('--plan-output', required=False, type=str, help='Only compile the input into an action plan and write it to this file (.npz for replaying, .txt for inspection).')
+        arg_parser.add_argument('--dry-run', required=False, action='store_true', default=False, help='Only compile the input and predict the run time per phase from the cost model, without clicking.')
+        arg_parser.add_argument('--compare', required=False, action='store_true', default=False, help='Like --dry-run, for every combination of brush planner, height order and page order.')
+        arg_parser.add_argument('--calibrate', required=False, type=str, nargs='+', help='Run summaries (--telemetry) of earlier runs to fit the cost model of --dry-run and --compare to, '
+                                'by default the run summary of the input if there is one. Without any the costs follow from -t.')
+        arg_parser.add_argument('--stream', required=False, action='store_true', default=False, help='The input is a map stream directory (see editor_utils.map_stream) '
+                                'into which the converters publish the map while they work on it. Its parts are clicked as soon as they are published.')
+        arg_parser.add_argument('--producers', required=False, type=str, nargs='+', default=DEFAULT_PRODUCERS, help='Converters publishing to the map stream, '
+                                'in the order their parts are clicked (default: {}). Producers of elevation have to come first.'.format(' '.join(DEFAULT_PRODUCERS)))
+        arg_parser.add_argument('--geometry', required=False, type=str, help='Canvas geometry of this screen (.json, see editor_utils.canvas): page size, square size and position. '
+                                'A larger canvas gives fewer pages. By default that of the profiles (pages of 26x26 squares).')
+        arg_parser.add_argument('--all-squares', required=False, action='store_true', default=False, help='Click every square of the map. By default the squares that already have '
+                                'the start elevation or the default ground of a new map are left out, unless the start size is taken from the file or --applied is given.')
         args = arg_parser.parse_args()
+
+        geometry = read_geometry(args.geometry)
+        if args.plan_output is not None:
+            plan = compile_input(args.input, args.profile, args.start_size_from_file, args.brush_planner, args.applied, args.page_order,
+                                 args.elevation_error, args.height_order, geometry, args.all_squares)
+            write_plan(plan, args.plan_output)
+            print('Wrote plan with {} actions on {} pages to {}: {}'.format(len(plan), plan.n_pages, args.plan_output, plan.counts()))
+            exit()
+
+        if args.dry_run or args.compare:
+            costs = get_costs(args.calibrate, args.telemetry if args.telemetry is not None else args.input + '.telemetry.json', args.min_time)
+            if args.compare:
+                map_df, _ = load_input(args.input, args.applied, None if args.start_size_from_file or args.all_squares else args.profile,
+                                       args.elevation_error is None)
+                comparison = compare_options(map_df, costs, args.profile, args.start_size_from_file or args.applied is not None, args.elevation_error,
+                                             geometry=geometry)
+                print(comparison.to_string(float_format='{:.1f}'.format))
+            elif args.input.endswith('.npz') and not is_map_bundle(args.input):
+                print(format_estimate(estimate_plan(read_plan(args.input), costs)))
+            else:
+                print(format_estimate(estimate_plan(compile_input(args.input, args.profile, args.start_size_from_file, args.brush_planner, args.applied,
+                                                                  args.page_order, args.elevation_error, args.height_order, geometry,
+                                                                  args.all_squares), costs)))
+            exit()
     
+        if args.resume:
+            setup_text = 'Leave the CM Scenario Editor as the stopped run left it, CMAutoEditor restores the map window, elevation and menu selection.'
+        else:
+            setup_text = 'If you haven\'t done so yet, open up the CM Scenario Editor, go to map->Elevation and click \'Direct\'. Make sure the size is 320m x 320m.'
         return_val = sg.popup_ok_cancel('CMAutoEditor is about to run on {}.'.format(args.input),
-        'If you haven\'t done so yet, open up the CM Scenario Editor, go to map->Elevation and click \'Direct\'. Make sure the size is 320m x 320m.',
+        setup_text,
         'Once you are ready to start click \'Ok\'. You will then have {}s to switch back to the CM Scenario Editor.'.format(args.countdown),
         'In case something goes wrong, move the mouse cursor to one of the screen corners. This will stop CMAutoEditor.', 
         title='CMAutoEditor')
@@ -348,4 +411,19 @@ if __name__ == '__main__':
         if return_val == 'Cancel' or return_val is None:
             exit()
         
-        start_editor(args.input, args.countdown, args.start_size_from_file, args.min_time, args.profile)
+        if args.stream:
+            stream_editor(args.input, args.countdown, producers=args.producers, start_size_from_file=args.start_size_from_file,
+                          min_time=args.min_time, profile=args.profile, brush_planner=args.brush_planner, resume=args.resume,
+                          page_order=args.page_order, adaptive_pacing=args.adaptive_pacing, elevation_probe=args.elevation_probe,
+                          pacing_log=args.pacing_log, references_path=args.verify_pages, driver_name=args.driver,
+                          batch_size=args.batch_size, record_path=args.record, height_order=args.height_order, geometry=geometry,
+                          all_squares=args.all_squares)
+            exit()
+
+        start_editor(args.input, args.countdown, start_size_from_file=args.start_size_from_file, min_time=args.min_time,
+                     profile=args.profile, brush_planner=args.brush_planner, resume=args.resume, journal_path=args.journal,
+                     applied_path=args.applied, page_order=args.page_order, elevation_error=args.elevation_error,
+                     adaptive_pacing=args.adaptive_pacing, elevation_probe=args.elevation_probe, pacing_log=args.pacing_log,
+                     references_path=args.verify_pages, telemetry_path=args.telemetry, driver_name=args.driver,
+                     batch_size=args.batch_size, record_path=args.record, height_order=args.height_order, geometry=geometry,
+                     all_squares=args.all_squares)
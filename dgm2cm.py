@@ -25,6 +25,8 @@ import skimage
 from pyproj.transformer import Transformer
 from shapely import MultiPoint, Point, Polygon
 
+from editor_utils.elevation_fit import select_control_points
+from editor_utils.map_stream import publish_map
 from osm_utils.grid import get_all_grids
 
 
@@ -120,6 +122,8 @@ def display_gui():
         ]], key='bbox_four_points', visible=False))],
         [sg.HorizontalSeparator()],
         #Contour and output filename fields
+        [sg.Text('Maximum elevation error in m (leave empty to keep all points): '), sg.InputText('', enable_events=True, key='max_error')],
+        [sg.HorizontalSeparator()],
         
         #Water level correction fields
         [sg.Checkbox('Apply water level correction', default=False, key='apply_water_level_correction', enable_events=True)],
@@ -180,6 +184,8 @@ def display_gui():
             validate_float('wlc_ymax')
         elif event == 'stride':
             validate_positive_integer('stride')
+        elif event == 'max_error':
+            validate_float('max_error')
         elif event == 'bbox_axis_parallel':
             window['bbox_two_points'].update(visible=True)
             window['bbox_four_points'].update(visible=False)
@@ -228,6 +234,8 @@ def display_gui():
         args_list.append(values['bbox_crs'])
         args_list.extend([str(bb) for bb in bounding_box])
         args_list.extend(['-o', values['output']])
+        if validate_value_exists('max_error'):
+            args_list.extend(['--max-error', values['max_error']])
         if values['apply_water_level_correction']:
             args_list.append('-w')
             args_list.append(values['wlc_crs'])
@@ -474,7 +482,12 @@ def convert_dgm(args):
             z_arr.append(height_map_reduced[xx, yy])
 
     height_map_reduced_df = pandas.DataFrame({'x': x_arr, 'y': y_arr, 'z': z_arr})
-    if args.stride is not None:
+    if args.max_error is not None:
+        # the corners are always selected (convex hull), so the map size stays the same
+        selected = select_control_points(height_map_reduced_df.x.values, height_map_reduced_df.y.values, height_map_reduced_df.z.values, args.max_error)
+        print('{} of {} squares are needed for a maximum elevation error of {} m.'.format(selected.sum(), len(selected), args.max_error))
+        df_out = height_map_reduced_df[selected]
+    elif args.stride is not None:
         df_out = height_map_reduced_df.iloc[::args.stride]
         df_out = pandas.concat((df_out, pandas.DataFrame(
             {
@@ -483,9 +496,12 @@ def convert_dgm(args):
                 'z': [-1]
             }
         )))
-        df_out.to_csv('{}.csv'.format(args.output_name))
     else:
-        height_map_reduced_df.to_csv('{}.csv'.format(args.output_name))
+        df_out = height_map_reduced_df
+    df_out.to_csv('{}.csv'.format(args.output_name))
+    if args.stream is not None:
+        # cmautoeditor can start on the elevation while the contour plots are drawn and osm2cm runs
+        publish_map(args.stream, 'dgm2cm', df_out, height_map_reduced.shape[0], height_map_reduced.shape[1], ['elevation'])
 
     hm = height_map_reduced.T
     zmin = np.floor(height_map_reduced_df.z.min()).astype(int)
@@ -540,6 +556,10 @@ if __name__ == '__main__':
     argparser.add_argument('--output-name', '-o', required=False, type=str, help='output name (without file extension) (default: output)', default='output')
     argparser.add_argument('--water-level-correction', '-w', required=False, type=float, nargs=5, help='correct elevation for the fact that in CM water does not flow downhill expects x,y coordinates of lowest and highest water level of one river.')
     argparser.add_argument('--stride', '-s', required=False, type=int, help='ouput will contain only every stride-th point')
+    argparser.add_argument('--max-error', '-e', required=False, type=float, help='output will contain only the points needed to reproduce the elevation '
+        'within this error (in m) when the editor interpolates between them. Replaces --stride for the height map.')
+    argparser.add_argument('--stream', required=False, type=str, help='also publish the height map row of editor pages by row of pages to this map stream directory, '
+        'from which cmautoeditor.py --stream clicks it (see editor_utils.map_stream)')
 
     if len(sys.argv) == 1:
         args_list = display_gui()
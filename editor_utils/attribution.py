@@ -0,0 +1,202 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+from typing import Dict, Optional
+
+import numpy as np
+import pandas
+
+from editor_utils.canvas import read_geometry
+from editor_utils.cost_model import HEIGHT_ORDERS, calibrate_costs, default_costs, read_summaries
+from editor_utils.map_diff import GROUND_COLUMNS, mark_initial
+from editor_utils.map_format import is_map_bundle
+from editor_utils.plan import *
+from editor_utils.planner import BRUSH_PLANNERS, KEY_SLEEP, PAGE_ORDERS, RESIZE_SLEEP, compile_plan, get_layer, get_menu_dict, load_map
+from editor_utils.telemetry import EVENTS, get_phase
+
+# owners of the actions that do not belong to a config entry
+ELEVATION = 'elevation'
+WINDOW = 'window'
+UNATTRIBUTED = 'unattributed'
+
+
+def group_key(menu, cat1, cat2, menu_dict) -> str:
+    """
+    Menu selection of a ground group as the editor shows it, a cat2 that is not in the menu is not selected.
+    """
+    return '|'.join([str(menu), str(cat1), str(cat2) if cat2 in menu_dict else ''])
+
+
+def painted_squares(map_df: pandas.DataFrame, menu_dict) -> pandas.DataFrame:
+    """
+    Row that sets each square and layer (layer, x, y, key, name) in map coordinates, the last one in group order like
+    set_ground paints them. Without a name column the menu stands in for it.
+    """
+    if 'menu' not in map_df.columns:
+        return pandas.DataFrame({'layer': [], 'x': [], 'y': [], 'key': [], 'name': []})
+
+    rows = map_df[(map_df.done == 0) & map_df.menu.isin(menu_dict.keys()) & map_df.cat1.isin(menu_dict.keys())]
+    rows = rows.sort_values(by=GROUND_COLUMNS, kind='stable')
+    names = rows['name'] if 'name' in rows.columns else rows.menu
+    squares = pandas.DataFrame({
+        'layer': rows.menu.astype(str).map(get_layer).values,
+        'x': rows.x.values.astype(int),
+        'y': rows.y.values.astype(int),
+        'key': [group_key(menu, cat1, cat2, menu_dict) for menu, cat1, cat2 in zip(rows.menu, rows.cat1, rows.cat2)],
+        'name': names.astype(str).values,
+    })
+    return squares.drop_duplicates(subset=['layer', 'x', 'y'], keep='last')
+
+
+def attribute_plan(plan: ActionPlan, map_df: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Share of every planned action per owner: the config entry (name column) of the rows a ground click paints, ELEVATION
+    for elevation clicks and key presses, WINDOW for resize clicks. A square click is split evenly among the rows of its
+    group under the brush (the square under the cursor if a large brush only paints over other groups there), the menu
+    and brush switches of a group among its owners like its square clicks.
+    Returns one row per action and owner: index (of the action), op, owner and weight, the weights of an action add up
+    to 1.
+    """
+    menu_dict = get_menu_dict(plan.profile)
+    pages = plan.meta['pages']
+    checkpoints = plan.meta.get('checkpoints', [])
+
+    owned = []
+    clicks = []
+    switches = []
+    group_clicks = []
+    group_switches = []
+    origin = (0, 0)
+    brush = 1
+    ground = False
+    phase = WINDOW
+    for index, (op, a, b, c) in enumerate(plan.ops.tolist()):
+        if op == OP_PAGE:
+            origin = pages[c][2:4]
+            ground = False
+        elif op in (OP_MENU, OP_BRUSH):
+            ground = True
+        phase = get_phase(op, ground, phase)
+        if op == OP_BRUSH:
+            brush = a
+
+        if op == OP_RESIZE:
+            owned.append((index, op, WINDOW))
+        elif op == OP_KEY or (op == OP_SQUARE and phase == ELEVATION):
+            owned.append((index, op, ELEVATION))
+        elif op == OP_SQUARE:
+            group_clicks.append((index, origin[0] + a, origin[1] + b, brush // 2))
+        elif op in (OP_MENU, OP_BRUSH):
+            group_switches.append((index, op))
+        elif op == OP_CHECKPOINT:
+            menu, cat1, cat2 = (checkpoints[a] + [None] * 3)[:3]
+            clicks.extend(click + (get_layer(menu), group_key(menu, cat1, cat2, menu_dict), a) for click in group_clicks)
+            switches.extend(switch + (a,) for switch in group_switches)
+            group_clicks = []
+            group_switches = []
+    switches.extend(switch + (-1,) for switch in group_switches)
+
+    shares = [pandas.DataFrame(owned, columns=['index', 'op', 'owner']).assign(weight=1.0)]
+    clicks = pandas.DataFrame(clicks, columns=['index', 'x', 'y', 'half', 'layer', 'key', 'group'])
+    if len(clicks) > 0:
+        squares = painted_squares(map_df, menu_dict)
+        # footprint of every click, the square under the cursor first
+        footprints = []
+        for half in np.unique(clicks.half):
+            d = np.arange(-half, half + 1)
+            dx, dy = [v.ravel() for v in np.meshgrid(d, d, indexing='ij')]
+            order = np.argsort(np.abs(dx) + np.abs(dy), kind='stable')
+            sub = clicks[clicks.half == half]
+            footprints.append(pandas.DataFrame({
+                'index': np.repeat(sub['index'].values, len(d) ** 2),
+                'layer': np.repeat(sub.layer.values, len(d) ** 2),
+                'click_key': np.repeat(sub.key.values, len(d) ** 2),
+                'x': (sub.x.values[:, None] + dx[order][None, :]).ravel(),
+                'y': (sub.y.values[:, None] + dy[order][None, :]).ravel(),
+                'centre': np.tile(np.arange(len(d) ** 2) == 0, len(sub)),
+            }))
+        footprint = pandas.concat(footprints, ignore_index=True).merge(squares, on=['layer', 'x', 'y'], how='left')
+        matched = footprint[footprint.key == footprint.click_key]
+        centre = footprint[footprint.centre & ~footprint['index'].isin(matched['index'])]
+        rows = pandas.concat((matched, centre))[['index', 'name']].rename(columns={'name': 'owner'})
+        rows['owner'] = rows.owner.fillna(UNATTRIBUTED)
+        rows['weight'] = 1.0 / rows.groupby('index')['index'].transform('size')
+        rows = rows.groupby(['index', 'owner'], as_index=False, sort=False).weight.sum()
+        shares.append(rows.assign(op=OP_SQUARE))
+
+        # switches follow the owners of the clicks of their group
+        group_owners = rows.merge(clicks[['index', 'group']], on='index').groupby(['group', 'owner'], as_index=False).weight.sum()
+        group_owners['weight'] /= group_owners.groupby('group').weight.transform('sum')
+    else:
+        group_owners = pandas.DataFrame({'group': np.zeros(0, dtype=int), 'owner': np.zeros(0, dtype=object), 'weight': np.zeros(0)})
+
+    switches = pandas.DataFrame(np.array(switches, dtype=int).reshape(-1, 3), columns=['index', 'op', 'group'])
+    switches = switches.merge(group_owners, on='group', how='left')
+    switches['owner'] = switches.owner.fillna(UNATTRIBUTED)
+    switches['weight'] = switches.weight.fillna(1.0)
+    shares.append(switches.drop(columns='group'))
+
+    return pandas.concat(shares, ignore_index=True)[['index', 'op', 'owner', 'weight']]
+
+
+def attribution_report(shares: pandas.DataFrame, costs: Optional[Dict[str, float]] = None) -> pandas.DataFrame:
+    """
+    Planned clicks, key presses, resize clicks, menu and brush switches per owner, their predicted time in minutes from
+    the cost model and the share of the whole run, most expensive first.
+    """
+    costs = costs if costs is not None else default_costs()
+    report = shares.pivot_table(index='owner', columns='op', values='weight', aggfunc='sum', fill_value=0.0)
+    report = report.reindex(columns=list(EVENTS), fill_value=0.0).rename(columns=EVENTS)
+    report['minutes'] = sum(report[event] * cost for event, cost in costs.items()) / 60
+    report['share'] = report.minutes / max(report.minutes.sum(), 1e-9)
+
+    return report.sort_values('minutes', ascending=False)
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Attribute the planned clicks, key presses and menu and brush switches to the config entries (name column) of the map, elevation and map window changes.')
+    arg_parser.add_argument('-i', '--input', required=True, help='map csv-file (or typed map file, or compiled .npz plan together with --map)')
+    arg_parser.add_argument('-m', '--map', required=False, help='map the plan was compiled from')
+    arg_parser.add_argument('-p', '--profile', required=False, default='cold_war', type=str)
+    arg_parser.add_argument('-o', '--output', required=False, help='write the report to this csv-file')
+    arg_parser.add_argument('-t', '--min-time', required=False, default=0.05, type=float)
+    arg_parser.add_argument('--calibrate', required=False, nargs='+', help='run summaries (--telemetry) of earlier runs to fit the cost model to')
+    arg_parser.add_argument('--start-size-from-file', required=False, action='store_true', default=False)
+    arg_parser.add_argument('--brush-planner', required=False, default='layered', choices=BRUSH_PLANNERS)
+    arg_parser.add_argument('--height-order', required=False, default='sweep', choices=HEIGHT_ORDERS)
+    arg_parser.add_argument('--page-order', required=False, default='planned', choices=PAGE_ORDERS)
+    arg_parser.add_argument('--elevation-error', required=False, type=float)
+    arg_parser.add_argument('--geometry', required=False, help='canvas geometry (.json, see editor_utils.canvas) to plan the pages for')
+    arg_parser.add_argument('--all-squares', required=False, action='store_true', default=False, help='also plan the squares that already have the start elevation or the default ground of a new map')
+    args = arg_parser.parse_args()
+
+    costs = default_costs(args.min_time, KEY_SLEEP, RESIZE_SLEEP)
+    if args.calibrate is not None:
+        costs, _ = calibrate_costs(read_summaries(args.calibrate), costs)
+
+    map_df = load_map(args.map if args.map is not None else args.input)
+    if args.input.endswith('.npz') and not is_map_bundle(args.input):
+        plan = read_plan(args.input)
+    else:
+        if not (args.start_size_from_file or args.all_squares):
+            map_df, _ = mark_initial(map_df, args.profile, args.elevation_error is None)
+        plan = compile_plan(map_df, args.profile, args.start_size_from_file, height_order=args.height_order, brush_planner=args.brush_planner,
+                            page_order=args.page_order, elevation_error=args.elevation_error, geometry=read_geometry(args.geometry))
+
+    report = attribution_report(attribute_plan(plan, map_df), costs)
+    print(report.to_string(float_format='{:.1f}'.format, formatters={'share': '{:.1%}'.format}))
+    if args.output is not None:
+        report.to_csv(args.output)
@@ -0,0 +1,145 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+BRUSH_STEPS = (15, 7, 3)
+
+
+def summed_area_table(mask: np.ndarray) -> np.ndarray:
+    """
+    Integral image with a leading row and column of zeros, so that the sum over mask[x0:x1, y0:y1] is
+    sat[x1, y1] - sat[x0, y1] - sat[x1, y0] + sat[x0, y0].
+    """
+    sat = np.zeros((mask.shape[0] + 1, mask.shape[1] + 1), dtype=np.int32)
+    sat[1:, 1:] = mask.astype(np.int32).cumsum(axis=0).cumsum(axis=1)
+    return sat
+
+
+def window_sums(mask: np.ndarray, step: int) -> np.ndarray:
+    """
+    Number of set cells in every step x step window of mask, indexed by the window's lower corner.
+    """
+    if mask.shape[0] < step or mask.shape[1] < step:
+        return np.zeros((0, 0), dtype=np.int32)
+    sat = summed_area_table(mask)
+    return sat[step:, step:] - sat[:-step, step:] - sat[step:, :-step] + sat[:-step, :-step]
+
+
+def full_windows(mask: np.ndarray, step: int) -> np.ndarray:
+    """
+    Boolean array over all step x step windows of mask, indexed by the window's lower corner, that is True where every
+    cell of the window is set.
+    """
+    return window_sums(mask, step) == step * step
+
+
+def brush_cover(mask: np.ndarray, steps: Tuple[int] = BRUSH_STEPS) -> Dict[int, np.ndarray]:
+    """
+    Cover the set cells of mask with square brushes. The largest brush is placed first wherever its whole window lies
+    within the not yet covered cells, then the next smaller one, single cells are left for brush size 1.
+    Windows are placed in the same scan order as the original cell by cell search, so the result (and the number of
+    clicks) is identical, but fully covered windows are found from a summed-area table instead of testing every window.
+
+    Returns for every brush size the (n, 2) array of window centres.
+    """
+    remaining = mask.astype(bool).copy()
+    centres = {}
+    for step in steps:
+        full = full_windows(remaining, step)
+        candidates = np.argwhere(full)
+        chosen = []
+        if len(candidates) > 0:
+            # two windows of the same size overlap if their corners are less than step apart in both directions
+            blocked = np.zeros(full.shape, dtype=bool)
+            for x, y in candidates.tolist():
+                if blocked[x, y]:
+                    continue
+                chosen.append((x, y))
+                blocked[max(x - step + 1, 0):x + step, max(y - step + 1, 0):y + step] = True
+
+        chosen = np.array(chosen, dtype=int).reshape(-1, 2)
+        for x, y in chosen.tolist():
+            remaining[x:x + step, y:y + step] = False
+        centres[step] = chosen + int(step / 2)
+
+    centres[1] = np.argwhere(remaining)
+
+    return centres
+
+
+def count_clicks(centres: Dict[int, np.ndarray]) -> int:
+    """
+    Square clicks plus one brush selection for every brush size in use.
+    """
+    return sum(len(c) + 1 for c in centres.values() if len(c) > 0)
+
+
+def overpaint_cover(target: np.ndarray, paintable: np.ndarray, steps: Tuple[int] = BRUSH_STEPS) -> Dict[int, np.ndarray]:
+    """
+    Cover the cells of target with brushes whose windows may extend over any paintable cell, i.e. cells that are painted
+    again later. Greedy set cover: the window (of any size) with the most uncovered target cells is placed until no
+    window saves a click compared to single clicks.
+    """
+    uncovered = target.astype(bool).copy()
+    valid = {step: full_windows(paintable, step) for step in steps}
+    chosen = {step: [] for step in steps}
+
+    while True:
+        best = None
+        for step in steps:
+            if valid[step].size == 0:
+                continue
+            gain = np.where(valid[step], window_sums(uncovered, step), 0)
+            idx = int(np.argmax(gain))
+            # selecting a brush size that is not in use yet costs one click more
+            net_gain = gain.flat[idx] - (1 if len(chosen[step]) > 0 else 2)
+            if best is None or net_gain > best[0]:
+                best = (net_gain, step, np.unravel_index(idx, gain.shape))
+        if best is None or best[0] < 1:
+            break
+        _, step, (x, y) = best
+        chosen[step].append((x + int(step / 2), y + int(step / 2)))
+        uncovered[x:x + step, y:y + step] = False
+
+    centres = {step: np.array(chosen[step], dtype=int).reshape(-1, 2) for step in steps}
+    centres[1] = np.argwhere(uncovered)
+
+    return centres
+
+
+def layered_brush_cover(labels: np.ndarray) -> List[Tuple[int, Dict[int, np.ndarray]]]:
+    """
+    Plan the brush clicks for a grid of labels (-1: do not paint) under the rule that a later click overwrites an
+    earlier one. Labels are painted from the most to the least frequent, each one with windows that may extend over the
+    cells of all labels painted after it. The result is compared with painting every label on its own cells only and the
+    cheaper plan is returned as a list of (label, centres) in painting order.
+    """
+    label_values, label_counts = np.unique(labels[labels >= 0], return_counts=True)
+
+    separate = [(label, brush_cover(labels == label)) for label in label_values]
+
+    layered = []
+    paintable = labels >= 0
+    for label in label_values[np.argsort(-label_counts, kind='stable')]:
+        target = labels == label
+        layered.append((label, overpaint_cover(target, paintable)))
+        paintable = paintable & ~target
+
+    if sum(count_clicks(c) for _, c in layered) < sum(count_clicks(c) for _, c in separate):
+        return layered
+    return separate
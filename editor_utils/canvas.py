@@ -0,0 +1,162 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import json
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import skimage.io
+
+from profiles.general.constants import *
+
+# Geometry of the editor canvas: screen position of the centres of the upper left and lower right visible squares, the
+# square pitch in pixels and the number of squares a page shows. Pages are clicked in page coordinates from the lower
+# left square on. The defaults are those of the screen layout the profiles were made for, on a larger screen the canvas
+# shows more squares, which gives fewer pages. The map size changes in steps of two squares, so pages have an even size.
+CANVAS_GEOMETRY = {
+    'upper_left': [UPPER_LEFT_SQUARE.x, UPPER_LEFT_SQUARE.y],
+    'lower_right': [LOWER_RIGHT_SQUARE.x, LOWER_RIGHT_SQUARE.y],
+    'square_size': [SQUARE_SIZE_X, SQUARE_SIZE_Y],
+    'page_n_squares': [PAGE_N_SQUARES_X, PAGE_N_SQUARES_Y],
+}
+
+# smallest page that still has squares besides its margins
+MIN_PAGE_N_SQUARES = max(PAGE_RIGHT_MARGIN, PAGE_TOP_MARGIN + PAGE_BOTTOM_MARGIN) + 2
+
+
+def get_geometry(geometry: Optional[Dict] = None) -> Dict:
+    return dict(geometry) if geometry is not None else dict(CANVAS_GEOMETRY)
+
+
+def canvas_geometry(upper_left, lower_right, square_size=(SQUARE_SIZE_X, SQUARE_SIZE_Y)) -> Dict:
+    """
+    Geometry of a canvas from the screen positions of the centres of its upper left and lower right visible squares. An
+    odd number of visible squares is cut to an even one at the top and right, the lower left square is where page
+    coordinates start.
+    """
+    page_n_squares = []
+    for axis in range(2):
+        n_squares = int(round((lower_right[axis] - upper_left[axis]) / square_size[axis])) + 1
+        n_squares -= n_squares % 2
+        if n_squares < MIN_PAGE_N_SQUARES:
+            raise ValueError('The canvas shows {} squares along {}, at least {} are needed.'.format(n_squares, 'xy'[axis], MIN_PAGE_N_SQUARES))
+        page_n_squares.append(n_squares)
+
+    left = int(round(upper_left[0]))
+    bottom = int(round(lower_right[1]))
+    return {
+        'upper_left': [left, int(round(bottom - (page_n_squares[1] - 1) * square_size[1]))],
+        'lower_right': [int(round(left + (page_n_squares[0] - 1) * square_size[0])), bottom],
+        'square_size': [square_size[0], square_size[1]],
+        'page_n_squares': page_n_squares,
+    }
+
+
+def find_grid_lines(profile: np.ndarray, min_pitch: int = 8, max_pitch: int = 64) -> Tuple[int, float, float]:
+    """
+    Pitch, first and last line of the longest run of evenly spaced peaks in an edge profile (mean absolute brightness
+    change between neighbouring pixel columns or rows). The pitch is the shortest lag whose autocorrelation comes close to
+    the highest one, so that multiples of it are not taken for it. Lines are returned in pixel coordinates, the centroid
+    of the changes into and out of them.
+    """
+    signal = profile - np.median(profile)
+    lags = np.arange(min_pitch, min(max_pitch, len(signal) // 3) + 1)
+    correlation = np.array([np.dot(signal[:-lag], signal[lag:]) / (len(signal) - lag) for lag in lags])
+    if len(lags) == 0 or correlation.max() <= 0:
+        raise ValueError('No grid lines found.')
+    pitch = int(lags[np.nonzero(correlation >= 0.8 * correlation.max())[0][0]])
+
+    # phase with the strongest lines, then the lines that stand out of the profile
+    phase = int(np.argmax([signal[offset::pitch].sum() for offset in range(pitch)]))
+    lines = np.arange(phase, len(signal), pitch)
+    # a line shows as change into it and out of it, at the border of the canvas only one of them may be strong
+    strength = np.max([signal[np.clip(lines + d, 0, len(signal) - 1)] for d in (-1, 0, 1)], axis=0)
+    strong = strength > 0.5 * np.median(strength[strength > 0]) if (strength > 0).any() else strength > 0
+
+    best = (0, 0)
+    run_start = None
+    for i, is_strong in enumerate(np.append(strong, False)):
+        if is_strong and run_start is None:
+            run_start = i
+        elif not is_strong and run_start is not None:
+            if i - run_start > best[1] - best[0]:
+                best = (run_start, i)
+            run_start = None
+    if best[1] - best[0] < 2:
+        raise ValueError('No grid lines found.')
+
+    def centre(line):
+        around = np.arange(max(line - 1, 0), min(line + 2, len(signal)))
+        weights = np.clip(signal[around], 0, None)
+        # a change between pixel i and i + 1 lies at i + 0.5
+        return float(np.average(around, weights=weights) if weights.sum() > 0 else line) + 0.5
+
+    return pitch, centre(int(lines[best[0]])), centre(int(lines[best[1] - 1]))
+
+
+def calibrate_from_screenshot(image: np.ndarray, min_pitch: int = 8, max_pitch: int = 64) -> Dict:
+    """
+    Geometry of the canvas on a screenshot (height, width, rgb) of the whole screen, found from the grid lines between
+    the squares: their spacing gives the pitch and the first and last line the visible squares. Works best on a plain
+    map (a new one, or with the same ground everywhere) in the elevation mode.
+    """
+    grey = image[:, :, :3].astype(float).mean(axis=2)
+    x_pitch, x_first, x_last = find_grid_lines(np.abs(np.diff(grey, axis=1)).mean(axis=0), min_pitch, max_pitch)
+    y_pitch, y_first, y_last = find_grid_lines(np.abs(np.diff(grey, axis=0)).mean(axis=1), min_pitch, max_pitch)
+    upper_left = (x_first + x_pitch / 2, y_first + y_pitch / 2)
+    lower_right = (x_last - x_pitch / 2, y_last - y_pitch / 2)
+    return canvas_geometry(upper_left, lower_right, (x_pitch, y_pitch))
+
+
+def read_geometry(path: Optional[str]) -> Optional[Dict]:
+    if path is None:
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_geometry(geometry: Dict, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(geometry, f, indent=1)
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Calibrate the canvas geometry (page size, square pitch and position) of the CM Scenario Editor on this screen, '
+                                         'for cmautoeditor.py --geometry.')
+    arg_parser.add_argument('-o', '--output', required=True, help='geometry file (.json)')
+    arg_parser.add_argument('-s', '--screenshot', required=False, help='screenshot of the whole screen with the editor showing a plain map')
+    arg_parser.add_argument('--capture', required=False, action='store_true', default=False, help='take the screenshot after a countdown of -c seconds')
+    arg_parser.add_argument('-c', '--countdown', required=False, default=5, type=int)
+    arg_parser.add_argument('--corners', required=False, type=float, nargs=4, help='screen position (x y) of the centres of the upper left and the lower right visible square, '
+                            'instead of a screenshot')
+    arg_parser.add_argument('--square-size', required=False, type=float, nargs=2, default=[SQUARE_SIZE_X, SQUARE_SIZE_Y], help='square pitch (x y) in pixels for --corners')
+    args = arg_parser.parse_args()
+
+    if args.corners is not None:
+        geometry = canvas_geometry(args.corners[:2], args.corners[2:], args.square_size)
+    elif args.screenshot is not None:
+        geometry = calibrate_from_screenshot(skimage.io.imread(args.screenshot))
+    elif args.capture:
+        import pyautogui
+        pyautogui.countdown(args.countdown)
+        geometry = calibrate_from_screenshot(np.array(pyautogui.screenshot()))
+    else:
+        raise ValueError('Give --corners, --screenshot or --capture.')
+
+    write_geometry(geometry, args.output)
+    default_page = CANVAS_GEOMETRY['page_n_squares']
+    print('Pages of {}x{} squares ({}x{} by default), {} px per square, upper left square at {}, lower right at {}. Written to {}'.format(
+        *geometry['page_n_squares'], *default_page, geometry['square_size'], geometry['upper_left'], geometry['lower_right'], args.output))
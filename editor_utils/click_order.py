@@ -0,0 +1,102 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+CLICK_ORDERS = ['index', 'serpentine', 'tour']
+
+# cursor position (in squares of the current page) assumed before the first click of a group: the brush buttons above
+# the map
+TOOLBAR_POSITION = (13, 27)
+
+MAX_TWO_OPT_PASSES = 4
+
+
+def serpentine_order(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Row by row from the top of the page, alternating the direction in x.
+    """
+    row_rank = y.max() - y
+    x_key = np.where(row_rank % 2 == 0, x, -x)
+    return np.lexsort((x_key, row_rank))
+
+
+def nearest_neighbour_order(x: np.ndarray, y: np.ndarray, start: Tuple[int, int]) -> np.ndarray:
+    n = len(x)
+    visited = np.zeros(n, dtype=bool)
+    order = np.empty(n, dtype=int)
+    cx, cy = start
+    xf = x.astype(float)
+    yf = y.astype(float)
+    for i in range(n):
+        dist = np.square(xf - cx) + np.square(yf - cy)
+        dist[visited] = np.inf
+        idx = int(np.argmin(dist))
+        order[i] = idx
+        visited[idx] = True
+        cx, cy = xf[idx], yf[idx]
+
+    return order
+
+
+def two_opt(x: np.ndarray, y: np.ndarray, order: np.ndarray, start: Tuple[int, int]) -> np.ndarray:
+    """
+    Improve an open path by reversing segments (2-opt). The path starts at start, which stays fixed.
+    """
+    route = np.concatenate(([-1], order))
+    px = np.concatenate(([start[0]], x)).astype(float)
+    py = np.concatenate(([start[1]], y)).astype(float)
+    n = len(route)
+
+    for _ in range(MAX_TWO_OPT_PASSES):
+        improved = False
+        for i in range(n - 2):
+            a = route[i] + 1
+            b = route[i + 1] + 1
+            c = route[i + 2:] + 1
+            d = np.concatenate((route[i + 3:] + 1, [-1]))
+            d_ab = np.hypot(px[a] - px[b], py[a] - py[b])
+            d_ac = np.hypot(px[a] - px[c], py[a] - py[c])
+            d_cd = np.where(d >= 0, np.hypot(px[c] - px[d], py[c] - py[d]), 0.0)
+            d_bd = np.where(d >= 0, np.hypot(px[b] - px[d], py[b] - py[d]), 0.0)
+            delta = d_ac + d_bd - d_ab - d_cd
+            j = int(np.argmin(delta))
+            if delta[j] < -1e-9:
+                route[i + 1:i + 3 + j] = route[i + 1:i + 3 + j][::-1]
+                improved = True
+        if not improved:
+            break
+
+    return route[1:]
+
+
+def order_clicks(x: np.ndarray, y: np.ndarray, method: str = 'tour', start: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """
+    Return the order in which to click the squares (x, y) of one group so that the cursor travels a short distance.
+    'index' keeps the given order, 'serpentine' sweeps the rows, 'tour' builds a nearest neighbour tour from start and
+    improves it with 2-opt.
+    """
+    if len(x) < 3 or method == 'index':
+        return np.arange(len(x))
+    if start is None:
+        start = TOOLBAR_POSITION
+    if method == 'serpentine':
+        return serpentine_order(x, y)
+    elif method == 'tour':
+        return two_opt(x, y, nearest_neighbour_order(x, y, start), start)
+
+    raise ValueError('Unknown click order {}, expected one of {}.'.format(method, CLICK_ORDERS))
@@ -0,0 +1,161 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import itertools
+import json
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas
+from scipy.optimize import nnls
+
+from editor_utils.plan import *
+from editor_utils.planner import BRUSH_PLANNERS, PAGE_ORDERS, compile_plan
+from editor_utils.telemetry import EVENTS, RunTelemetry
+
+# Seconds per counted event of editor_utils.telemetry. The settle sleeps the plan has after key presses and resize
+# clicks are part of their cost, like the time a batching driver spends at the next flush.
+COST_EVENTS = list(EVENTS.values())
+
+HEIGHT_ORDERS = ['sweep', 'ascending']
+
+
+def default_costs(min_time: float = 0.05, key_time: float = 0.1, resize_time: float = 0.05) -> Dict[str, float]:
+    """
+    Costs of an unpaced pyautogui run: the pause after every click plus the settle time after key presses and resize
+    clicks.
+    """
+    return {
+        'clicks': min_time,
+        'keys': key_time,
+        'resizes': min_time + resize_time,
+        'menu_switches': min_time,
+        'brush_switches': min_time,
+    }
+
+
+def read_summaries(paths: Iterable[str]) -> List[Dict]:
+    summaries = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            summaries.append(json.load(f))
+    return summaries
+
+
+def page_samples(summaries: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Event counts (one column per COST_EVENTS) and measured time of every page of the given run summaries.
+    """
+    counts = []
+    times = []
+    for summary in summaries:
+        for page in summary['pages']:
+            counts.append([sum(phase[event] for phase in page['phases'].values()) for event in COST_EVENTS])
+            times.append(sum(phase['time'] for phase in page['phases'].values()))
+
+    return np.array(counts, dtype=float).reshape(-1, len(COST_EVENTS)), np.array(times, dtype=float)
+
+
+def calibrate_costs(summaries: List[Dict], costs: Optional[Dict[str, float]] = None) -> Tuple[Dict[str, float], Dict]:
+    """
+    Fit the cost per event to the pages of earlier runs (telemetry summaries) with non-negative least squares. Pages
+    are used rather than single actions because batching drivers spend the time of a whole batch at its flush. Events
+    that never occurred keep their cost from costs (default_costs()). With fewer pages than occurring events all costs
+    are scaled by the ratio of measured to predicted time instead.
+    Returns the costs and the fit: number of pages, measured and predicted time and mean absolute error per page.
+    """
+    costs = dict(costs if costs is not None else default_costs())
+    counts, times = page_samples(summaries)
+    fitted = (counts > 0).any(axis=0)
+    prior = np.array([costs[event] for event in COST_EVENTS])
+
+    if len(times) >= fitted.sum() > 0:
+        rest = times - counts[:, ~fitted] @ prior[~fitted]
+        values, _ = nnls(counts[:, fitted], rest)
+        for event, value in zip(np.array(COST_EVENTS)[fitted], values):
+            costs[event] = float(value)
+    elif (counts @ prior).sum() > 0:
+        scale = times.sum() / (counts @ prior).sum()
+        costs = {event: cost * scale for event, cost in costs.items()}
+
+    predicted = counts @ np.array([costs[event] for event in COST_EVENTS])
+    fit = {
+        'pages': len(times),
+        'measured': float(times.sum()),
+        'predicted': float(predicted.sum()),
+        'page_error': float(np.abs(predicted - times).mean()) if len(times) > 0 else 0.0,
+    }
+    return costs, fit
+
+
+def plan_cost(plan: ActionPlan, costs: Dict[str, float], start: int = 0, end: Optional[int] = None) -> Dict[str, float]:
+    """
+    Predicted seconds per event for the actions in [start, end), and their sum as 'total'.
+    """
+    ops = plan.ops[start:end, 0]
+    cost = {event: int((ops == op).sum()) * costs[event] for op, event in EVENTS.items()}
+    cost['total'] = sum(cost.values())
+    return cost
+
+
+def estimate_plan(plan: ActionPlan, costs: Dict[str, float], start: int = 0) -> RunTelemetry:
+    """
+    Dry run: the telemetry of a replay whose actions take exactly their predicted cost, without sending anything. Its
+    summary has the same form as that of a real run, per page and phase.
+    """
+    clock = [0.0]
+    telemetry = RunTelemetry(plan, start, clock=lambda: clock[0], report_interval=np.inf)
+    op_costs = np.zeros(len(OP_NAMES))
+    for op, event in EVENTS.items():
+        op_costs[op] = costs[event]
+    for index, (op, a, b, c) in enumerate(plan.ops[start:].tolist(), start):
+        clock[0] += op_costs[op]
+        telemetry(index, op, a, b, c)
+
+    return telemetry
+
+
+def format_estimate(telemetry: RunTelemetry) -> str:
+    total = max(telemetry.clock() - telemetry.start_time, 1e-9)
+    phases = ', '.join('{} {:.0f} min ({:.0%})'.format(phase, counts['time'] / 60, counts['time'] / total)
+                       for phase, counts in sorted(telemetry.phases.items(), key=lambda item: -item[1]['time']))
+    return 'Predicted run time: {:.0f} min for {} actions on {} pages. Per phase: {}'.format(
+        total / 60, len(telemetry.plan) - telemetry.start, telemetry.plan.n_pages, phases)
+
+
+def compare_options(map_df: pandas.DataFrame, costs: Dict[str, float], profile='cold_war', start_size_from_file=False,
+                    elevation_error=None, brush_planners=BRUSH_PLANNERS, height_orders=HEIGHT_ORDERS,
+                    page_orders=PAGE_ORDERS, geometry=None) -> pandas.DataFrame:
+    """
+    Compile the map with every combination of the given planner options and predict their run times. One row per
+    combination, fastest first, with the event counts, predicted minutes per event and in total and the planning time.
+    """
+    rows = []
+    for brush_planner, height_order, page_order in itertools.product(brush_planners, height_orders, page_orders):
+        t_start = time.perf_counter()
+        plan = compile_plan(map_df, profile, start_size_from_file, height_order=height_order, brush_planner=brush_planner,
+                            page_order=page_order, elevation_error=elevation_error, geometry=geometry)
+        planning = time.perf_counter() - t_start
+        counts = plan.counts()
+        cost = plan_cost(plan, costs)
+        row = {'brush_planner': brush_planner, 'height_order': height_order, 'page_order': page_order, 'pages': plan.n_pages}
+        row.update({OP_NAMES[op]: counts[OP_NAMES[op]] for op in EVENTS})
+        row['minutes'] = cost['total'] / 60
+        row.update({event + '_min': cost[event] / 60 for event in COST_EVENTS})
+        row['planning_s'] = planning
+        rows.append(row)
+
+    return pandas.DataFrame(rows).sort_values('minutes', kind='stable').reset_index(drop=True)
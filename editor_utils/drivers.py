@@ -0,0 +1,244 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import json
+import subprocess
+import time
+from typing import List, Optional, Tuple
+
+from editor_utils.plan import OP_RESIZE
+
+# Input events: ('click', x, y), ('key', name) with name '+' or '-', ('sleep', seconds). A driver injects a list of
+# events per send call, drivers with batch_size 1 get them one by one. DriverBackend sends every sleep in a call of its
+# own, so that the fail safe is checked after it. The libraries a driver needs are only imported when it is created.
+
+DRIVERS = ['pyautogui', 'xdotool', 'xtest', 'null', 'record']
+
+XDOTOOL_KEYS = {'+': 'plus', '-': 'minus'}
+
+
+class PyAutoGuiDriver:
+    """
+    pyautogui clicks (followed by pyautogui.PAUSE) and keyboard key presses, one event per call.
+    """
+    batch_size = 1
+
+    def __init__(self):
+        import keyboard
+        import pyautogui
+        self.keyboard = keyboard
+        self.pyautogui = pyautogui
+
+    def send(self, events: List[Tuple]):
+        for event in events:
+            if event[0] == 'click':
+                self.pyautogui.click(event[1], event[2])
+            elif event[0] == 'key':
+                self.keyboard.send(event[1])
+            elif event[0] == 'sleep':
+                time.sleep(event[1])
+
+
+class XdotoolDriver:
+    """
+    One xdotool process per batch, the clicks and key presses of a batch are chained into its command line (X11 only).
+    """
+    def __init__(self, batch_size: int = 200, executable: str = 'xdotool'):
+        self.batch_size = batch_size
+        self.executable = executable
+
+    def command(self, events: List[Tuple]) -> List[str]:
+        args = [self.executable]
+        for event in events:
+            if event[0] == 'click':
+                args.extend(['mousemove', str(event[1]), str(event[2]), 'click', '1'])
+            elif event[0] == 'key':
+                args.extend(['key', XDOTOOL_KEYS.get(event[1], event[1])])
+        return args
+
+    def send(self, events: List[Tuple]):
+        chained = []
+        for event in events + [('sleep', 0)]:
+            if event[0] != 'sleep':
+                chained.append(event)
+                continue
+            if len(chained) > 0:
+                subprocess.run(self.command(chained), check=True)
+                chained = []
+            if event[1] > 0:
+                time.sleep(event[1])
+
+
+class XTestDriver:
+    """
+    Fake input through the XTest extension (python-xlib), the events of a batch are sent with one flush of the display
+    connection (X11 only).
+    """
+    def __init__(self, batch_size: int = 200, display: Optional[str] = None):
+        from Xlib import X, XK
+        from Xlib.display import Display
+        from Xlib.ext import xtest
+        self.X = X
+        self.xtest = xtest
+        self.display = Display(display)
+        self.keycodes = {key: self.display.keysym_to_keycode(XK.string_to_keysym(name)) for key, name in XDOTOOL_KEYS.items()}
+        self.batch_size = batch_size
+
+    def send(self, events: List[Tuple]):
+        for event in events:
+            if event[0] == 'click':
+                self.xtest.fake_input(self.display, self.X.MotionNotify, x=event[1], y=event[2])
+                self.xtest.fake_input(self.display, self.X.ButtonPress, 1)
+                self.xtest.fake_input(self.display, self.X.ButtonRelease, 1)
+            elif event[0] == 'key':
+                self.xtest.fake_input(self.display, self.X.KeyPress, self.keycodes[event[1]])
+                self.xtest.fake_input(self.display, self.X.KeyRelease, self.keycodes[event[1]])
+            elif event[0] == 'sleep':
+                self.display.sync()
+                time.sleep(event[1])
+        self.display.sync()
+
+
+class NullDriver:
+    """
+    Drops all events, counts them per kind.
+    """
+    def __init__(self, batch_size: int = 200):
+        self.batch_size = batch_size
+        self.counts = {'click': 0, 'key': 0, 'sleep': 0}
+        self.batches = 0
+
+    def send(self, events: List[Tuple]):
+        self.batches += 1
+        for event in events:
+            self.counts[event[0]] += 1
+
+
+class RecordingDriver:
+    """
+    Appends every batch to path as a JSON line and passes it on to driver, if given.
+    """
+    def __init__(self, path: str, driver=None):
+        self.file = open(path, 'a', encoding='utf-8')
+        self.driver = driver
+        self.batch_size = driver.batch_size if driver is not None else 200
+
+    def send(self, events: List[Tuple]):
+        self.file.write(json.dumps(events) + '\n')
+        self.file.flush()
+        if self.driver is not None:
+            self.driver.send(events)
+
+    def close(self):
+        self.file.close()
+
+
+def get_driver(name: str, batch_size: int = 200, record_path: Optional[str] = None):
+    """
+    Driver by name. A record_path records the events of any driver, 'record' only records them.
+    """
+    if name == 'pyautogui':
+        driver = PyAutoGuiDriver()
+    elif name == 'xdotool':
+        driver = XdotoolDriver(batch_size)
+    elif name == 'xtest':
+        driver = XTestDriver(batch_size)
+    elif name == 'null':
+        driver = NullDriver(batch_size)
+    elif name == 'record':
+        driver = None
+    else:
+        raise ValueError('Unknown input driver {}, expected one of {}.'.format(name, DRIVERS))
+
+    if record_path is not None or name == 'record':
+        return RecordingDriver(record_path if record_path is not None else 'events.jsonl', driver)
+    return driver
+
+
+class DriverBackend:
+    """
+    Replay backend that turns clicks, key presses and sleeps into events and sends them to the driver in batches of up
+    to driver.batch_size. Key presses and resize clicks are sent at once and replay_plan flushes the batch at every page
+    start and checkpoint, so that the progress journal never records actions that were not sent yet. Every click is
+    followed by a sleep of pause seconds. Sleeps split a batch and are sent on their own, so a batch only holds events
+    that are injected without waiting.
+    before_send is called before every batch and every sleep, e.g. with pyautogui.failSafeCheck to keep the fail safe for
+    drivers that do not go through pyautogui: a cursor moved into a screen corner during a pause is caught before the
+    next click moves it away.
+    """
+    def __init__(self, driver, before_send=None, pause: float = 0.0):
+        self.driver = driver
+        self.before_send = before_send
+        self.pause = pause
+        self.events = []
+
+    def _add(self, event):
+        self.events.append(event)
+        if len(self.events) >= self.driver.batch_size:
+            self.flush()
+
+    def flush(self):
+        if len(self.events) == 0:
+            return
+        events = self.events
+        self.events = []
+        batch = []
+        for event in events + [None]:
+            if event is not None and event[0] != 'sleep':
+                batch.append(event)
+                continue
+            for part in (batch, [event] if event is not None else []):
+                if len(part) > 0:
+                    if self.before_send is not None:
+                        self.before_send()
+                    self.driver.send(part)
+            batch = []
+
+    def click(self, point, op=None, value=None):
+        self._add(('click', int(point[0]), int(point[1])))
+        self.sleep(self.pause)
+        if op == OP_RESIZE:
+            self.flush()
+
+    def key(self, key):
+        self._add(('key', key))
+        self.flush()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self._add(('sleep', seconds))
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Measure the injection overhead of an input driver, e.g. against Xvfb (DISPLAY=:99).')
+    arg_parser.add_argument('-d', '--driver', required=False, default='null', choices=DRIVERS)
+    arg_parser.add_argument('-n', '--events', required=False, default=1000, type=int, help='number of clicks to send')
+    arg_parser.add_argument('-b', '--batch-size', required=False, default=200, type=int)
+    arg_parser.add_argument('-x', required=False, default=400, type=int, help='screen position of the clicks')
+    arg_parser.add_argument('-y', required=False, default=300, type=int)
+    args = arg_parser.parse_args()
+
+    driver = get_driver(args.driver, args.batch_size)
+    if args.driver == 'pyautogui':
+        driver.pyautogui.PAUSE = 0
+    backend = DriverBackend(driver)
+    t_start = time.perf_counter()
+    for i in range(args.events):
+        backend.click((args.x, args.y))
+    backend.flush()
+    duration = time.perf_counter() - t_start
+    print('{}: {} clicks in {:.3f} s, {:.0f} clicks/s, {:.1f} µs per click'.format(
+        args.driver, args.events, duration, args.events / duration, 1e6 * duration / args.events))
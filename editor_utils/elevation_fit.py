@@ -0,0 +1,81 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pandas
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial import ConvexHull, Delaunay, QhullError
+
+# The editor fills the squares between the ones that were set by interpolation. It is modelled as linear interpolation
+# over the Delaunay triangulation of the set squares (a TIN).
+
+
+def interpolate_heights(x: np.ndarray, y: np.ndarray, z: np.ndarray, grid_x: np.ndarray, grid_y: np.ndarray) -> np.ndarray:
+    """
+    Heights at (grid_x, grid_y) interpolated from the set squares (x, y, z). NaN outside of their convex hull.
+    """
+    return LinearNDInterpolator(np.column_stack((x, y)), z)(grid_x, grid_y)
+
+
+def select_control_points(x: np.ndarray, y: np.ndarray, z: np.ndarray, max_error: float) -> np.ndarray:
+    """
+    Choose the squares to set so that interpolating between them reproduces z everywhere within max_error. Greedy
+    insertion: starting from the convex hull, every round adds the square with the largest error of each triangle whose
+    error exceeds max_error.
+    Returns a boolean mask over the squares.
+    """
+    points = np.column_stack((x, y)).astype(float)
+    z = np.asarray(z, dtype=float)
+    selected = np.zeros(len(z), dtype=bool)
+    try:
+        selected[ConvexHull(points).vertices] = True
+    except (QhullError, ValueError):
+        # fewer than three squares or all in one line
+        selected[:] = True
+        return selected
+
+    while True:
+        tri = Delaunay(points[selected])
+        error = np.abs(LinearNDInterpolator(tri, z[selected])(points) - z)
+        error[selected] = 0
+        error[np.isnan(error)] = np.inf
+        over = np.nonzero(error > max_error)[0]
+        if len(over) == 0:
+            break
+
+        simplex = tri.find_simplex(points[over])
+        order = np.lexsort((-error[over], simplex))
+        first = np.concatenate(([True], simplex[order][1:] != simplex[order][:-1]))
+        selected[over[order[first]]] = True
+
+    return selected
+
+
+def thin_heights(map_df: pandas.DataFrame, max_error: float) -> pandas.DataFrame:
+    """
+    Mark the elevation rows (z >= 0) that the editor's interpolation makes unnecessary as done. Rows with a ground entry
+    are kept.
+    """
+    heights = map_df[(map_df.z >= 0) & (map_df.done == 0)]
+    if 'menu' in map_df.columns:
+        heights = heights[heights.menu.isna()]
+    if len(heights) == 0:
+        return map_df
+
+    selected = select_control_points(heights.x.values, heights.y.values, heights.z.values, max_error)
+    map_df = map_df.copy()
+    map_df.loc[heights.index[~selected], 'done'] = 1
+
+    return map_df
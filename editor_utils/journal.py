@@ -0,0 +1,139 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from profiles.general.constants import START_HEIGHT
+from editor_utils.plan import *
+from editor_utils.planner import get_window_edges, restore_window, set_height
+
+
+def initial_state() -> Dict:
+    """
+    Editor state at the start of a plan: offsets of the map window edges (left, right, bottom, top) and the elevation.
+    """
+    return {'window': [0, 0, 0, 0], 'height': START_HEIGHT}
+
+
+def plan_state(plan: ActionPlan, end: int) -> Dict:
+    """
+    Editor state the plan expects after its first end actions, including the menu selection of the last checkpoint.
+    """
+    ops = plan.ops[:end]
+    state = initial_state()
+
+    state['window'] = get_window_edges(plan, 0, end).tolist()
+    state['height'] = START_HEIGHT + int(ops[ops[:, 0] == OP_KEY, 1].sum())
+
+    checkpoints = ops[ops[:, 0] == OP_CHECKPOINT, 1]
+    state['menu'] = plan.meta['checkpoints'][checkpoints[-1]] if len(checkpoints) > 0 else []
+
+    return state
+
+
+class ProgressJournal:
+    """
+    Append-only record of a replay, one JSON object per line. Page starts and checkpoints are recorded with the index of
+    their action, as are resize clicks and key presses, which change the editor state for good. Every entry holds the
+    window edges and elevation afterwards and is flushed to disk (fsync) before the next action is sent, so that after
+    an abort or crash the journal describes the editor state up to the last recorded action.
+
+    Pass the journal as after_action to replay_plan. Actions replayed with index None (the prelude of a resumed run) only
+    update the state.
+    """
+    def __init__(self, path: str, state: Optional[Dict] = None):
+        self.path = path
+        self.state = state if state is not None else initial_state()
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def write(self, event: str, op: Optional[int] = None, **entry):
+        entry.update(event=event, op=op, window=self.state['window'], height=self.state['height'])
+        self.file.write(json.dumps(entry) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def __call__(self, index, op, a, b, c):
+        if op == OP_RESIZE:
+            self.state['window'] = [w + d for w, d in zip(self.state['window'], RESIZE_EFFECTS[RESIZE_BUTTONS[a]])]
+            self.write('resize', index)
+        elif op == OP_KEY:
+            self.state['height'] += a
+            self.write('key', index)
+        elif index is None:
+            return
+        elif op == OP_PAGE:
+            self.write('page', index, page=[a, b, c])
+        elif op == OP_CHECKPOINT:
+            self.write('checkpoint', index)
+
+    def close(self):
+        self.file.close()
+
+
+def read_journal(path: str) -> List[Dict]:
+    """
+    Entries of the last run recorded in the journal, i.e. from its last 'start' entry on. A line that was cut off by a
+    crash is ignored.
+    """
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry['event'] == 'start':
+                entries = []
+            entries.append(entry)
+
+    return entries
+
+
+def resume_plan(plan: ActionPlan, entries: List[Dict]) -> Tuple[Optional[ActionPlan], int]:
+    """
+    Prepare resuming the run recorded in entries. Returns a prelude plan, which brings the editor from the recorded state
+    to the state the plan expects at the last page start or checkpoint (window, elevation, menu selection) and the index
+    of the action to continue the plan with. Returns (None, len(plan)) if the run was finished.
+    """
+    if len(entries) == 0 or entries[0]['event'] != 'start':
+        raise ValueError('The journal does not contain the start of a run.')
+    if entries[0]['n_ops'] != len(plan):
+        raise ValueError('The journal was written for a plan with {} actions, this plan has {}.'.format(entries[0]['n_ops'], len(plan)))
+    if entries[-1]['event'] == 'finish':
+        return None, len(plan)
+
+    start = 0
+    page = None
+    for entry in entries:
+        if entry['event'] == 'page':
+            start = entry['op']
+            page_op = entry['op']
+            page = entry['page']
+        elif entry['event'] == 'checkpoint':
+            start = entry['op'] + 1
+
+    expected = plan_state(plan, start)
+    prelude = ActionPlan(plan.profile)
+    if page is not None and start != page_op:
+        prelude.page(*page)
+    restore_window(prelude, entries[-1]['window'], expected['window'])
+    set_height(prelude, entries[-1]['height'], expected['height'])
+    for name in expected['menu']:
+        if name is not None:
+            prelude.menu(name)
+
+    return prelude, start
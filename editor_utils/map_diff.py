@@ -0,0 +1,214 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Dict
+
+import numpy as np
+import pandas
+from scipy.spatial import QhullError
+
+from profiles.general.constants import START_HEIGHT
+from editor_utils.elevation_fit import interpolate_heights
+from editor_utils.planner import get_default_ground, get_layer, get_menu_dict
+
+GROUND_COLUMNS = ['menu', 'cat1', 'cat2', 'direction']
+
+
+def get_heights(map_df: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Elevation per square (x, y, z_applied), the last row wins.
+    """
+    heights = map_df.loc[map_df.z >= 0, ['x', 'y', 'z']]
+    return heights.drop_duplicates(subset=['x', 'y'], keep='last').rename(columns={'z': 'z_applied'})
+
+
+def get_ground(map_df: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Ground entry per square and layer (layer, x, y, ground) as set_ground paints it: of several rows on the same layer the
+    last one in group order wins. ground joins the menu columns into one string.
+    """
+    if 'menu' not in map_df.columns:
+        return pandas.DataFrame({'layer': [], 'x': [], 'y': [], 'ground': []})
+
+    ground = map_df[map_df.menu.notna()].sort_values(by=GROUND_COLUMNS, kind='stable')
+    ground = pandas.DataFrame({
+        'layer': ground.menu.map(get_layer).astype(str),
+        'x': ground.x,
+        'y': ground.y,
+        'ground': ground[GROUND_COLUMNS].fillna('').astype(str).agg('|'.join, axis=1),
+    })
+    return ground.drop_duplicates(subset=['layer', 'x', 'y'], keep='last')
+
+
+def mark_unchanged(map_df: pandas.DataFrame, applied_df: pandas.DataFrame):
+    """
+    Set done = 1 for all rows of map_df that are already in the editor because applied_df, the previously applied map,
+    has the same elevation and ground entry for their square. Squares that only applied_df sets cannot be undone and are
+    only counted.
+    Returns the marked copy of map_df and a dict of counts.
+    """
+    if int(map_df.x.max()) != int(applied_df.x.max()) or int(map_df.y.max()) != int(applied_df.y.max()):
+        raise ValueError('The map size changed from {}x{} to {}x{} squares, an incremental run needs the same size.'.format(
+            int(applied_df.x.max()) + 1, int(applied_df.y.max()) + 1, int(map_df.x.max()) + 1, int(map_df.y.max()) + 1))
+
+    map_df = map_df.copy()
+    new_heights = get_heights(map_df)
+    applied_heights = get_heights(applied_df)
+    z_applied = map_df[['x', 'y']].merge(applied_heights, on=['x', 'y'], how='left').z_applied.values
+    has_height = map_df.z.values >= 0
+    height_changed = has_height & (map_df.z.values != z_applied)
+
+    new_ground = get_ground(map_df)
+    applied_ground = get_ground(applied_df)
+    if 'menu' in map_df.columns:
+        ground = new_ground.merge(applied_ground, on=['layer', 'x', 'y'], how='left', suffixes=('', '_applied'))
+        ground['changed'] = ground.ground != ground.ground_applied
+        rows = pandas.DataFrame({'layer': map_df.menu.map(get_layer), 'x': map_df.x, 'y': map_df.y})
+        has_ground = map_df.menu.notna().values
+        ground_changed = has_ground & rows.merge(ground, on=['layer', 'x', 'y'], how='left').changed.fillna(False).values.astype(bool)
+    else:
+        has_ground = ground_changed = np.zeros(len(map_df), dtype=bool)
+
+    map_df.loc[~(height_changed | ground_changed), 'done'] = 1
+
+    applied_only_heights = applied_heights.merge(new_heights, on=['x', 'y'], how='left', suffixes=('', '_new'))
+    applied_only_ground = applied_ground.merge(new_ground, on=['layer', 'x', 'y'], how='left', suffixes=('', '_new'))
+    stats = {
+        'rows': len(map_df),
+        'changed_rows': int((map_df.done == 0).sum()),
+        'height_squares': int(has_height.sum()),
+        'height_changed': int(height_changed.sum()),
+        'ground_squares': int(has_ground.sum()),
+        'ground_changed': int(ground_changed.sum()),
+        'height_removed': int(applied_only_heights.z_applied_new.isna().sum()),
+        'ground_removed': int(applied_only_ground.ground_new.isna().sum()),
+    }
+
+    return map_df, stats
+
+
+def initial_heights(x: np.ndarray, y: np.ndarray, z: np.ndarray, start_height: int = START_HEIGHT) -> np.ndarray:
+    """
+    Mask over the squares (x, y, z, one per square) that need not be set on a new map, which is flat at start_height:
+    squares at the start height whose eight neighbours are at it as well, so that the border of every flat region is
+    set, and where interpolating between the squares that are set gives the start height, see elevation_fit.
+    """
+    x = x.astype(int)
+    y = y.astype(int)
+    flat = np.zeros((x.max() + 3, y.max() + 3), dtype=bool)
+    flat[x + 1, y + 1] = z == start_height
+    # squares outside the map are not flat, the border of the map is set
+    inner = flat.copy()
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            inner[1:-1, 1:-1] &= flat[1 + dx:flat.shape[0] - 1 + dx, 1 + dy:flat.shape[1] - 1 + dy]
+    skipped = inner[x + 1, y + 1]
+
+    # squares that are set change the triangulation, so squares that do not interpolate to the start height are set
+    # until all skipped ones do
+    while skipped.any():
+        kept = ~skipped
+        if (z[kept] == start_height).all():
+            break
+        try:
+            error = np.abs(interpolate_heights(x[kept], y[kept], z[kept], x[skipped], y[skipped]) - start_height)
+        except (QhullError, ValueError):
+            return np.zeros(len(z), dtype=bool)
+        wrong = ~(error < 1e-6)
+        if not wrong.any():
+            break
+        skipped[np.nonzero(skipped)[0][wrong]] = False
+
+    return skipped
+
+
+def initial_ground(map_df: pandas.DataFrame, profile='cold_war') -> np.ndarray:
+    """
+    Mask over the rows of map_df that are left to do and whose square ends up with the default ground of a new map (see
+    the DEFAULT_GROUND of the profile's menu) on the layer of the default ground, painted as set_ground paints them.
+    Squares that rows marked done have painted on that layer are not new.
+    """
+    default_ground = get_default_ground(profile)
+    if 'menu' not in map_df.columns or default_ground is None:
+        return np.zeros(len(map_df), dtype=bool)
+
+    menu_dict = get_menu_dict(profile)
+    layer = get_layer(default_ground[0])
+    rows = map_df[map_df.menu.notna()]
+    rows = rows[(rows.menu.map(get_layer) == layer) & rows.menu.isin(menu_dict.keys()) & rows.cat1.isin(menu_dict.keys())]
+    painted = rows[rows.done != 0][['x', 'y']].drop_duplicates()
+    pending = rows[rows.done == 0].sort_values(by=GROUND_COLUMNS, kind='stable')
+    last = pending.drop_duplicates(subset=['x', 'y'], keep='last')
+    is_default = (last.menu == default_ground[0]) & (last.cat1 == default_ground[1]) & ~last.cat2.isin(menu_dict.keys()) & \
+        ~last.direction.isin(menu_dict.keys())
+    squares = last.loc[is_default, ['x', 'y']].merge(painted, on=['x', 'y'], how='left', indicator=True)
+    squares = squares[squares._merge == 'left_only'][['x', 'y']]
+
+    initial = pending[['x', 'y']].reset_index().merge(squares, on=['x', 'y'])['index']
+    return map_df.index.isin(initial.values)
+
+
+def mark_initial(map_df: pandas.DataFrame, profile='cold_war', elevation=True):
+    """
+    Leave out what a new map in the editor already has: it is flat at START_HEIGHT (see initial_heights) and covered with
+    the default ground of the profile (see initial_ground). Of a row with elevation and ground entry only the part that
+    changes the map is kept, rows with neither are marked done. elevation=False keeps all elevation rows, e.g. if
+    elevation_fit thins them anyway.
+    Returns the marked copy of map_df and a dict of counts.
+    """
+    map_df = map_df.copy()
+    height_rows = (map_df.z >= 0) & (map_df.done == 0)
+    height_initial = np.zeros(len(map_df), dtype=bool)
+    if elevation and height_rows.any():
+        heights = get_heights(map_df)
+        skipped = heights[initial_heights(heights.x.values, heights.y.values, heights.z_applied.values)][['x', 'y']]
+        height_initial = height_rows.values & map_df[['x', 'y']].merge(skipped, on=['x', 'y'], how='left', indicator=True)._merge.eq('both').values
+
+    ground_rows = map_df.menu.notna() & (map_df.done == 0) if 'menu' in map_df.columns else pandas.Series(False, index=map_df.index)
+    ground_initial = initial_ground(map_df, profile)
+
+    map_df.loc[height_initial, 'z'] = -1
+    if 'menu' in map_df.columns:
+        map_df['menu'] = map_df.menu.where(~ground_initial)
+        pending = (map_df.z >= 0) | map_df.menu.notna()
+    else:
+        pending = map_df.z >= 0
+    map_df.loc[(height_initial | ground_initial) & ~pending, 'done'] = 1
+
+    stats = {
+        'rows': len(map_df),
+        'changed_rows': int((map_df.done == 0).sum()),
+        'height_squares': int(height_rows.sum()),
+        'height_initial': int(height_initial.sum()),
+        'ground_squares': int(ground_rows.sum()),
+        'ground_initial': int(ground_initial.sum()),
+    }
+
+    return map_df, stats
+
+
+def format_initial_stats(stats: Dict[str, int]) -> str:
+    return '{height_initial} of {height_squares} elevation squares keep the start elevation and {ground_initial} of ' \
+           '{ground_squares} ground squares the default ground of a new map, {changed_rows} of {rows} rows are left.'.format(**stats)
+
+
+def format_diff_stats(stats: Dict[str, int]) -> str:
+    skipped = 1 - stats['changed_rows'] / stats['rows'] if stats['rows'] > 0 else 0
+    text = '{changed_rows} of {rows} rows changed ({skipped:.0%} skipped): {height_changed} of {height_squares} elevation ' \
+           'squares, {ground_changed} of {ground_squares} ground squares.'.format(skipped=skipped, **stats)
+    if stats['height_removed'] > 0 or stats['ground_removed'] > 0:
+        text += ' {height_removed} elevation and {ground_removed} ground squares are only set in the applied map and stay ' \
+                'as they are.'.format(**stats)
+    return text
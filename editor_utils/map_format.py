@@ -0,0 +1,126 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import json
+
+import numpy as np
+import pandas
+
+MAP_FORMAT_VERSION = 1
+
+# columns stored as int16, all other numeric columns keep their dtype and text columns are dictionary encoded
+INT16_COLUMNS = ['x', 'y', 'z']
+
+
+def is_map_bundle(path: str) -> bool:
+    """
+    True for a map stored with write_map_bundle, as opposed to a compiled plan, which is an npz file as well.
+    """
+    if not path.endswith('.npz'):
+        return False
+    with np.load(path) as data:
+        return 'map_format' in data.files
+
+
+def read_csv_map(path: str) -> pandas.DataFrame:
+    map_df = pandas.read_csv(path)
+    # index column written by to_csv
+    return map_df.drop(columns=[col for col in map_df.columns if col.startswith('Unnamed:')])
+
+
+def write_map_bundle(map_df: pandas.DataFrame, path: str):
+    """
+    Store a map as compressed npz: x, y and z (rounded) as int16, text columns as int16 codes into a sorted array of
+    their values with -1 for empty cells.
+    """
+    arrays = {}
+    columns = []
+    for col in map_df.columns:
+        values = map_df[col]
+        if col in INT16_COLUMNS:
+            values = values.round()
+            if values.min() < np.iinfo(np.int16).min or values.max() > np.iinfo(np.int16).max:
+                raise ValueError('Column {} does not fit into int16 (range {} to {}).'.format(col, values.min(), values.max()))
+            arrays['col_' + col] = values.values.astype(np.int16)
+            columns.append([col, 'int16'])
+        elif pandas.api.types.is_numeric_dtype(values) and not pandas.api.types.is_bool_dtype(values):
+            arrays['col_' + col] = values.values
+            columns.append([col, 'numeric'])
+        else:
+            codes, categories = pandas.factorize(values.astype(object), sort=True)
+            arrays['col_' + col] = codes.astype(np.int16 if len(categories) < np.iinfo(np.int16).max else np.int32)
+            arrays['values_' + col] = np.array(categories.astype(str), dtype=str)
+            columns.append([col, 'category'])
+
+    np.savez_compressed(path, map_format=np.array(MAP_FORMAT_VERSION), columns=np.array(json.dumps(columns)), **arrays)
+
+
+def read_map_bundle(path: str) -> pandas.DataFrame:
+    """
+    Load a map written by write_map_bundle. x, y and z are widened to int32 for the screen coordinate arithmetic, text
+    columns become pandas categoricals.
+    """
+    with np.load(path) as data:
+        if int(data['map_format']) > MAP_FORMAT_VERSION:
+            raise ValueError('{} has map format version {}, expected at most {}.'.format(path, int(data['map_format']), MAP_FORMAT_VERSION))
+        map_df = {}
+        for col, kind in json.loads(str(data['columns'])):
+            values = data['col_' + col]
+            if kind == 'int16':
+                map_df[col] = values.astype(np.int32)
+            elif kind == 'category':
+                map_df[col] = pandas.Categorical.from_codes(values, categories=data['values_' + col].astype(object))
+            else:
+                map_df[col] = values
+
+    return pandas.DataFrame(map_df)
+
+
+def write_map(map_df: pandas.DataFrame, path: str):
+    """
+    Write a map as npz bundle or, for paths ending in '.parquet', as Parquet (needs pyarrow or fastparquet). Text columns
+    are stored dictionary encoded in both.
+    """
+    if path.endswith('.parquet'):
+        map_df = map_df.copy()
+        for col in map_df.columns:
+            if col in INT16_COLUMNS:
+                map_df[col] = map_df[col].round().astype(np.int16)
+            elif not pandas.api.types.is_numeric_dtype(map_df[col]):
+                map_df[col] = map_df[col].astype('category')
+        map_df.to_parquet(path, index=False)
+    else:
+        write_map_bundle(map_df, path)
+
+
+def read_map(path: str) -> pandas.DataFrame:
+    if path.endswith('.parquet'):
+        return pandas.read_parquet(path)
+    if is_map_bundle(path):
+        return read_map_bundle(path)
+    return read_csv_map(path)
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Convert a map csv-file into a typed columnar map (npz bundle or Parquet) for faster loading.')
+    arg_parser.add_argument('-i', '--input', required=True, help='map csv-file')
+    arg_parser.add_argument('-o', '--output', required=True, help='output file (.npz or .parquet)')
+    args = arg_parser.parse_args()
+
+    map_df = read_map(args.input)
+    write_map(map_df, args.output)
+    print('{} rows, {:.1f} MB in memory as csv, {:.1f} MB as typed columns.'.format(
+        len(map_df), map_df.memory_usage(deep=True).sum() / 1e6, read_map(args.output).memory_usage(deep=True).sum() / 1e6))
@@ -0,0 +1,208 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas
+
+from editor_utils.map_diff import mark_initial
+from editor_utils.map_format import write_map_bundle
+from editor_utils.plan import read_plan, write_plan
+from editor_utils.planner import get_pages, get_window_edges, load_map
+from editor_utils.sessions import DEFAULT_LAYER_GROUPS, compile_session, session_map
+
+# A map stream is a directory into which converters (producers) publish the finished parts of a map while they are still
+# working on the rest, and from which cmautoeditor (the consumer) clicks them. Every producer publishes its parts as npz
+# map bundles (<producer>_<number>.npz) and keeps its state in <producer>.stream.json: the size of the whole map, its
+# session layers, the parts published so far and whether it is done. Files are written under a temporary name and then
+# renamed, so the consumer never reads a part or state that is only half written.
+STREAM_SUFFIX = '.stream.json'
+STREAM_SESSIONS = 'sessions.json'
+DEFAULT_PRODUCERS = ['dgm2cm', 'osm2cm']
+
+
+def _write_json(path: str, data):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+    # on Windows the rename fails while the other side has the file open
+    for attempt in range(50):
+        try:
+            os.replace(temp_path, path)
+            return
+        except PermissionError:
+            time.sleep(0.1)
+    os.replace(temp_path, path)
+
+
+def page_bands(map_df: pandas.DataFrame, n_squares_x: int, n_squares_y: int) -> List[np.ndarray]:
+    """
+    Positions of the rows of every row of editor pages, from the bottom to the top, in the page layout of a map of
+    n_squares_x by n_squares_y squares. Rows that no page covers are left out, the editor run never clicks them.
+    """
+    xy = pandas.DataFrame({'x': np.append(map_df.x.values.astype(int), n_squares_x - 1),
+                           'y': np.append(map_df.y.values.astype(int), n_squares_y - 1)})
+    bands = {}
+    for page in get_pages(xy)[2]:
+        bands.setdefault(page['i_page_y'], []).append(page['df'].index.values)
+
+    positions = [np.sort(np.concatenate(bands[i_page_y])) for i_page_y in sorted(bands)]
+    # without the corner square that was added for the map size
+    positions = [band[band < len(map_df)] for band in positions]
+    return [band for band in positions if len(band) > 0]
+
+
+class MapStream:
+    """
+    Producer side of a map stream at path (a directory), see publish_map for publishing a whole map row of pages by row
+    of pages.
+    """
+    def __init__(self, path: str, producer: str, n_squares_x: int, n_squares_y: int, layers: List[str]):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.state = {'producer': producer, 'n_squares': [int(n_squares_x), int(n_squares_y)], 'layers': list(layers), 'parts': [],
+                      'closed': False}
+        self._write_state()
+
+    def _write_state(self):
+        _write_json(os.path.join(self.path, self.state['producer'] + STREAM_SUFFIX), self.state)
+
+    def publish(self, map_df: pandas.DataFrame) -> str:
+        """
+        Publish finished rows of the map (map coordinates, the columns of a map csv-file). Returns the path of the part.
+        """
+        name = '{}_{:03d}.npz'.format(self.state['producer'], len(self.state['parts']) + 1)
+        path = os.path.join(self.path, name)
+        write_map_bundle(map_df, path[:-len('.npz')] + '.tmp.npz')
+        os.replace(path[:-len('.npz')] + '.tmp.npz', path)
+        self.state['parts'].append({'file': name, 'rows': len(map_df)})
+        self._write_state()
+        return path
+
+    def close(self):
+        self.state['closed'] = True
+        self._write_state()
+
+
+def publish_map(path: str, producer: str, map_df: pandas.DataFrame, n_squares_x: int, n_squares_y: int, layers: List[str]):
+    """
+    Publish a finished map to a map stream, one part per row of editor pages.
+    """
+    stream = MapStream(path, producer, n_squares_x, n_squares_y, layers)
+    for band in page_bands(map_df, n_squares_x, n_squares_y):
+        stream.publish(map_df.iloc[band])
+    stream.close()
+
+
+def read_stream_state(path: str, producer: str) -> Optional[Dict]:
+    state_path = os.path.join(path, producer + STREAM_SUFFIX)
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_parts(path: str, parts: List[Dict], n_squares) -> pandas.DataFrame:
+    """
+    Map of the given parts, with a corner square (done) that gives it the size of the whole map, so that it is split
+    into the same pages.
+    """
+    map_df = pandas.concat([load_map(os.path.join(path, part['file'])) for part in parts], ignore_index=True)
+    corner = pandas.DataFrame({'x': [n_squares[0] - 1], 'y': [n_squares[1] - 1], 'z': [-1], 'done': [1]})
+    return pandas.concat((map_df, corner), ignore_index=True)
+
+
+def stream_sessions(path: str, producers: Optional[List[str]] = None, profile='cold_war', start_size_from_file=False,
+                    poll_interval: float = 1.0, resume=False, initial_state=True, **kwargs):
+    """
+    Consumer side of a map stream: yields sessions (name, producer, parts, layers, plan, see editor_utils.sessions) to be
+    clicked one after the other as soon as their parts are published. All parts of a producer come before those of the
+    next one in producers, the parts a producer published while the previous session was clicked form one session (two
+    if they hold elevation and ground). Every plan is written to <path>/<name>.plan.npz and the sessions are listed in
+    <path>/sessions.json. With resume the sessions listed there are yielded again first, with their plans from file.
+    With initial_state (and not start_size_from_file) the map goes onto a new map and the squares it already has are
+    left out, see map_diff.mark_initial. kwargs are passed on to compile_plan.
+    """
+    producers = producers if producers is not None else DEFAULT_PRODUCERS
+    sessions_path = os.path.join(path, STREAM_SESSIONS)
+    entries = []
+    consumed = {producer: 0 for producer in producers}
+    start_window = None
+    ground = False
+
+    def add_session(entry, plan):
+        nonlocal start_window, ground
+        if 'elevation' in entry['layers'] and ground:
+            raise ValueError('{} published elevation after ground had been clicked, the editor cannot return to the elevation mode. '
+                             'List the producers of elevation first.'.format(entry['producer']))
+        ground = ground or 'elevation' not in entry['layers']
+        consumed[entry['producer']] = max(consumed.get(entry['producer'], 0), entry['parts'][-1])
+        # the first session starts at the start size (or the size from the file), the others where the first one ended
+        if start_window is None:
+            start_window = get_window_edges(plan).tolist()
+        entries.append(entry)
+        return dict(entry, plan=plan)
+
+    if resume and os.path.exists(sessions_path):
+        with open(sessions_path, encoding='utf-8') as f:
+            for entry in json.load(f):
+                yield add_session(entry, read_plan(os.path.join(path, entry['plan'])))
+
+    n_squares = None
+    for producer in producers:
+        waiting = False
+        while True:
+            state = read_stream_state(path, producer)
+            if state is not None:
+                if n_squares is None:
+                    n_squares = state['n_squares']
+                elif state['n_squares'] != n_squares:
+                    raise ValueError('{} publishes a map of {} squares, the stream holds one of {}.'.format(producer, state['n_squares'], n_squares))
+
+            parts = state['parts'][consumed[producer]:] if state is not None else []
+            if state is not None and 'elevation' in state['layers'] and ground and (len(parts) > 0 or not state['closed']):
+                raise ValueError('{} publishes elevation after ground had been clicked, the editor cannot return to the elevation mode. '
+                                 'List the producers of elevation first.'.format(producer))
+            if len(parts) == 0:
+                if state is not None and state['closed']:
+                    break
+                if not waiting:
+                    print('Waiting for {} to publish parts of the map in {}'.format(producer, path))
+                    waiting = True
+                time.sleep(poll_interval)
+                continue
+            waiting = False
+
+            first = consumed[producer] + 1
+            map_df = read_parts(path, parts, n_squares)
+            if initial_state and not start_size_from_file:
+                map_df, _ = mark_initial(map_df, profile, kwargs.get('elevation_error') is None)
+            for layers in DEFAULT_LAYER_GROUPS:
+                group_df = session_map(map_df, layers)
+                if (group_df.done == 0).sum() == 0:
+                    continue
+                plan = compile_session(group_df, profile, start_size_from_file, start_window=start_window, **kwargs)
+                name = '{}_{:03d}-{:03d}_{}'.format(producer, first, first + len(parts) - 1, 'elevation' if 'elevation' in layers else 'ground')
+                write_plan(plan, os.path.join(path, name + '.plan.npz'))
+                entry = {'name': name, 'producer': producer, 'parts': [first, first + len(parts) - 1], 'layers': list(layers),
+                         'plan': name + '.plan.npz', 'actions': len(plan)}
+                session = add_session(entry, plan)
+                _write_json(sessions_path, entries)
+                yield session
+            consumed[producer] = first + len(parts) - 1
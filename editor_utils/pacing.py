@@ -0,0 +1,216 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from typing import Dict, Optional, Tuple
+
+from editor_utils.plan import *
+
+# every action waits for the budget of its class after it was sent
+PACING_CLASSES = {
+    OP_KEY: 'key',
+    OP_SQUARE: 'canvas',
+    OP_MENU: 'menu',
+    OP_BRUSH: 'menu',
+    OP_RESIZE: 'resize',
+}
+
+# actions that can be sent again when they did not land, selecting a menu entry or setting a square twice does no harm
+RETRY_OPS = (OP_MENU, OP_BRUSH, OP_SQUARE)
+
+
+def default_budgets(min_time: float = 0.05, key_time: float = 0.1, resize_time: float = 0.05) -> Dict[str, Tuple[float, float, float]]:
+    """
+    (lowest, start, highest) delay in seconds per class. The start values are the fixed delays of an unpaced run: the
+    pyautogui pause after clicks plus the settle time the plan sleeps after key presses and resize clicks.
+    """
+    return {
+        'key': (0.01, key_time, 1.0),
+        'canvas': (0.005, min_time, 1.0),
+        'menu': (0.005, min_time, 1.0),
+        'resize': (0.01, min_time + resize_time, 1.0),
+    }
+
+
+class AdaptivePacer:
+    """
+    Delay per action class, adapted to what the verifier observes: after streak actions in a row that landed the delay
+    is multiplied by speedup, after a miss by backoff, within the bounds of the class budget. Classes without feedback
+    keep their start delay. Every change is appended to log_path as a JSON line.
+    """
+    def __init__(self, budgets: Optional[Dict[str, Tuple[float, float, float]]] = None, speedup: float = 0.9,
+                 backoff: float = 2.0, streak: int = 10, log_path: Optional[str] = None):
+        self.budgets = budgets if budgets is not None else default_budgets()
+        self.delays = {cls: budget[1] for cls, budget in self.budgets.items()}
+        self.speedup = speedup
+        self.backoff = backoff
+        self.streak = streak
+        self.n_actions = 0
+        self.landed = {cls: 0 for cls in self.budgets}
+        self.stats = {cls: {'landed': 0, 'missed': 0} for cls in self.budgets}
+        self.log = open(log_path, 'a', encoding='utf-8') if log_path is not None else None
+
+    def delay(self, cls: str) -> float:
+        return self.delays[cls]
+
+    def update(self, cls: str, landed: Optional[bool]):
+        self.n_actions += 1
+        if landed is None:
+            return
+
+        lowest, _, highest = self.budgets[cls]
+        old = self.delays[cls]
+        if landed:
+            self.stats[cls]['landed'] += 1
+            self.landed[cls] += 1
+            if self.landed[cls] < self.streak:
+                return
+            self.landed[cls] = 0
+            self.delays[cls] = max(lowest, old * self.speedup)
+        else:
+            self.stats[cls]['missed'] += 1
+            self.landed[cls] = 0
+            self.delays[cls] = min(highest, old * self.backoff)
+
+        if self.log is not None and self.delays[cls] != old:
+            self.log.write(json.dumps({'action': self.n_actions, 'class': cls, 'landed': landed, 'old': old, 'delay': self.delays[cls]}) + '\n')
+            self.log.flush()
+
+    def summary(self) -> str:
+        return ', '.join('{}: {:.3f} s ({} landed, {} missed)'.format(cls, self.delays[cls], self.stats[cls]['landed'], self.stats[cls]['missed'])
+                         for cls in self.budgets)
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+
+
+class NullVerifier:
+    """
+    Observes nothing, all delays stay at their start values.
+    """
+    def sample(self, op, point, value=None):
+        return None
+
+    def verify(self, op, point, before, value=None) -> Optional[bool]:
+        return None
+
+
+class PixelVerifier:
+    """
+    An action landed if it changed the colour of a pixel: the clicked point itself for the ops in ops (a selected menu
+    entry or brush is highlighted, a set square changes its colour), or a fixed probe point per op, e.g. the elevation
+    readout for key presses. pixel is called with (x, y) and returns the colour, e.g. pyautogui.pixel.
+
+    Clicks that should not change their pixel get no verdict: a menu or brush button that already shows the colour it
+    had after an earlier click landed on it, and a square that was already set with the current selection (menu entry,
+    brush size and elevation steps) since the last resize click, e.g. by a larger brush.
+    """
+    def __init__(self, pixel, ops=(OP_MENU, OP_BRUSH, OP_SQUARE), probe_points: Optional[Dict[int, Tuple[int, int]]] = None):
+        self.pixel = pixel
+        self.ops = ops
+        self.probe_points = probe_points if probe_points is not None else {}
+        # colour of a highlighted button per probe point, learnt from the clicks that landed on it
+        self.highlights = {}
+        # (menu entry, brush size, elevation steps) and the squares of the visible map window set with each
+        self.selection = (None, 1, 0)
+        self.painted = {}
+
+    def _probe(self, op, point):
+        if op in self.probe_points:
+            return self.probe_points[op]
+        if op in self.ops and point is not None:
+            return point
+        return None
+
+    def _track(self, op, value):
+        entry, brush, steps = self.selection
+        if op == OP_RESIZE:
+            self.painted = {}
+        elif op == OP_MENU:
+            self.selection = (value, brush, steps)
+        elif op == OP_BRUSH:
+            self.selection = (entry, value, steps)
+        elif op == OP_KEY:
+            self.selection = (entry, brush, steps + (1 if value == '+' else -1))
+        elif op == OP_SQUARE and value is not None:
+            radius = brush // 2
+            for x in range(value[0] - radius, value[0] + radius + 1):
+                for y in range(value[1] - radius, value[1] + radius + 1):
+                    self.painted[(x, y)] = self.selection
+
+    def sample(self, op, point, value=None):
+        probe = self._probe(op, point)
+        if probe is None:
+            return None
+        if op == OP_SQUARE and value is not None and self.painted.get(tuple(value)) == self.selection:
+            return None
+        colour = tuple(self.pixel(probe[0], probe[1]))
+        if op in (OP_MENU, OP_BRUSH) and self.highlights.get(probe) == colour:
+            return None
+        return colour
+
+    def verify(self, op, point, before, value=None) -> Optional[bool]:
+        landed = None
+        if before is not None:
+            probe = self._probe(op, point)
+            after = tuple(self.pixel(probe[0], probe[1]))
+            landed = after != tuple(before)
+            if landed and op in (OP_MENU, OP_BRUSH):
+                self.highlights[probe] = after
+        # a missed click is sent again, it only changes the selection once it landed
+        if landed is not False or op not in RETRY_OPS:
+            self._track(op, value)
+        return landed
+
+
+class PacedBackend:
+    """
+    Wraps a replay backend (click, key, sleep) whose own delays are switched off: waits for the pacer's budget after
+    every action, lets the verifier check the result and sends clicks in RETRY_OPS again (up to retries times) when they
+    missed. The settle sleeps of the plan follow key presses and resize clicks and are covered by their budget. Every
+    action is flushed before it is verified, so a batching backend sends one action per batch; get_backend therefore only
+    combines pacing with drivers that send one event at a time.
+    """
+    def __init__(self, backend, pacer: AdaptivePacer, verifier=None, retries: int = 2):
+        self.backend = backend
+        self.pacer = pacer
+        self.verifier = verifier if verifier is not None else NullVerifier()
+        self.retries = retries
+
+    def _send(self, op, point, value, send):
+        cls = PACING_CLASSES[op]
+        for attempt in range(self.retries + 1):
+            before = self.verifier.sample(op, point, value)
+            send()
+            self.backend.sleep(self.pacer.delay(cls))
+            self.flush()
+            landed = self.verifier.verify(op, point, before, value)
+            self.pacer.update(cls, landed)
+            if landed is not False or op not in RETRY_OPS:
+                return
+
+    def click(self, point, op=None, value=None):
+        self._send(op, point, value, lambda: self.backend.click(point, op, value))
+
+    def key(self, key):
+        self._send(OP_KEY, None, key, lambda: self.backend.key(key))
+
+    def sleep(self, seconds):
+        pass
+
+    def flush(self):
+        if hasattr(self.backend, 'flush'):
+            self.backend.flush()
@@ -0,0 +1,340 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas
+import skimage.io
+
+from profiles.general.constants import *
+from editor_utils.canvas import get_geometry
+from editor_utils.journal import plan_state
+from editor_utils.plan import *
+from editor_utils.planner import compile_plan, get_layer, get_menu_dict, set_height
+from editor_utils.replay import square_position
+
+# root mean squared difference (0-255 per colour channel) up to which a square still looks like a reference
+MAX_PATCH_DISTANCE = 40.0
+
+# Squares are labelled 'z<elevation>' or with the selected '<menu>|<cat1>|<cat2>|<direction>' they were painted with.
+
+
+def height_label(height: int) -> str:
+    return 'z{}'.format(int(height))
+
+
+def ground_label(menu_state: List) -> str:
+    return '|'.join(name if name is not None else '' for name in menu_state)
+
+
+def page_ranges(plan: ActionPlan, start: int = 0) -> List[Tuple[Optional[int], int, int]]:
+    """
+    Split the actions from start on at the page starts. Returns (page_start, begin, end) per page, where page_start is
+    the index of the page action, which lies before begin when start is in the middle of a page. The resize clicks that
+    restore the map size after the last page form a range of their own with page_start None.
+    """
+    page_starts = np.nonzero(plan.ops[:, 0] == OP_PAGE)[0].tolist()
+    other = np.nonzero(~np.isin(plan.ops[:, 0], (OP_RESIZE, OP_SLEEP)))[0]
+    tail = int(other[-1]) + 1 if len(other) > 0 else 0
+    before = [idx for idx in page_starts if idx <= start]
+
+    ranges = []
+    page_start = before[-1] if len(before) > 0 else start
+    begin = start
+    for end in [idx for idx in page_starts if idx > start] + [max(tail, start)]:
+        if end > begin:
+            ranges.append((page_start, begin, end))
+        page_start = begin = end
+    if len(plan) > begin:
+        ranges.append((None, begin, len(plan)))
+
+    return ranges
+
+
+def ground_start(plan: ActionPlan, start: int, end: int) -> Optional[int]:
+    """
+    Index of the first menu or brush click in [start, end), where the ground of a page starts, None if it has none.
+    """
+    clicks = np.nonzero(np.isin(plan.ops[start:end, 0], (OP_MENU, OP_BRUSH)))[0]
+    return start + int(clicks[0]) if len(clicks) > 0 else None
+
+
+def expected_squares(plan: ActionPlan, start: int, end: int) -> Dict[Tuple[int, int], str]:
+    """
+    Label of every visible square that the actions in [start, end) of one page set, within a layer the last click on a
+    square wins. Squares of a brush group get the menu selection of the checkpoint that ends the group. Squares that
+    several layers set (e.g. a road over grass) are left out, no single reference shows what is painted on them. Painted
+    squares do not show their elevation, only squares without ground are expected to. Squares clicked before the first menu or brush click of the page set elevations (ground groups always start with
+    one, like in telemetry.get_phase), the squares after it ground.
+    """
+    ops = plan.ops[start:end]
+    elevation_mode = True
+    height = plan_state(plan, start)['height']
+    brush = 1
+    labels = {}
+    layers = {}
+    pending = []
+    for op, a, b, c in ops.tolist():
+        if op in (OP_MENU, OP_BRUSH):
+            elevation_mode = False
+        if op == OP_KEY:
+            height += a
+        elif op == OP_BRUSH:
+            brush = a
+        elif op == OP_SQUARE:
+            if elevation_mode:
+                labels[(a, b)] = height_label(height)
+            else:
+                half = int(brush / 2)
+                pending.extend((xx, yy) for xx in range(a - half, a + half + 1) for yy in range(b - half, b + half + 1))
+        elif op == OP_CHECKPOINT and len(pending) > 0:
+            menu_state = plan.meta['checkpoints'][a]
+            if len(menu_state) > 0 and menu_state[0] is not None:
+                layer = get_layer(menu_state[0])
+                label = ground_label(menu_state)
+                for square in pending:
+                    layers.setdefault(square, {})[layer] = label
+            pending = []
+    for square, by_layer in layers.items():
+        if len(by_layer) == 1:
+            labels[square] = next(iter(by_layer.values()))
+        else:
+            labels.pop(square, None)
+
+    n_squares_x, n_squares_y = get_geometry(plan.meta.get('geometry'))['page_n_squares']
+    return {square: label for square, label in labels.items()
+            if 0 <= square[0] < n_squares_x and 0 <= square[1] < n_squares_y}
+
+
+def square_patches(image: np.ndarray, geometry: Optional[Dict] = None) -> np.ndarray:
+    """
+    Centre patches of all visible squares of the canvas geometry (see canvas.CANVAS_GEOMETRY) from a screenshot (height,
+    width, rgb) of the whole screen, indexed by the square's (x, y) on the page. The patches leave out the grid lines.
+    """
+    geometry = get_geometry(geometry)
+    n_squares_x, n_squares_y = geometry['page_n_squares']
+    half_size = int(min(geometry['square_size'])) // 2 - 2
+    patches = np.zeros((n_squares_x, n_squares_y, 2 * half_size, 2 * half_size, 3), dtype=np.uint8)
+    for x in range(n_squares_x):
+        for y in range(n_squares_y):
+            point = square_position(x, y, geometry)
+            patches[x, y] = image[point.y - half_size:point.y + half_size, point.x - half_size:point.x + half_size, :3]
+
+    return patches
+
+
+def read_screenshot(path: str) -> np.ndarray:
+    return skimage.io.imread(path)[:, :, :3]
+
+
+def build_references(image: np.ndarray, labels: Dict[Tuple[int, int], str], geometry: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+    """
+    Reference patch per label, the mean over all squares of a screenshot that are known to show it.
+    """
+    patches = square_patches(image, geometry).astype(float)
+    grouped = {}
+    for (x, y), label in labels.items():
+        grouped.setdefault(label, []).append(patches[x, y])
+
+    return {label: np.mean(group, axis=0) for label, group in grouped.items()}
+
+
+def write_references(references: Dict[str, np.ndarray], path: str):
+    labels = sorted(references)
+    np.savez_compressed(path, labels=np.array(labels, dtype=str), patches=np.array([references[label] for label in labels]))
+
+
+def read_references(path: str) -> Dict[str, np.ndarray]:
+    with np.load(path) as data:
+        return {str(label): patch for label, patch in zip(data['labels'], data['patches'])}
+
+
+def classify_squares(image: np.ndarray, references: Dict[str, np.ndarray], squares, geometry: Optional[Dict] = None) -> Dict[Tuple[int, int], Tuple[str, float]]:
+    """
+    Label of the nearest reference patch and the root mean squared difference to it for each of the given squares.
+    """
+    labels = list(references)
+    reference_patches = np.array([references[label] for label in labels], dtype=float).reshape(len(labels), -1)
+    patches = square_patches(image, geometry)
+    result = {}
+    for x, y in squares:
+        distance = np.sqrt(np.mean(np.square(reference_patches - patches[x, y].reshape(1, -1).astype(float)), axis=1))
+        nearest = int(np.argmin(distance))
+        result[(x, y)] = (labels[nearest], float(distance[nearest]))
+
+    return result
+
+
+def failed_squares(image: np.ndarray, references: Dict[str, np.ndarray], expected: Dict[Tuple[int, int], str],
+                   max_distance: float = MAX_PATCH_DISTANCE, geometry: Optional[Dict] = None) -> Dict[Tuple[int, int], str]:
+    """
+    Squares whose screenshot does not look like their expected label: another reference is nearer or it differs by more
+    than max_distance from all. Squares with a label that has no reference are not checked.
+    """
+    checked = [square for square, label in expected.items() if label in references]
+    classified = classify_squares(image, references, checked, geometry)
+    return {square: expected[square] for square in checked
+            if classified[square][0] != expected[square] or classified[square][1] > max_distance}
+
+
+def render_page(references: Dict[str, np.ndarray], labels: Dict[Tuple[int, int], str], geometry: Optional[Dict] = None) -> np.ndarray:
+    """
+    Screenshot of a page whose squares show the reference patch of their label, black elsewhere.
+    """
+    geometry = get_geometry(geometry)
+    half_size = int(min(geometry['square_size'])) // 2 - 2
+    image = np.zeros((geometry['lower_right'][1] + half_size, geometry['lower_right'][0] + half_size, 3), dtype=np.uint8)
+    for (x, y), label in labels.items():
+        point = square_position(x, y, geometry)
+        image[point.y - half_size:point.y + half_size, point.x - half_size:point.x + half_size] = np.round(references[label]).astype(np.uint8)
+
+    return image
+
+
+def self_check(references: Dict[str, np.ndarray], expected: Dict[Tuple[int, int], str], n_failed: int = 10, seed: int = 0,
+               geometry: Optional[Dict] = None) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    Check failed_squares offline against the references: render the expected page with n_failed of its squares showing
+    the reference of another label instead. Returns the squares that were planted and those found failed, which match
+    unless two references are too alike to tell apart.
+    """
+    checked = sorted(square for square, label in expected.items() if label in references)
+    labels = sorted(references)
+    if len(labels) < 2:
+        raise ValueError('The self check needs references of at least two labels, got {}.'.format(len(labels)))
+
+    rng = np.random.default_rng(seed)
+    planted = [checked[i] for i in sorted(rng.choice(len(checked), min(n_failed, len(checked)), replace=False))]
+    shown = {square: expected[square] for square in checked}
+    for square in planted:
+        others = [label for label in labels if label != expected[square]]
+        shown[square] = others[rng.integers(len(others))]
+
+    failed = failed_squares(render_page(references, shown, geometry), references, expected, geometry=geometry)
+    return planted, sorted(failed)
+
+
+def repair_plan(plan: ActionPlan, failed: Dict[Tuple[int, int], str], end: int, menu_dict) -> ActionPlan:
+    """
+    Actions that click the failed squares again with single square brushes and afterwards restore the elevation and
+    menu selection the plan expects at action end. The elevations are repaired first, the editor cannot set elevations
+    after a menu click.
+    """
+    state = plan_state(plan, end)
+    repair = ActionPlan(plan.profile, meta={'geometry': plan.meta['geometry']} if 'geometry' in plan.meta else None)
+    height = state['height']
+    by_label = {}
+    for square, label in failed.items():
+        by_label.setdefault(label, []).append(square)
+
+    heights = sorted((int(label[1:]), squares) for label, squares in by_label.items() if label.startswith('z'))
+    for target, squares in heights:
+        set_height(repair, height, target)
+        height = target
+        for x, y in sorted(squares):
+            repair.square(x, y)
+    set_height(repair, height, state['height'])
+
+    for label, squares in sorted(by_label.items()):
+        if label.startswith('z'):
+            continue
+        for name in label.split('|'):
+            if name in menu_dict:
+                repair.menu(name)
+        repair.brush(1)
+        for x, y in sorted(squares):
+            repair.square(x, y)
+
+    if any(not label.startswith('z') for label in by_label):
+        for name in state['menu']:
+            if name is not None:
+                repair.menu(name)
+
+    return repair
+
+
+def repair_in_order(repair: ActionPlan, failed: Dict[Tuple[int, int], str]) -> bool:
+    """
+    Whether a repair plan sets all failed elevations before its first menu click and presses no keys after it.
+    """
+    ops = repair.ops[:, 0]
+    menu_clicks = np.nonzero(ops == OP_MENU)[0]
+    first_menu = int(menu_clicks[0]) if len(menu_clicks) > 0 else len(ops)
+    n_heights = sum(label.startswith('z') for label in failed.values())
+    return int((ops[:first_menu] == OP_SQUARE).sum()) == n_heights and not (ops[first_menu:] == OP_KEY).any()
+
+
+def mixed_page(profile: str = 'cold_war', n_squares: Tuple[int, int] = (24, 20)) -> Tuple[ActionPlan, Dict[str, np.ndarray]]:
+    """
+    Plan of a one page map with elevation steps everywhere, two ground types on the left two thirds and a road across
+    them, like a converted OSM map, and a reference patch of a flat colour per label of its page.
+    """
+    x, y = [v.ravel() for v in np.meshgrid(np.arange(n_squares[0]), np.arange(n_squares[1]), indexing='ij')]
+    third = n_squares[0] // 3
+    menu = np.select((x < third, x < 2 * third), ('Ground 1', 'Ground 2'), '')
+    cat1 = np.select((x < third, x < 2 * third), ('Grass', 'Mud'), '')
+    ground = pandas.DataFrame({'x': x, 'y': y, 'z': 100 + x // 4, 'menu': menu, 'cat1': cat1, 'cat2': '', 'direction': ''})
+    road = pandas.DataFrame({'x': np.arange(n_squares[0]), 'y': n_squares[1] // 2, 'z': -1, 'menu': 'Roads', 'cat1': 'Paved 1', 'cat2': '', 'direction': ''})
+    plan = compile_plan(pandas.concat((ground, road), ignore_index=True).assign(done=0), profile)
+
+    page_start, _, end = [page for page in page_ranges(plan) if page[0] is not None][0]
+    geometry = get_geometry(plan.meta.get('geometry'))
+    half_size = int(min(geometry['square_size'])) // 2 - 2
+    labels = sorted(set(expected_squares(plan, page_start, end).values()))
+    colours = np.random.default_rng(0).integers(0, 256, (len(labels), 3))
+    return plan, {label: np.full((2 * half_size, 2 * half_size, 3), colour, dtype=float) for label, colour in zip(labels, colours)}
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Check a screenshot of a page against a compiled plan, or build reference patches from the screenshot of a page that is known to be correct.')
+    arg_parser.add_argument('-p', '--plan', required=False, help='compiled plan (.npz)')
+    arg_parser.add_argument('-s', '--screenshot', required=False, help='screenshot of the whole screen after the page was finished')
+    arg_parser.add_argument('-n', '--page', required=False, default=0, type=int, help='ordinal of the page in the plan')
+    arg_parser.add_argument('-r', '--references', required=False, help='reference patches (.npz)')
+    arg_parser.add_argument('--write-references', required=False, action='store_true', default=False, help='add the squares of this page to the references instead of checking it')
+    arg_parser.add_argument('--self-check', required=False, type=int, metavar='N', help='instead of a screenshot, check the references on a rendered page with N wrong squares '
+                            'and their repair, without -p and -r on a built-in page with elevation and ground')
+    args = arg_parser.parse_args()
+
+    if args.plan is None and args.self_check is not None:
+        plan, references = mixed_page()
+    else:
+        plan = read_plan(args.plan)
+        references = read_references(args.references) if args.self_check is not None else None
+    page_start, _, end = [page for page in page_ranges(plan) if page[0] is not None][args.page]
+    expected = expected_squares(plan, page_start, end)
+    if args.self_check is not None:
+        planted, failed = self_check(references, expected, args.self_check, geometry=plan.meta.get('geometry'))
+        failed = {square: expected[square] for square in failed}
+        in_order = repair_in_order(repair_plan(plan, failed, end, get_menu_dict(plan.profile)), failed)
+        print('{} of {} planted squares found ({} elevations), {} found that were not planted, repair {}'.format(
+            len(set(planted) & set(failed)), len(planted), sum(label.startswith('z') for label in failed.values()),
+            len(set(failed) - set(planted)), 'in order' if in_order else 'sets elevations after a menu click'))
+        exit(0 if planted == sorted(failed) and in_order else 1)
+    image = read_screenshot(args.screenshot)
+
+    if args.write_references:
+        references = build_references(image, expected, plan.meta.get('geometry'))
+        try:
+            references = {**read_references(args.references), **references}
+        except FileNotFoundError:
+            pass
+        write_references(references, args.references)
+        print('{} reference labels in {}'.format(len(references), args.references))
+    else:
+        failed = failed_squares(image, read_references(args.references), expected, geometry=plan.meta.get('geometry'))
+        print('{} of {} squares failed: {}'.format(len(failed), len(expected), sorted(failed)))
@@ -0,0 +1,192 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Every action is stored as one row of four int32 values: (op, a, b, c).
+#   OP_PAGE    a = i_page_x, b = i_page_y, c = page ordinal
+#   OP_RESIZE  a = index into RESIZE_BUTTONS
+#   OP_MENU    a = index into the plan's name table
+#   OP_BRUSH   a = brush size (1, 3, 7 or 15)
+#   OP_SQUARE  a = x, b = y (square on the current page, origin lower left)
+#   OP_KEY     a = +1 ('+') or -1 ('-')
+#   OP_SLEEP   a = duration in ms
+#   OP_CHECKPOINT a = index into meta['checkpoints'], the menu selection at this point; the run can be resumed here
+OP_PAGE = 0
+OP_RESIZE = 1
+OP_MENU = 2
+OP_BRUSH = 3
+OP_SQUARE = 4
+OP_KEY = 5
+OP_SLEEP = 6
+OP_CHECKPOINT = 7
+
+OP_NAMES = ['page', 'resize', 'menu', 'brush', 'square', 'key', 'sleep', 'checkpoint']
+
+RESIZE_BUTTONS = [
+    'POS_HORIZONTAL_PLUS',
+    'POS_HORIZONTAL_MINUS',
+    'POS_HORIZONTAL_PLUS2',
+    'POS_HORIZONTAL_MINUS2',
+    'POS_VERTICAL_PLUS',
+    'POS_VERTICAL_MINUS',
+    'POS_VERTICAL_PLUS2',
+    'POS_VERTICAL_MINUS2',
+]
+
+# effect of each resize button on the visible map window (left, right, bottom, top), in squares
+RESIZE_EFFECTS = {
+    'POS_HORIZONTAL_PLUS': (-2, 0, 0, 0),
+    'POS_HORIZONTAL_MINUS': (2, 0, 0, 0),
+    'POS_HORIZONTAL_PLUS2': (0, 2, 0, 0),
+    'POS_HORIZONTAL_MINUS2': (0, -2, 0, 0),
+    'POS_VERTICAL_PLUS': (0, 0, 0, 2),
+    'POS_VERTICAL_MINUS': (0, 0, 0, -2),
+    'POS_VERTICAL_PLUS2': (0, 0, -2, 0),
+    'POS_VERTICAL_MINUS2': (0, 0, 2, 0),
+}
+
+BRUSH_SIZES = [1, 3, 7, 15]
+
+# version 2 added OP_CHECKPOINT, version 1 plans can still be read
+PLAN_FORMAT_VERSION = 2
+
+
+class ActionPlan:
+    """
+    Compiled sequence of editor actions. Compiling is done by editor_utils.planner, replaying by editor_utils.replay.
+    """
+    def __init__(self, profile: str, ops: Optional[np.ndarray] = None, names: Optional[List[str]] = None, meta: Optional[Dict] = None):
+        self.profile = profile
+        self.names = list(names) if names is not None else []
+        self.meta = dict(meta) if meta is not None else {}
+        self._name_idx = {name: idx for idx, name in enumerate(self.names)}
+        self._rows = []
+        self._ops = ops if ops is not None else np.zeros((0, 4), dtype=np.int32)
+        self.n_pages = int((self._ops[:, 0] == OP_PAGE).sum())
+
+    @property
+    def ops(self) -> np.ndarray:
+        if len(self._rows) > 0:
+            self._ops = np.concatenate((self._ops, np.array(self._rows, dtype=np.int32).reshape(-1, 4)))
+            self._rows = []
+        return self._ops
+
+    def __len__(self):
+        return len(self._ops) + len(self._rows)
+
+    def _append(self, op, a=0, b=0, c=0):
+        self._rows.append((op, a, b, c))
+
+    def name_index(self, name: str) -> int:
+        if name not in self._name_idx:
+            self._name_idx[name] = len(self.names)
+            self.names.append(name)
+        return self._name_idx[name]
+
+    def page(self, i_page_x: int, i_page_y: int, ordinal: Optional[int] = None):
+        self._append(OP_PAGE, i_page_x, i_page_y, self.n_pages if ordinal is None else ordinal)
+        self.n_pages += 1
+
+    def resize(self, button: str):
+        self._append(OP_RESIZE, RESIZE_BUTTONS.index(button))
+
+    def menu(self, name: str):
+        self._append(OP_MENU, self.name_index(name))
+
+    def brush(self, size: int):
+        self._append(OP_BRUSH, size)
+
+    def square(self, x: int, y: int):
+        self._append(OP_SQUARE, x, y)
+
+    def key(self, step: int):
+        self._append(OP_KEY, step)
+
+    def sleep(self, seconds: float):
+        self._append(OP_SLEEP, int(round(seconds * 1000)))
+
+    def checkpoint(self, menu_state: Optional[List] = None):
+        """
+        menu_state: selected [menu, cat1, cat2, direction], by default that of the previous checkpoint.
+        """
+        checkpoints = self.meta.setdefault('checkpoints', [])
+        if menu_state is None:
+            menu_state = checkpoints[-1] if len(checkpoints) > 0 else []
+        self._append(OP_CHECKPOINT, len(checkpoints))
+        checkpoints.append(list(menu_state))
+
+    def counts(self) -> Dict[str, int]:
+        ops = self.ops[:, 0]
+        return {OP_NAMES[op]: int((ops == op).sum()) for op in range(len(OP_NAMES))}
+
+
+def format_op(plan: ActionPlan, row) -> str:
+    op, a, b, c = (int(v) for v in row)
+    if op == OP_PAGE:
+        return 'page {} {} #{}'.format(a, b, c)
+    elif op == OP_RESIZE:
+        return 'resize {}'.format(RESIZE_BUTTONS[a])
+    elif op == OP_MENU:
+        return 'menu {}'.format(plan.names[a])
+    elif op == OP_BRUSH:
+        return 'brush {}'.format(a)
+    elif op == OP_SQUARE:
+        return 'square {} {}'.format(a, b)
+    elif op == OP_KEY:
+        return 'key {}'.format('+' if a > 0 else '-')
+    elif op == OP_SLEEP:
+        return 'sleep {}'.format(a)
+    elif op == OP_CHECKPOINT:
+        return 'checkpoint {}'.format(a)
+    return 'unknown {} {} {} {}'.format(op, a, b, c)
+
+
+def write_plan(plan: ActionPlan, path: str):
+    """
+    Write a plan to disk. Paths ending in '.txt' get a human readable (diffable) dump with one action per line,
+    everything else is stored as compressed npz which can be replayed.
+    """
+    if path.endswith('.txt'):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('# profile: {}\n'.format(plan.profile))
+            for key, value in plan.meta.items():
+                f.write('# {}: {}\n'.format(key, json.dumps(value)))
+            for row in plan.ops:
+                f.write(format_op(plan, row) + '\n')
+    else:
+        np.savez_compressed(
+            path,
+            ops=plan.ops,
+            names=np.array(plan.names, dtype=str),
+            profile=np.array(plan.profile),
+            meta=np.array(json.dumps(plan.meta)),
+            version=np.array(PLAN_FORMAT_VERSION),
+        )
+
+
+def read_plan(path: str) -> ActionPlan:
+    with np.load(path) as data:
+        if int(data['version']) > PLAN_FORMAT_VERSION:
+            raise ValueError('{} has plan format version {}, expected at most {}.'.format(path, int(data['version']), PLAN_FORMAT_VERSION))
+        return ActionPlan(
+            profile=str(data['profile']),
+            ops=data['ops'].astype(np.int32),
+            names=[str(name) for name in data['names']],
+            meta=json.loads(str(data['meta'])),
+        )
@@ -0,0 +1,637 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import importlib
+from typing import Dict, Optional
+
+import numpy as np
+import pandas
+
+from profiles.general.constants import *
+from editor_utils.brush_cover import brush_cover, layered_brush_cover
+from editor_utils.canvas import get_geometry
+from editor_utils.click_order import order_clicks
+from editor_utils.elevation_fit import thin_heights
+from editor_utils.map_format import read_map
+from editor_utils.plan import *
+
+KEY_SLEEP = 0.1
+RESIZE_SLEEP = 0.05
+
+# the editor keeps one entry per square and layer, painting only replaces the entry in the layer of the selected menu
+MENU_LAYERS = {
+    'Ground 1': 'ground',
+    'Ground 2': 'ground',
+    'Ground 3': 'ground',
+}
+
+# menus whose groups are painted with large brushes
+BRUSH_MENUS = ('Ground', 'Brush')
+LAYERED_BRUSH_MENUS = ('Ground', 'Brush', 'Foliage')
+BRUSH_PLANNERS = ['greedy', 'layered']
+PAGE_ORDERS = ['rows', 'planned']
+
+
+def get_menu_dict(profile: str):
+    return importlib.import_module('profiles.{}.menu'.format(profile)).MENU_DICT
+
+
+def get_default_ground(profile: str):
+    """
+    Ground entry (menu, cat1) of a new map in the editor, None if the profile does not know it.
+    """
+    return getattr(importlib.import_module('profiles.{}.menu'.format(profile)), 'DEFAULT_GROUND', None)
+
+
+def get_layer(menu: str) -> str:
+    return MENU_LAYERS.get(menu, menu)
+
+
+def load_map(filepath: str) -> pandas.DataFrame:
+    """
+    Read a map csv-file, npz map bundle or Parquet file (see map_format).
+    """
+    map_df = read_map(filepath)
+    if not pandas.api.types.is_integer_dtype(map_df.z):
+        map_df.z = map_df.z.round().astype(int)
+
+    if 'done' not in map_df:
+        map_df['done'] = 0
+
+    return map_df
+
+
+def set_height(plan: ActionPlan, current_height, target_height):
+    if current_height == target_height:
+        return
+    elif current_height < target_height:
+        step = 1
+    else:
+        step = -1
+
+    for i in range(abs(target_height - current_height)):
+        plan.key(step)
+        plan.sleep(KEY_SLEEP)
+
+
+def process_segment(plan: ActionPlan, grid: pandas.DataFrame, start_height, descending=False, click_order='tour'):
+    # z < 0 marks squares without elevation data (ground only or the map size marker)
+    grid = grid[grid.z >= 0]
+    if len(grid) == 0:
+        return start_height
+
+    # the squares of every height level are a slice of the rows sorted by height (stable, rows keep their order)
+    z = grid.z.values
+    by_height = np.argsort(z, kind='stable')
+    z_sorted = z[by_height]
+    x_sorted = grid.x.values[by_height]
+    y_sorted = grid.y.values[by_height]
+    values, level_starts = np.unique(z_sorted, return_index=True)
+    level_ends = np.append(level_starts[1:], len(z_sorted))
+    levels = list(zip(values.tolist(), level_starts, level_ends))
+    if descending:
+        levels.reverse()
+
+    height = start_height
+    cursor = None
+    for val, level_start, level_end in levels:
+        set_height(plan, height, val)
+        height = val
+
+        x_values = x_sorted[level_start:level_end]
+        y_values = y_sorted[level_start:level_end]
+        order = order_clicks(x_values, y_values, click_order, cursor)
+        for x, y in zip(x_values[order], y_values[order]):
+            plan.square(x, y)
+        cursor = (x_values[order[-1]], y_values[order[-1]])
+        plan.checkpoint()
+
+    return height
+
+
+def _resize(plan: ActionPlan, button: str):
+    plan.resize(button)
+    plan.sleep(RESIZE_SLEEP)
+
+
+def set_n_squares(plan: ActionPlan, start_n_x, start_n_y, n_x, n_y, mode='window'):
+    n_clicks_x = abs(int((start_n_x - n_x) / 2))
+    n_clicks_y = abs(int((start_n_y - n_y) / 2))
+
+    for i in range(n_clicks_x):
+        if n_x <= start_n_x:
+            if mode in ('window', 'finish'):
+                _resize(plan, 'POS_HORIZONTAL_PLUS2')
+            if mode in ('window', 'init'):
+                _resize(plan, 'POS_HORIZONTAL_MINUS')
+        else:
+            if mode in ('window', 'init'):
+                _resize(plan, 'POS_HORIZONTAL_PLUS')
+            if mode in ('window', 'finish'):
+                _resize(plan, 'POS_HORIZONTAL_MINUS2')
+
+    for i in range(n_clicks_y):
+        if n_y <= start_n_y:
+            if mode in ('window', 'finish'):
+                _resize(plan, 'POS_VERTICAL_PLUS2')
+            if mode in ('window', 'init'):
+                _resize(plan, 'POS_VERTICAL_MINUS')
+        else:
+            if mode in ('window', 'init'):
+                _resize(plan, 'POS_VERTICAL_PLUS')
+            if mode in ('window', 'finish'):
+                _resize(plan, 'POS_VERTICAL_MINUS2')
+
+
+def restore_window(plan: ActionPlan, window, target_window):
+    """
+    Move the edges of the map window (left, right, bottom, top offsets, see plan.RESIZE_EFFECTS) from window to target_window. Unlike
+    set_n_squares this also handles a window of the wrong size, e.g. when a run stopped between the two clicks that shift
+    the window. On each axis an edge is moved outwards before the other one is moved inwards.
+    """
+    # buttons that move each edge up and down
+    edge_buttons = [
+        ('POS_HORIZONTAL_MINUS', 'POS_HORIZONTAL_PLUS'),
+        ('POS_HORIZONTAL_PLUS2', 'POS_HORIZONTAL_MINUS2'),
+        ('POS_VERTICAL_MINUS2', 'POS_VERTICAL_PLUS2'),
+        ('POS_VERTICAL_PLUS', 'POS_VERTICAL_MINUS'),
+    ]
+    for lower_edge, upper_edge in ((0, 1), (2, 3)):
+        grow, shrink = [], []
+        for edge in (lower_edge, upper_edge):
+            up, down = edge_buttons[edge]
+            n_clicks = int(abs(target_window[edge] - window[edge]) / 2)
+            if target_window[edge] > window[edge]:
+                (grow if edge == upper_edge else shrink).extend([up] * n_clicks)
+            else:
+                (shrink if edge == upper_edge else grow).extend([down] * n_clicks)
+        for i in range(max(len(grow), len(shrink))):
+            if i < len(grow):
+                _resize(plan, grow[i])
+            if i < len(shrink):
+                _resize(plan, shrink[i])
+
+
+def get_brush_groups(group: pandas.DataFrame):
+    xmin, ymin = group.loc[:,['x','y']].min()
+    xmax, ymax = group.loc[:,['x','y']].max()
+
+    xy_mat = np.full((xmax-xmin+1, ymax-ymin+1), -1, dtype=int)
+    xy_mat[group.x.values - xmin, group.y.values - ymin] = np.arange(len(group))
+
+    centres = brush_cover(xy_mat >= 0)
+
+    brush_groups = []
+    for brush_size in (1, 3, 7, 15):
+        if len(centres[brush_size]) > 0:
+            brush_idx = np.sort(xy_mat[centres[brush_size][:, 0], centres[brush_size][:, 1]])
+            brush_groups.append((brush_size, group.x.values[brush_idx], group.y.values[brush_idx]))
+
+    return brush_groups
+
+
+def get_layered_brush_groups(groups):
+    """
+    Plan the brush clicks for all groups of one layer together, see brush_cover.layered_brush_cover. Squares that appear
+    in several groups keep the last one, as they would when the groups are painted one after another.
+    Returns (group_info, brush_groups) in painting order.
+    """
+    x_min = min(group.x.min() for _, group in groups)
+    y_min = min(group.y.min() for _, group in groups)
+    x_max = max(group.x.max() for _, group in groups)
+    y_max = max(group.y.max() for _, group in groups)
+
+    labels = np.full((x_max - x_min + 1, y_max - y_min + 1), -1, dtype=int)
+    for label, (_, group) in enumerate(groups):
+        labels[group.x.values - x_min, group.y.values - y_min] = label
+
+    layered_groups = []
+    for label, centres in layered_brush_cover(labels):
+        brush_groups = []
+        for brush_size in (1, 3, 7, 15):
+            if len(centres[brush_size]) > 0:
+                brush_groups.append((brush_size, centres[brush_size][:, 0] + x_min, centres[brush_size][:, 1] + y_min))
+        layered_groups.append((groups[label][0], brush_groups))
+
+    return layered_groups
+
+
+def get_menu_clicks(menu_state, group_info, menu_dict):
+    """
+    Menu entries to click to select group_info when the editor is in menu_state, and the state afterwards. Selecting a
+    menu resets the categories and selecting cat1 resets cat2, the direction is kept until another one is selected.
+    """
+    menu, cat1, cat2, direction = group_info
+    state = dict(menu_state)
+    clicks = []
+    if state.get('menu') != menu:
+        clicks.append(menu)
+        state.update(menu=menu, cat1=None, cat2=None)
+    has_cat2 = cat2 in menu_dict
+    if state.get('cat1') != cat1 or (not has_cat2 and state.get('cat2') is not None):
+        clicks.append(cat1)
+        state.update(cat1=cat1, cat2=None)
+    if has_cat2 and state.get('cat2') != cat2:
+        clicks.append(cat2)
+        state['cat2'] = cat2
+    if direction in menu_dict and state.get('direction') != direction:
+        clicks.append(direction)
+        state['direction'] = direction
+
+    return clicks, state
+
+
+def order_paint_blocks(blocks, menu_state, menu_dict):
+    """
+    Order blocks of (group_info, brush_groups) so that few menu clicks are needed between them: starting from the current
+    editor state, the block that is cheapest to switch to comes next, ties in the order of the blocks.
+    """
+    remaining = list(blocks)
+    ordered = []
+    state = menu_state
+    while remaining:
+        costs = [len(get_menu_clicks(state, block[0][0], menu_dict)[0]) for block in remaining]
+        block = remaining.pop(int(np.argmin(costs)))
+        ordered.append(block)
+        state = get_menu_clicks(state, block[-1][0], menu_dict)[1]
+
+    return ordered
+
+
+def set_ground(plan: ActionPlan, df: pandas.DataFrame, menu_dict, click_order='tour', brush_planner='greedy', menu_state=None):
+    """
+    brush_planner: 'greedy' uses large brushes only where the whole window belongs to one group, 'layered' plans the
+    groups of a layer together and lets large brushes paint over squares that are painted again by a later group.
+    menu_state: the selected menu entries, updated in place, so that entries that are already selected are not clicked
+    again on the next page.
+    """
+    if menu_state is None:
+        menu_state = {}
+
+    df = df[df.menu.isin(menu_dict.keys()) & df.cat1.isin(menu_dict.keys())]
+    df = df.sort_values(by=['menu', 'cat1', 'cat2', 'direction'], kind='stable')
+    # a square keeps the last group painted on its layer, the others need not be clicked
+    df = df[~df.assign(layer=df.menu.map(get_layer)).duplicated(subset=['layer', 'x', 'y'], keep='last')]
+    groups = list(df.groupby(by=['menu', 'cat1', 'cat2', 'direction'], observed=True))
+
+    if brush_planner == 'layered':
+        layer_groups = {}
+        for group_info, group in groups:
+            if group_info[0].startswith(LAYERED_BRUSH_MENUS):
+                layer_groups.setdefault(get_layer(group_info[0]), []).append((group_info, group))
+    elif brush_planner == 'greedy':
+        layer_groups = {}
+    else:
+        raise ValueError('Unknown brush planner {}, expected one of {}.'.format(brush_planner, BRUSH_PLANNERS))
+
+    # the groups of a layered layer are painted in one block in their planned order, all other groups on their own
+    blocks = []
+    for group_info, group in groups:
+        layer = get_layer(group_info[0])
+        if layer in layer_groups:
+            if layer_groups[layer] is not None:
+                blocks.append(get_layered_brush_groups(layer_groups[layer]))
+                layer_groups[layer] = None
+        elif group_info[0].startswith(BRUSH_MENUS):
+            blocks.append([(group_info, get_brush_groups(group))])
+        else:
+            blocks.append([(group_info, [(1, group.x.values, group.y.values)])])
+
+    for block in order_paint_blocks(blocks, menu_state, menu_dict):
+        for group_info, brush_groups in block:
+            clicks, new_state = get_menu_clicks(menu_state, group_info, menu_dict)
+            for name in clicks:
+                plan.menu(name)
+            menu_state.update(new_state)
+
+            for brush_size, x_values, y_values in brush_groups:
+                plan.brush(brush_size)
+                order = order_clicks(x_values, y_values, click_order)
+                for x, y in zip(x_values[order], y_values[order]):
+                    plan.square(x, y)
+
+            plan.checkpoint([menu_state.get(key) for key in ('menu', 'cat1', 'cat2', 'direction')])
+
+
+def get_pages(map_df: pandas.DataFrame, geometry: Optional[Dict] = None):
+    """
+    Split the map into editor pages of the size of the canvas geometry (see canvas.CANVAS_GEOMETRY). Returns the total
+    map size and a list of page dicts holding the page index, the map size the editor has to be set to, the page origin
+    in map coordinates and the rows of the page in page coordinates, in the order in which the pages are visited.
+    """
+    page_n_x, page_n_y = get_geometry(geometry)['page_n_squares']
+    total_n_squares_x = int(map_df.x.max()) + 1
+    total_n_squares_y = int(map_df.y.max()) + 1
+
+    n_pages_x, n_x_remain = np.divmod(total_n_squares_x, page_n_x - PAGE_RIGHT_MARGIN, dtype=int)
+    n_pages_y, n_y_remain = np.divmod(total_n_squares_y, page_n_y - PAGE_TOP_MARGIN - PAGE_BOTTOM_MARGIN, dtype=int)
+    n_x_remain = (np.floor(n_x_remain / 2) * 2).astype(int)
+    n_y_remain = (np.floor(n_y_remain / 2) * 2).astype(int)
+
+    total_n_squares_x = int(n_pages_x * (page_n_x - PAGE_RIGHT_MARGIN) + n_x_remain)
+    total_n_squares_y = int(n_pages_y * (page_n_y - PAGE_TOP_MARGIN - PAGE_BOTTOM_MARGIN) + n_y_remain)
+
+    # Page of every row: pages in x are counted from the right edge, the remainder is the last page on the left, pages
+    # in y from the bottom with the remainder on top. The rows are sorted by page once (stable, so they keep their order
+    # within a page) and every page gets a slice of the sorted rows.
+    x = map_df.x.values.astype(int)
+    y = map_df.y.values.astype(int)
+    page_x = np.where(x < n_x_remain, n_pages_x, (total_n_squares_x - 1 - x) // (page_n_x - PAGE_RIGHT_MARGIN))
+    page_y = np.minimum(y // (page_n_y - PAGE_TOP_MARGIN - PAGE_BOTTOM_MARGIN), n_pages_y)
+    valid = (x >= 0) & (y >= 0) & (x < total_n_squares_x) & (y < total_n_squares_y)
+    page_id = np.where(valid, page_y * (n_pages_x + 1) + page_x, -1)
+
+    order = np.argsort(page_id, kind='stable')
+    page_id = page_id[order]
+    sorted_df = map_df.iloc[order]
+    bounds = np.searchsorted(page_id, np.arange(-1, (n_pages_x + 1) * (n_pages_y + 1) + 1))
+
+    page_info = []
+    origins_x = np.zeros((n_pages_x + 1) * (n_pages_y + 1), dtype=int)
+    origins_y = np.zeros_like(origins_x)
+    for i_page_y in range(n_pages_y + 1):
+        for i_page_x in range(n_pages_x + 1):
+            if i_page_x < n_pages_x:
+                n_squares_x = (i_page_x + 1) * page_n_x - i_page_x * PAGE_RIGHT_MARGIN
+                has_squares_x = True
+                origin_x = total_n_squares_x - (i_page_x + 1) * (page_n_x - PAGE_RIGHT_MARGIN)
+            else:
+                n_squares_x = i_page_x * page_n_x - (i_page_x - 1) * PAGE_RIGHT_MARGIN + n_x_remain #  ?
+                has_squares_x = n_x_remain > 0
+                origin_x = 0
+            if i_page_y < n_pages_y:
+                n_squares_y = (i_page_y + 1) * page_n_y - i_page_y * (PAGE_TOP_MARGIN + PAGE_BOTTOM_MARGIN)
+                has_squares_y = True
+                origin_y = i_page_y * (page_n_y - PAGE_TOP_MARGIN) - (i_page_y + 1) * PAGE_BOTTOM_MARGIN
+            else:
+                n_squares_y = i_page_y * page_n_y - (i_page_y - 1) * (PAGE_TOP_MARGIN + PAGE_BOTTOM_MARGIN) + n_y_remain
+                has_squares_y = n_y_remain > 0
+                origin_y = total_n_squares_y - (page_n_y - PAGE_TOP_MARGIN)
+
+            page = i_page_y * (n_pages_x + 1) + i_page_x
+            origins_x[page] = origin_x
+            origins_y[page] = origin_y
+            if has_squares_x and has_squares_y:
+                page_info.append((page, i_page_x, i_page_y, n_squares_x, n_squares_y, origin_x, origin_y))
+
+    # page coordinates for all rows at once
+    in_page = page_id >= 0
+    local_x = sorted_df.x.values - np.where(in_page, origins_x[page_id], 0)
+    local_y = sorted_df.y.values - np.where(in_page, origins_y[page_id], 0)
+    sorted_df = sorted_df.assign(x=local_x.astype(sorted_df.x.dtype), y=local_y.astype(sorted_df.y.dtype))
+
+    pages = []
+    for page, i_page_x, i_page_y, n_squares_x, n_squares_y, origin_x, origin_y in page_info:
+        pages.append({
+            'i_page_x': i_page_x,
+            'i_page_y': i_page_y,
+            'n_squares_x': int(n_squares_x),
+            'n_squares_y': int(n_squares_y),
+            'origin_x': int(origin_x),
+            'origin_y': int(origin_y),
+            'df': sorted_df.iloc[bounds[page + 1]:bounds[page + 2]],
+        })
+
+    return total_n_squares_x, total_n_squares_y, pages
+
+
+def get_height_range(df: pandas.DataFrame):
+    z = df.z.values[df.z.values >= 0]
+    if len(z) == 0:
+        return None
+    return int(z.min()), int(z.max())
+
+
+def count_height_keys(height_ranges, descending, start_height):
+    n_keys = 0
+    height = start_height
+    for height_range, desc in zip(height_ranges, descending):
+        if height_range is None:
+            continue
+        lo, hi = height_range
+        first, last = (hi, lo) if desc else (lo, hi)
+        n_keys += abs(height - first) + hi - lo
+        height = last
+
+    return n_keys
+
+
+def plan_height_sweeps(height_ranges, start_height):
+    """
+    Choose for every page whether its height levels are set in ascending or descending order, so that the total number of
+    +/- key presses over all pages is minimal. Every page has to cover its whole height range once, so it is cheapest to
+    end at its lowest or highest level; a dynamic program over these two end states gives the optimum for the page order.
+    """
+    costs = {start_height: 0}
+    choices = []
+    for height_range in height_ranges:
+        if height_range is None:
+            choices.append(None)
+            continue
+        lo, hi = height_range
+        new_costs = {}
+        choice = {}
+        for desc, first, last in ((False, lo, hi), (True, hi, lo)):
+            prev = min(costs, key=lambda h: costs[h] + abs(h - first))
+            cost = costs[prev] + abs(prev - first) + hi - lo
+            if last not in new_costs or cost < new_costs[last]:
+                new_costs[last] = cost
+                choice[last] = (desc, prev)
+        costs = new_costs
+        choices.append(choice)
+
+    # backtrack from the cheapest final height
+    height = min(costs, key=costs.get)
+    descending = []
+    for choice in reversed(choices):
+        if choice is None:
+            descending.append(False)
+            continue
+        desc, height = choice[height]
+        descending.append(desc)
+
+    return descending[::-1]
+
+
+def get_window_edges(plan: ActionPlan, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+    """
+    Change of the map window edges (left, right, bottom, top, see plan.RESIZE_EFFECTS) by the resize clicks among the
+    actions start to end of the plan.
+    """
+    ops = plan.ops[start:end]
+    effects = np.array([RESIZE_EFFECTS[name] for name in RESIZE_BUTTONS], dtype=int)
+    return effects[ops[ops[:, 0] == OP_RESIZE, 1]].sum(axis=0)
+
+
+def get_page_windows(pages, start_n_x, start_n_y, start_size_from_file, total_n_squares_x, total_n_squares_y,
+                     page_n_squares=(PAGE_N_SQUARES_X, PAGE_N_SQUARES_Y)):
+    """
+    Window edges in which every page is worked on and in which the map is left at the end, relative to the window at the
+    start. They are found by resizing like the editor always did, visiting all pages row by row.
+    """
+    resizes = ActionPlan('')
+    prev_n_x, prev_n_y = start_n_x, start_n_y
+    window = np.zeros(4, dtype=int)
+    page_windows = []
+    for page in pages:
+        n_squares_x = page['n_squares_x']
+        n_squares_y = page['n_squares_y']
+        n_ops = len(resizes)
+        if (prev_n_x == START_N_SQUARES_X and prev_n_y == START_N_SQUARES_Y) or start_size_from_file:
+            mode = 'init'
+        else:
+            mode = 'window'
+        set_n_squares(resizes, prev_n_x, prev_n_y, n_squares_x, n_squares_y, mode)
+        if start_size_from_file:
+            set_n_squares(resizes, n_squares_x, n_squares_y, n_squares_x - 2, n_squares_y - 2, 'window')
+            start_size_from_file = False
+
+        prev_n_x = n_squares_x
+        prev_n_y = n_squares_y
+        window = window + get_window_edges(resizes, n_ops)
+        page_windows.append(window)
+
+    n_ops = len(resizes)
+    set_n_squares(resizes, total_n_squares_x, total_n_squares_y, page_n_squares[0], page_n_squares[1], 'finish')
+    set_n_squares(resizes, total_n_squares_x, total_n_squares_y, total_n_squares_x, total_n_squares_y - PAGE_TOP_MARGIN, 'window')
+    final_window = window + get_window_edges(resizes, n_ops)
+
+    return page_windows, final_window
+
+
+def count_resize_clicks(windows) -> int:
+    windows = np.asarray(windows)
+    return int(np.abs(np.diff(windows, axis=0)).sum() / 2)
+
+
+def has_pending_rows(df: pandas.DataFrame, menu_dict) -> bool:
+    if (df.z >= 0).any():
+        return True
+    return 'menu' in df.columns and (df.menu.isin(menu_dict.keys()) & df.cat1.isin(menu_dict.keys())).any()
+
+
+def order_pages(pages, page_windows, final_window, page_order='planned', menu_dict=None, start_window=None):
+    """
+    Indices of the pages in the order in which they are visited. 'rows' visits all pages row by row. 'planned' skips the
+    pages without rows to click and takes the order with the fewest resize clicks (from start_window, by default the
+    window at the start) among row by row, serpentine rows, serpentine columns and a tour over the page windows.
+    """
+    if page_order == 'rows':
+        return list(range(len(pages)))
+    elif page_order != 'planned':
+        raise ValueError('Unknown page order {}, expected one of {}.'.format(page_order, PAGE_ORDERS))
+
+    pending = np.array([idx for idx, page in enumerate(pages) if has_pending_rows(page['df'], menu_dict)], dtype=int)
+    if len(pending) < 2:
+        return pending.tolist()
+
+    i_page_x = np.array([pages[idx]['i_page_x'] for idx in pending])
+    i_page_y = np.array([pages[idx]['i_page_y'] for idx in pending])
+    windows = np.array([page_windows[idx] for idx in pending])
+
+    candidates = [
+        np.arange(len(pending)),
+        np.lexsort((np.where(i_page_y % 2 == 0, i_page_x, -i_page_x), i_page_y)),
+        np.lexsort((np.where(i_page_x % 2 == 0, i_page_y, -i_page_y), i_page_x)),
+        order_clicks(windows[:, 0], windows[:, 2], 'tour', (0, 0)),
+    ]
+    start_window = np.zeros((1, 4), dtype=int) if start_window is None else np.reshape(start_window, (1, 4))
+    costs = [count_resize_clicks(np.concatenate((start_window, windows[order], [final_window]))) for order in candidates]
+
+    return pending[candidates[int(np.argmin(costs))]].tolist()
+
+
+def compile_plan(map_df: pandas.DataFrame, profile='cold_war', start_size_from_file=False, height_order='sweep', click_order='tour',
+                 brush_planner='greedy', page_order='planned', elevation_error=None, start_window=None, geometry=None) -> ActionPlan:
+    """
+    Compile the map into an action plan.
+    height_order: 'ascending' sets the height levels of every page in ascending order, 'sweep' alternates ascending and
+    descending pages so that the number of key presses is minimal.
+    click_order: order of the square clicks within a height level or brush group, see click_order.order_clicks.
+    brush_planner: 'greedy' or 'layered', see set_ground.
+    page_order: 'rows' or 'planned', see order_pages.
+    elevation_error: if given, only set the squares the editor needs to interpolate the elevation within this error, see
+    elevation_fit.select_control_points.
+    start_window: edges of the map window at the start relative to the start size, if the editor is not at the start
+    size, e.g. the final window of an earlier plan of the same map compiled with the same start_size_from_file.
+    geometry: canvas geometry (page size, square pitch and position, see canvas.canvas_geometry), by default that of
+    the profiles. It is kept in the plan for replaying it.
+    """
+    menu_dict = get_menu_dict(profile)
+    plan = ActionPlan(profile)
+    geometry = get_geometry(geometry)
+    plan.meta['geometry'] = geometry
+
+    if start_size_from_file:
+        prev_n_x = np.floor(map_df.x.max()).astype(int) + PAGE_RIGHT_MARGIN
+        prev_n_y = np.floor(map_df.y.max()).astype(int) + PAGE_BOTTOM_MARGIN
+    else:
+        prev_n_x = START_N_SQUARES_X
+        prev_n_y = START_N_SQUARES_Y
+
+    plan.meta['start_n_squares'] = [int(prev_n_x), int(prev_n_y)]
+
+    if elevation_error is not None:
+        n_height_rows = int(((map_df.z >= 0) & (map_df.done == 0)).sum())
+        map_df = thin_heights(map_df, elevation_error)
+        plan.meta['height_rows'] = {'all': n_height_rows, 'planned': int(((map_df.z >= 0) & (map_df.done == 0)).sum())}
+
+    # the page layout follows the whole map, rows that are done are only left out when clicking
+    total_n_squares_x, total_n_squares_y, pages = get_pages(map_df, geometry)
+    for page in pages:
+        page['df'] = page['df'][page['df']['done'] == 0]
+    plan.meta['total_n_squares'] = [total_n_squares_x, total_n_squares_y]
+    plan.meta['pages'] = []
+
+    page_windows, final_window = get_page_windows(pages, prev_n_x, prev_n_y, start_size_from_file, total_n_squares_x, total_n_squares_y,
+                                                  geometry['page_n_squares'])
+    start_window = np.zeros(4, dtype=int) if start_window is None else np.array(start_window, dtype=int)
+    page_idx = order_pages(pages, page_windows, final_window, page_order, menu_dict, start_window)
+    plan.meta['resize_clicks'] = {
+        'rows': count_resize_clicks([start_window] + page_windows + [final_window]),
+        'planned': count_resize_clicks([start_window] + [page_windows[idx] for idx in page_idx] + [final_window]),
+    }
+    pages = [pages[idx] for idx in page_idx]
+    page_windows = [page_windows[idx] for idx in page_idx]
+
+    height_ranges = [get_height_range(page['df']) for page in pages]
+    ascending = [False] * len(pages)
+    if height_order == 'sweep':
+        descending = plan_height_sweeps(height_ranges, START_HEIGHT)
+    else:
+        descending = ascending
+    plan.meta['height_keys'] = {
+        'ascending': count_height_keys(height_ranges, ascending, START_HEIGHT),
+        'planned': count_height_keys(height_ranges, descending, START_HEIGHT),
+    }
+
+    height = START_HEIGHT
+    menu_state = {}
+    window = start_window
+
+    for page, page_window, desc in zip(pages, page_windows, descending):
+        plan.page(page['i_page_x'], page['i_page_y'])
+        plan.meta['pages'].append([page['i_page_x'], page['i_page_y'], page['origin_x'], page['origin_y'], page['n_squares_x'], page['n_squares_y']])
+
+        restore_window(plan, window, page_window)
+        window = page_window
+
+        height = process_segment(plan, page['df'], height, desc, click_order)
+        if 'menu' in map_df.columns:
+            set_ground(plan, page['df'], menu_dict, click_order, brush_planner, menu_state)
+
+    restore_window(plan, window, final_window)
+
+    return plan
@@ -0,0 +1,225 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas
+import skimage.io
+
+from editor_utils.canvas import read_geometry
+from editor_utils.map_diff import GROUND_COLUMNS
+from editor_utils.planner import get_menu_dict, get_pages, load_map
+from editor_utils.sessions import get_session_layer
+
+# colours (RGB) of the entries whose cat1 or menu contains the keyword, the first match wins
+KEYWORD_COLOURS = [
+    ('deep marsh', (70, 90, 60)),
+    ('marsh', (100, 120, 70)),
+    ('ford', (90, 140, 190)),
+    ('water', (50, 100, 200)),
+    ('stream', (60, 120, 210)),
+    ('pond', (60, 120, 210)),
+    ('mud', (110, 85, 55)),
+    ('dirt', (150, 115, 75)),
+    ('sand', (220, 200, 140)),
+    ('gravel', (165, 160, 150)),
+    ('cobble', (130, 120, 115)),
+    ('pave', (110, 110, 115)),
+    ('rock', (140, 140, 135)),
+    ('foot path', (190, 160, 110)),
+    ('rail', (60, 50, 50)),
+    ('road', (90, 90, 95)),
+    ('crop', (210, 190, 90)),
+    ('plow', (160, 130, 80)),
+    ('forest', (30, 80, 35)),
+    ('tree', (35, 95, 40)),
+    ('bush', (80, 130, 60)),
+    ('brush', (90, 135, 65)),
+    ('weeds', (120, 150, 70)),
+    ('flowers', (150, 170, 90)),
+    ('clover', (100, 160, 80)),
+    ('grass', (110, 165, 80)),
+    ('hedge', (60, 100, 50)),
+    ('bocage', (60, 100, 50)),
+    ('fence', (150, 110, 80)),
+    ('wall', (120, 100, 90)),
+    ('stone', (130, 125, 120)),
+    ('brick', (150, 80, 60)),
+    ('church', (230, 220, 200)),
+    ('barn', (170, 60, 40)),
+    ('commercial', (200, 90, 160)),
+    ('house', (210, 50, 50)),
+    ('building', (210, 50, 50)),
+    ('story', (210, 50, 50)),
+]
+
+# entries that the profile's menu does not have, the editor run would skip them
+MISSING_COLOUR = (255, 0, 255)
+BACKGROUND_COLOUR = (0, 0, 0)
+PAGE_COLOUR = (255, 255, 0)
+OUTSIDE_COLOUR = (255, 0, 0)
+
+# session layers in drawing order and how much of the layers below they cover
+LAYER_ALPHA = {
+    'ground': 1.0,
+    'foliage': 0.7,
+    'roads': 1.0,
+    'buildings': 1.0,
+    'other': 0.8,
+}
+
+
+def entry_colour(menu: str, cat1: str, cat2: str) -> Tuple[int, int, int]:
+    """
+    Colour of a menu entry from its names, or a fixed colour derived from them if no keyword matches. cat2 (density,
+    tile, building) varies the brightness a little, so that neighbouring entries of the same kind stay apart.
+    """
+    for name in (cat1, menu):
+        for keyword, colour in KEYWORD_COLOURS:
+            if keyword in name.lower():
+                break
+        else:
+            continue
+        break
+    else:
+        code = zlib.crc32('{}|{}'.format(menu, cat1).encode())
+        colour = (code & 0xff, (code >> 8) & 0xff, (code >> 16) & 0xff)
+
+    factor = 1.0 - 0.08 * (zlib.crc32(cat2.encode()) % 4) if cat2 != '' else 1.0
+    return tuple(int(v * factor) for v in colour)
+
+
+def colour_table(keys: List[Tuple[str, str, str]], menu_dict) -> np.ndarray:
+    """
+    Colour per (menu, cat1, cat2) of the profile, MISSING_COLOUR for entries its menu does not have.
+    """
+    return np.array([entry_colour(*key) if key[0] in menu_dict and key[1] in menu_dict else MISSING_COLOUR for key in keys],
+                    dtype=float).reshape(-1, 3)
+
+
+def hillshade(z: np.ndarray) -> np.ndarray:
+    """
+    Shading factor per square from the slope towards a light in the north west, 1 on flat ground and where the elevation
+    is not known (nan).
+    """
+    filled = np.where(np.isnan(z), np.nanmean(z) if np.isfinite(z).any() else 0.0, z)
+    dz_dy, dz_dx = np.gradient(filled)
+    shade = 1.0 + 0.15 * (dz_dy - dz_dx)
+    return np.clip(np.where(np.isnan(z), 1.0, shade), 0.5, 1.3)
+
+
+def page_grid(n_squares_x: int, n_squares_y: int, geometry: Optional[Dict] = None) -> np.ndarray:
+    """
+    Ordinal of the editor page every square of the map belongs to, -1 for squares that are left out because the map
+    size is cut to whole page steps.
+    """
+    y, x = np.divmod(np.arange(n_squares_x * n_squares_y), n_squares_x)
+    grid = np.full(n_squares_x * n_squares_y, -1, dtype=int)
+    for ordinal, page in enumerate(get_pages(pandas.DataFrame({'x': x, 'y': y}), geometry)[2]):
+        grid[page['df'].index.values] = ordinal
+
+    return grid.reshape(n_squares_y, n_squares_x)
+
+
+def render_map(map_df: pandas.DataFrame, profile='cold_war', scale: int = 4, pages: bool = False, geometry: Optional[Dict] = None) -> Tuple[np.ndarray, Dict]:
+    """
+    Picture of the map as the editor run would leave it, scale pixels per square, north up: the elevation as grey
+    ramp with hill shading, the ground layers on top of it in the colours of their entries. With pages the borders of the
+    editor pages (of the canvas geometry) are drawn and the squares that no page covers are tinted red.
+    Returns the RGB image (uint8) and per entry (menu|cat1|cat2) its colour, number of rows and whether the profile's menu
+    lacks it.
+    """
+    menu_dict = get_menu_dict(profile)
+    x = map_df.x.values.astype(int)
+    y = map_df.y.values.astype(int)
+    n_squares_x, n_squares_y = int(x.max()) + 1, int(y.max()) + 1
+    image = np.empty((n_squares_y, n_squares_x, 3), dtype=float)
+    image[:] = BACKGROUND_COLOUR
+
+    z = np.full((n_squares_y, n_squares_x), np.nan)
+    has_z = map_df.z.values >= 0
+    z[y[has_z], x[has_z]] = map_df.z.values[has_z]
+    if has_z.any():
+        z_min, z_max = np.nanmin(z), np.nanmax(z)
+        grey = 60 + 160 * (z - z_min) / max(z_max - z_min, 1)
+        known = ~np.isnan(z)
+        image[known] = grey[known][:, None]
+
+    legend = {}
+    if 'menu' in map_df.columns:
+        rows = map_df[map_df.menu.notna()].sort_values(by=GROUND_COLUMNS, kind='stable')
+        names = rows[['menu', 'cat1', 'cat2']].astype(str)
+        # a cat2 that is not in the menu is not selected (e.g. -1)
+        names['cat2'] = names.cat2.where(names.cat2.isin(menu_dict.keys()), '')
+        codes, keys = pandas.factorize(pandas.MultiIndex.from_frame(names))
+        colours = colour_table(list(keys), menu_dict)
+        counts = np.bincount(codes, minlength=len(keys))
+        legend = {'|'.join(key): {'colour': colours[i].astype(int).tolist(), 'rows': int(counts[i]),
+                                  'missing': not (key[0] in menu_dict and key[1] in menu_dict)} for i, key in enumerate(keys)}
+
+        session_layers = names.menu.map(get_session_layer).values
+        rows_flat = rows.y.values.astype(int) * n_squares_x + rows.x.values.astype(int)
+        for layer, alpha in LAYER_ALPHA.items():
+            selected = session_layers == layer
+            # the last row of a square wins, as in the editor
+            flat, last = np.unique(rows_flat[selected][::-1], return_index=True)
+            layer_codes = codes[selected][::-1][last]
+            target = image.reshape(-1, 3)
+            target[flat] = (1 - alpha) * target[flat] + alpha * colours[layer_codes]
+
+    image *= hillshade(z)[:, :, None]
+
+    if pages:
+        grid = page_grid(n_squares_x, n_squares_y, geometry)
+        image[grid < 0] = 0.5 * image[grid < 0] + 0.5 * np.array(OUTSIDE_COLOUR)
+
+    image = np.repeat(np.repeat(image, scale, axis=0), scale, axis=1)
+    if pages:
+        # border on the last pixel row or column of a square whose neighbour lies on another page
+        border_x = np.zeros(image.shape[:2], dtype=bool)
+        border_y = np.zeros(image.shape[:2], dtype=bool)
+        border_x[:, scale - 1:(n_squares_x - 1) * scale:scale] = np.repeat(grid[:, :-1] != grid[:, 1:], scale, axis=0)
+        border_y[scale - 1:(n_squares_y - 1) * scale:scale, :] = np.repeat(grid[:-1, :] != grid[1:, :], scale, axis=1)
+        image[border_x | border_y] = PAGE_COLOUR
+
+    # map y runs north, image rows south
+    return np.clip(image[::-1], 0, 255).astype(np.uint8), legend
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Render a map csv-file (or typed map file) into a PNG picture, to check it before the editor run.')
+    arg_parser.add_argument('-i', '--input', required=True, help='map csv-file')
+    arg_parser.add_argument('-o', '--output', required=True, help='picture file (.png)')
+    arg_parser.add_argument('-p', '--profile', required=False, default='cold_war', type=str)
+    arg_parser.add_argument('-s', '--scale', required=False, default=4, type=int, help='pixels per square')
+    arg_parser.add_argument('--pages', required=False, action='store_true', default=False, help='draw the borders of the editor pages (yellow) and tint the squares no page covers (red)')
+    arg_parser.add_argument('--geometry', required=False, help='canvas geometry (.json, see editor_utils.canvas) of the pages')
+    args = arg_parser.parse_args()
+
+    map_df = load_map(args.input)
+    t_start = time.perf_counter()
+    image, legend = render_map(map_df, args.profile, args.scale, args.pages, read_geometry(args.geometry))
+    print('Rendered {}x{} squares in {:.2f} s'.format(image.shape[1] // args.scale, image.shape[0] // args.scale, time.perf_counter() - t_start))
+    skimage.io.imsave(args.output, image, check_contrast=False)
+
+    missing = [key for key, entry in legend.items() if entry['missing']]
+    for key, entry in sorted(legend.items(), key=lambda item: -item[1]['rows']):
+        print('{:60s} {:>15} {:8d} rows'.format(key, str(tuple(entry['colour'])), entry['rows']))
+    if len(missing) > 0:
+        print('{} entries are not in the menu of profile {} and are drawn magenta: {}'.format(len(missing), args.profile, ', '.join(missing)))
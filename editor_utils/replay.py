@@ -0,0 +1,81 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from profiles.general import buttons
+from profiles.general.constants import *
+from profiles.general.point import Point
+from editor_utils.canvas import CANVAS_GEOMETRY
+from editor_utils.plan import *
+
+BRUSH_BUTTONS = {
+    1: buttons.BRUSH_1,
+    3: buttons.BRUSH_3,
+    7: buttons.BRUSH_7,
+    15: buttons.BRUSH_15,
+}
+
+KEY_NAMES = {1: '+', -1: '-'}
+
+
+def square_position(x, y, geometry=None):
+    """
+    Screen position of the square (x, y) of a page on the canvas of the given geometry (see canvas.CANVAS_GEOMETRY).
+    """
+    geometry = geometry if geometry is not None else CANVAS_GEOMETRY
+    return Point(int(x * geometry['square_size'][0] + geometry['upper_left'][0]), int(geometry['lower_right'][1] - y * geometry['square_size'][1]))
+
+
+def replay_plan(plan: ActionPlan, backend, menu_dict, on_page=None, start=0, after_action=None, end=None):
+    """
+    Send the actions of a compiled plan to a backend. A backend provides
+        click(point, op, value)  -- value is the square (x, y), the menu name, the brush size or the resize button name
+        key(key)                 -- '+' or '-'
+        sleep(seconds)
+    on_page is called with (i_page_x, i_page_y, page_ordinal) whenever a new page starts.
+    Replaying begins at action index start and stops before end. after_action is called with (index, op, a, b, c) once an action was sent.
+    A backend that sends its input in batches also provides flush(), which is called at every page start and checkpoint
+    and at the end.
+    """
+    geometry = plan.meta.get('geometry')
+    resize_points = [getattr(buttons, name) for name in RESIZE_BUTTONS]
+    menu_points = [menu_dict[name] for name in plan.names]
+    flush = getattr(backend, 'flush', None)
+
+    for index, (op, a, b, c) in enumerate(plan.ops[start:end].tolist(), start):
+        if op == OP_SQUARE:
+            backend.click(square_position(a, b, geometry), op, (a, b))
+        elif op == OP_SLEEP:
+            backend.sleep(a / 1000)
+        elif op == OP_KEY:
+            backend.key(KEY_NAMES[a])
+        elif op == OP_MENU:
+            backend.click(menu_points[a], op, plan.names[a])
+        elif op == OP_BRUSH:
+            backend.click(BRUSH_BUTTONS[a], op, a)
+        elif op == OP_RESIZE:
+            backend.click(resize_points[a], op, RESIZE_BUTTONS[a])
+        elif op == OP_PAGE:
+            if flush is not None:
+                flush()
+            if on_page is not None:
+                on_page(a, b, c)
+        elif op == OP_CHECKPOINT and flush is not None:
+            flush()
+
+        if after_action is not None:
+            after_action(index, op, a, b, c)
+
+    if flush is not None:
+        flush()
@@ -0,0 +1,239 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import json
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas
+
+from profiles.general.constants import START_HEIGHT
+from editor_utils.canvas import read_geometry
+from editor_utils.cost_model import HEIGHT_ORDERS, calibrate_costs, default_costs, plan_cost, read_summaries
+from editor_utils.map_diff import format_diff_stats, format_initial_stats, mark_initial, mark_unchanged
+from editor_utils.page_check import page_ranges
+from editor_utils.plan import *
+from editor_utils.planner import BRUSH_PLANNERS, KEY_SLEEP, PAGE_ORDERS, RESIZE_SLEEP, compile_plan, get_pages, get_window_edges, load_map, set_height
+
+# A session is a plan of its own for a part of the map: some session layers on some pages. Every session ends with the
+# map at its full size and the start elevation selected, which is the state the next session starts from, so the
+# scenario can be saved and the editor closed in between. Each session is resumed with its own journal.
+# The editor leaves the elevation mode with the first menu click, so elevation is a session of its own and comes first.
+SESSION_LAYERS = ['elevation', 'ground', 'foliage', 'roads', 'buildings', 'other']
+DEFAULT_LAYER_GROUPS = [['elevation'], ['ground', 'foliage', 'roads', 'buildings', 'other']]
+
+# editor menus per session layer, all other menus belong to 'other'
+MENU_SESSION_LAYERS = {
+    'Ground 1': 'ground',
+    'Ground 2': 'ground',
+    'Ground 3': 'ground',
+    'Brush': 'foliage',
+    'Foliage': 'foliage',
+    'Roads': 'roads',
+    'Independent Buildings': 'buildings',
+    'Modular Buildings': 'buildings',
+}
+
+
+def get_session_layer(menu) -> str:
+    return MENU_SESSION_LAYERS.get(menu, 'other')
+
+
+def session_map(map_df: pandas.DataFrame, layers: List[str], rows: Optional[np.ndarray] = None) -> pandas.DataFrame:
+    """
+    Copy of the map in which only the given session layers of the rows with the given index labels (all rows if None)
+    are left to do. The other rows are marked done and keep the page layout. Of a row with elevation and ground entry
+    only the part of the selected layers is kept.
+    """
+    map_df = map_df.copy()
+    if 'elevation' not in layers:
+        map_df.loc[map_df.z >= 0, 'z'] = -1
+    pending = map_df.z >= 0
+    if 'menu' in map_df.columns:
+        map_df['menu'] = map_df.menu.where(map_df.menu.map(get_session_layer).isin(layers).astype(bool))
+        pending |= map_df.menu.notna()
+    if rows is not None:
+        pending &= map_df.index.isin(rows)
+    map_df.loc[~pending, 'done'] = 1
+
+    return map_df
+
+
+def compile_session(map_df: pandas.DataFrame, profile='cold_war', start_size_from_file=False, **kwargs) -> ActionPlan:
+    """
+    Plan of a session map, which ends with the start elevation selected again.
+    """
+    plan = compile_plan(map_df, profile, start_size_from_file, **kwargs)
+    set_height(plan, START_HEIGHT + int(plan.ops[plan.ops[:, 0] == OP_KEY, 1].sum()), START_HEIGHT)
+    return plan
+
+
+def page_costs(plan: ActionPlan, costs: Dict[str, float]) -> List:
+    """
+    (i_page_x, i_page_y) and predicted seconds of every page of the plan in the order they are visited. The resize clicks
+    after the last page are added to it.
+    """
+    pages = []
+    for page_start, begin, end in page_ranges(plan):
+        seconds = plan_cost(plan, costs, begin, end)['total']
+        if page_start is not None:
+            pages.append([tuple(plan.ops[page_start, 1:3].tolist()), seconds])
+        elif len(pages) > 0:
+            pages[-1][1] += seconds
+
+    return pages
+
+
+def split_pages(pages: List, budget: Optional[float] = None, pages_per_session: Optional[int] = None) -> List[List]:
+    """
+    Cut the pages, in the order they are visited, into runs of at most pages_per_session pages whose predicted time fits
+    into budget (a page that takes longer by itself is a run of its own). Consecutive pages of the planned order lie next
+    to each other, so every run covers a compact part of the map.
+    """
+    chunks = []
+    chunk = []
+    seconds = 0.0
+    for key, page_seconds in pages:
+        full = pages_per_session is not None and len(chunk) >= pages_per_session
+        over = budget is not None and seconds + page_seconds > budget
+        if len(chunk) > 0 and (full or over):
+            chunks.append(chunk)
+            chunk = []
+            seconds = 0.0
+        chunk.append(key)
+        seconds += page_seconds
+    if len(chunk) > 0:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def schedule_sessions(map_df: pandas.DataFrame, layer_groups: Optional[List[List[str]]] = None, costs: Optional[Dict[str, float]] = None,
+                      budget: Optional[float] = None, pages_per_session: Optional[int] = None, profile='cold_war',
+                      start_size_from_file=False, **kwargs) -> List[Dict]:
+    """
+    Split the map into sessions: one per group of session layers (elevation and all ground layers by default), each cut
+    into runs of pages that fit into budget seconds and pages_per_session pages. The layers of a group share their page
+    visits, so the fewer groups, the fewer times every page is visited. kwargs are passed on to compile_plan. Returns
+    per session its name, layers, pages, plan and predicted seconds.
+    """
+    if layer_groups is None:
+        layer_groups = DEFAULT_LAYER_GROUPS
+    for layers in layer_groups:
+        if 'elevation' in layers and len(layers) > 1:
+            raise ValueError('Elevation needs a session of its own, the editor cannot return to the elevation mode after a menu click.')
+    costs = costs if costs is not None else default_costs()
+    layer_groups = sorted(layer_groups, key=lambda layers: 'elevation' not in layers)
+    page_rows = {(page['i_page_x'], page['i_page_y']): page['df'].index.values for page in get_pages(map_df, kwargs.get('geometry'))[2]}
+
+    # the first session starts at the start size (or the size from the file), the others where the first one ended
+    start_window = None
+    sessions = []
+    for layers in layer_groups:
+        group_df = session_map(map_df, layers)
+        if (group_df.done == 0).sum() == 0:
+            continue
+        plan = compile_session(group_df, profile, start_size_from_file, start_window=start_window, **kwargs)
+
+        # a run of pages that does not fit into the budget once compiled by itself (with the resize clicks to get to
+        # it and back) leaves its last pages to the next one
+        pages = page_costs(plan, costs)
+        chunks = []
+        while len(pages) > 0:
+            chunk = split_pages(pages, budget, pages_per_session)[0]
+            if len(chunk) < len(pages) or len(chunks) > 0:
+                while True:
+                    plan = compile_session(session_map(map_df, layers, np.concatenate([page_rows[key] for key in chunk])), profile,
+                                           start_size_from_file, start_window=start_window, **kwargs)
+                    if budget is None or len(chunk) == 1 or plan_cost(plan, costs)['total'] <= budget:
+                        break
+                    chunk = chunk[:-1]
+            chunks.append((chunk, plan))
+            pages = pages[len(chunk):]
+            if start_window is None:
+                start_window = get_window_edges(plan).tolist()
+
+        for i_chunk, (chunk, plan) in enumerate(chunks):
+            name = '+'.join(layers) + ('_{}'.format(i_chunk + 1) if len(chunks) > 1 else '')
+            sessions.append({'name': name, 'layers': list(layers), 'pages': [list(key) for key in chunk], 'plan': plan,
+                             'seconds': plan_cost(plan, costs)['total']})
+
+    return sessions
+
+
+def write_sessions(sessions: List[Dict], prefix: str) -> str:
+    """
+    Write the plan of every session to <prefix>_<number>_<name>.npz and a list of the sessions to <prefix>.sessions.json.
+    """
+    entries = []
+    for i_session, session in enumerate(sessions):
+        path = '{}_{:02d}_{}.npz'.format(prefix, i_session + 1, session['name'])
+        write_plan(session['plan'], path)
+        entries.append({'plan': path, 'name': session['name'], 'layers': session['layers'], 'pages': session['pages'],
+                        'actions': len(session['plan']), 'minutes': session['seconds'] / 60})
+
+    path = prefix + '.sessions.json'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, indent=1)
+    return path
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Split a map into sessions by layer, page range and time budget and compile a plan for each, to be replayed one by one with cmautoeditor.py.')
+    arg_parser.add_argument('-i', '--input', required=True, help='map csv-file (or typed map file)')
+    arg_parser.add_argument('-o', '--output', required=True, help='prefix of the session plans and the session list')
+    arg_parser.add_argument('-p', '--profile', required=False, default='cold_war', type=str)
+    arg_parser.add_argument('-l', '--layers', required=False, nargs='+', help='session layers per session, e.g. "elevation" "ground,foliage" "roads,buildings,other" '
+                            '(layers: {}). Layers left out are not planned. By default elevation and all other layers form one session each.'.format(', '.join(SESSION_LAYERS)))
+    arg_parser.add_argument('-b', '--budget', required=False, type=float, help='predicted time per session [min]')
+    arg_parser.add_argument('-n', '--pages-per-session', required=False, type=int, help='number of pages per session')
+    arg_parser.add_argument('-t', '--min-time', required=False, default=0.05, type=float)
+    arg_parser.add_argument('--calibrate', required=False, nargs='+', help='run summaries (--telemetry) of earlier runs to fit the cost model to')
+    arg_parser.add_argument('--start-size-from-file', required=False, action='store_true', default=False)
+    arg_parser.add_argument('--applied', required=False, help='previously applied map csv-file, only changed squares are planned')
+    arg_parser.add_argument('--brush-planner', required=False, default='layered', choices=BRUSH_PLANNERS)
+    arg_parser.add_argument('--height-order', required=False, default='sweep', choices=HEIGHT_ORDERS)
+    arg_parser.add_argument('--page-order', required=False, default='planned', choices=PAGE_ORDERS)
+    arg_parser.add_argument('--elevation-error', required=False, type=float)
+    arg_parser.add_argument('--geometry', required=False, help='canvas geometry (.json, see editor_utils.canvas) to plan the pages for')
+    arg_parser.add_argument('--all-squares', required=False, action='store_true', default=False, help='also plan the squares that already have the start elevation or the default ground of a new map')
+    args = arg_parser.parse_args()
+
+    layer_groups = [layers.split(',') for layers in args.layers] if args.layers is not None else None
+    for layer in sum(layer_groups or [], []):
+        if layer not in SESSION_LAYERS:
+            raise ValueError('Unknown session layer {}, expected one of {}.'.format(layer, SESSION_LAYERS))
+
+    costs = default_costs(args.min_time, KEY_SLEEP, RESIZE_SLEEP)
+    if args.calibrate is not None:
+        costs, _ = calibrate_costs(read_summaries(args.calibrate), costs)
+
+    map_df = load_map(args.input)
+    if args.applied is not None:
+        map_df, diff_stats = mark_unchanged(map_df, load_map(args.applied))
+        print(format_diff_stats(diff_stats))
+    elif not (args.start_size_from_file or args.all_squares):
+        map_df, initial_stats = mark_initial(map_df, args.profile, args.elevation_error is None)
+        print(format_initial_stats(initial_stats))
+
+    sessions = schedule_sessions(map_df, layer_groups, costs, args.budget * 60 if args.budget is not None else None, args.pages_per_session,
+                                 args.profile, args.start_size_from_file or args.applied is not None, height_order=args.height_order,
+                                 brush_planner=args.brush_planner, page_order=args.page_order, elevation_error=args.elevation_error,
+                                 geometry=read_geometry(args.geometry))
+    path = write_sessions(sessions, args.output)
+    for i_session, session in enumerate(sessions):
+        print('{:2d} {:30s} {:4d} pages {:7d} actions {:6.1f} min'.format(i_session + 1, session['name'], len(session['pages']), len(session['plan']), session['seconds'] / 60))
+    print('{} sessions, {:.1f} min predicted in total, session list in {}'.format(len(sessions), sum(session['seconds'] for session in sessions) / 60, path))
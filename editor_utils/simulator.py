@@ -0,0 +1,326 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas
+
+from profiles.general.constants import *
+from editor_utils.canvas import get_geometry, read_geometry
+from editor_utils.click_order import CLICK_ORDERS
+from editor_utils.elevation_fit import interpolate_heights, thin_heights
+from editor_utils.map_diff import format_diff_stats, format_initial_stats, mark_initial, mark_unchanged
+from editor_utils.map_format import is_map_bundle
+from editor_utils.plan import *
+from editor_utils.planner import BRUSH_PLANNERS, PAGE_ORDERS, compile_plan, get_layer, get_menu_dict, load_map
+from editor_utils.replay import replay_plan
+from editor_utils.telemetry import RunTelemetry
+
+
+class SimulatedEditor:
+    """
+    Headless stand-in for the CM Scenario Editor. It receives the same events as the pyautogui backend and keeps track of
+    the visible map window, the selected menu items, brush and elevation and of the map that results from the clicks.
+    Squares outside the visible window keep their values, like in the editor.
+
+    Time is not spent but accounted for: every click costs pause seconds (pyautogui.PAUSE) plus travel_time per pixel of
+    cursor movement, every key press key_time seconds, sleeps their duration.
+    """
+    def __init__(self, menu_names: Iterable[str], cat2_names: Iterable[str], pages: Optional[List] = None,
+                 start_n_squares: Optional[List[int]] = None, pause: float = 0.05, key_time: float = 0.0, travel_time: float = 0.0,
+                 geometry: Optional[Dict] = None):
+        self.menu_names = set(menu_names)
+        self.cat2_names = set(cat2_names)
+        self.pages = pages if pages is not None else []
+        self.pause = pause
+        self.key_time = key_time
+        self.travel_time = travel_time
+        self.geometry = get_geometry(geometry)
+
+        if start_n_squares is None:
+            start_n_squares = [START_N_SQUARES_X, START_N_SQUARES_Y]
+        self.left, self.right = 0, start_n_squares[0]
+        self.bottom, self.top = 0, start_n_squares[1]
+        self.elevation = START_HEIGHT
+        self.elevation_mode = True
+        self.brush_size = 1
+        self.menu, self.cat1, self.cat2, self.direction = None, None, None, None
+
+        self.heights = {}
+        self.ground = {}
+        self.offset = None
+        self.page_origin = None
+        self.cursor = None
+
+        self.time = 0.0
+        self.stats = {
+            'square_clicks': 0,
+            'menu_clicks': 0,
+            'brush_clicks': 0,
+            'resize_clicks': 0,
+            'keys': 0,
+            'missed_clicks': 0,
+            'pages': 0,
+            'travel_px': 0.0,
+            'sleep_time': 0.0,
+        }
+
+    def page(self, i_page_x, i_page_y, ordinal):
+        self.stats['pages'] += 1
+        if ordinal < len(self.pages):
+            self.page_origin = self.pages[ordinal][2:4]
+
+    def _move(self, point):
+        if self.cursor is not None:
+            distance = np.hypot(point[0] - self.cursor[0], point[1] - self.cursor[1])
+            self.stats['travel_px'] += distance
+            self.time += distance * self.travel_time
+        self.cursor = point
+
+    def click(self, point, op=None, value=None):
+        self._move(point)
+        self.time += self.pause
+
+        if op == OP_SQUARE:
+            self.stats['square_clicks'] += 1
+            self._click_square(point)
+        elif op == OP_MENU:
+            self.stats['menu_clicks'] += 1
+            self._select(value)
+        elif op == OP_BRUSH:
+            self.stats['brush_clicks'] += 1
+            self.brush_size = value
+        elif op == OP_RESIZE:
+            self.stats['resize_clicks'] += 1
+            d_left, d_right, d_bottom, d_top = RESIZE_EFFECTS[value]
+            self.left += d_left
+            self.right += d_right
+            self.bottom += d_bottom
+            self.top += d_top
+
+    def key(self, key):
+        self.stats['keys'] += 1
+        self.time += self.key_time
+        if key == '+':
+            self.elevation += 1
+        elif key == '-':
+            self.elevation -= 1
+
+    def sleep(self, seconds):
+        self.stats['sleep_time'] += seconds
+        self.time += seconds
+
+    def _select(self, name):
+        self.elevation_mode = False
+        if name in self.menu_names:
+            self.menu, self.cat1, self.cat2 = name, None, None
+        elif name.startswith('Direction'):
+            self.direction = name
+        elif self.cat1 is not None and name in self.cat2_names:
+            self.cat2 = name
+        else:
+            self.cat1, self.cat2 = name, None
+
+    def _click_square(self, point):
+        local_x = int(round((point[0] - self.geometry['upper_left'][0]) / self.geometry['square_size'][0]))
+        local_y = int(round((self.geometry['lower_right'][1] - point[1]) / self.geometry['square_size'][1]))
+        x = self.left + local_x
+        y = self.bottom + local_y
+        # the canvas only shows page_n_squares of the map window
+        visible = 0 <= local_x < self.geometry['page_n_squares'][0] and 0 <= local_y < self.geometry['page_n_squares'][1]
+        if not (visible and self.left <= x < self.right and self.bottom <= y < self.top):
+            self.stats['missed_clicks'] += 1
+            return
+
+        if self.offset is None and self.page_origin is not None:
+            self.offset = (self.left - self.page_origin[0], self.bottom - self.page_origin[1])
+
+        if self.elevation_mode:
+            self.heights[(x, y)] = self.elevation
+        else:
+            half = int(self.brush_size / 2)
+            entry = (self.menu, self.cat1, self.cat2, self.direction)
+            layer = get_layer(self.menu)
+            for xx in range(max(x - half, self.left), min(x + half + 1, self.right)):
+                for yy in range(max(y - half, self.bottom), min(y + half + 1, self.top)):
+                    self.ground[(layer, xx, yy)] = entry
+
+    def height_map(self) -> pandas.DataFrame:
+        """
+        Elevations set by clicks in map coordinates (x, y, z).
+        """
+        offset = self.offset if self.offset is not None else (0, 0)
+        coords = np.array(list(self.heights.keys()), dtype=int).reshape(-1, 2)
+        return pandas.DataFrame({
+            'x': coords[:, 0] - offset[0],
+            'y': coords[:, 1] - offset[1],
+            'z': np.array(list(self.heights.values()), dtype=int),
+        })
+
+    def ground_map(self) -> pandas.DataFrame:
+        """
+        Painted squares in map coordinates (layer, x, y, menu, cat1, cat2, direction).
+        """
+        offset = self.offset if self.offset is not None else (0, 0)
+        keys = list(self.ground.keys())
+        values = list(self.ground.values())
+        return pandas.DataFrame({
+            'layer': pandas.Series([key[0] for key in keys], dtype=object),
+            'x': np.array([key[1] for key in keys], dtype=int) - offset[0],
+            'y': np.array([key[2] for key in keys], dtype=int) - offset[1],
+            'menu': [value[0] for value in values],
+            'cat1': [value[1] for value in values],
+            'cat2': [value[2] for value in values],
+            'direction': [value[3] for value in values],
+        })
+
+
+def get_name_levels(map_df: pandas.DataFrame):
+    if 'menu' not in map_df.columns:
+        return set(), set()
+    return set(map_df.menu.astype(str).unique()), set(map_df.cat2.astype(str).unique())
+
+
+def simulate_plan(plan: ActionPlan, map_df: pandas.DataFrame, telemetry=False, **kwargs) -> SimulatedEditor:
+    """
+    With telemetry, editor.telemetry holds a RunTelemetry of the replay in simulated time.
+    """
+    menu_names, cat2_names = get_name_levels(map_df)
+    editor = SimulatedEditor(menu_names, cat2_names, plan.meta.get('pages'), plan.meta.get('start_n_squares'), geometry=plan.meta.get('geometry'), **kwargs)
+    editor.telemetry = RunTelemetry(plan, clock=lambda: editor.time, report_interval=np.inf) if telemetry else None
+    replay_plan(plan, editor, get_menu_dict(plan.profile), on_page=editor.page, after_action=editor.telemetry)
+    return editor
+
+
+def compare_with_map(editor: SimulatedEditor, map_df: pandas.DataFrame, plan: ActionPlan) -> Dict[str, int]:
+    """
+    Count the rows of the input map that the simulated editor did not reproduce.
+    """
+    menu_dict = get_menu_dict(plan.profile)
+    total_n_squares_x, total_n_squares_y = plan.meta['total_n_squares']
+    map_df = map_df[map_df.x.between(0, total_n_squares_x, inclusive='left') & map_df.y.between(0, total_n_squares_y, inclusive='left')]
+
+    result = {}
+    height_rows = map_df[map_df.z >= 0]
+    heights = height_rows.merge(editor.height_map(), on=['x', 'y'], how='left', suffixes=('', '_sim'))
+    result['height_rows'] = len(heights)
+    result['height_mismatches'] = int((heights.z != heights.z_sim).sum())
+
+    if 'menu' in map_df.columns:
+        ground_rows = map_df[map_df.menu.isin(menu_dict.keys()) & map_df.cat1.isin(menu_dict.keys())].copy()
+        ground_rows['layer'] = ground_rows.menu.map(get_layer)
+        ground = ground_rows.merge(editor.ground_map(), on=['layer', 'x', 'y'], how='left', suffixes=('', '_sim'))
+        mismatch = (ground.menu != ground.menu_sim) | (ground.cat1 != ground.cat1_sim)
+        mismatch |= ground.cat2.isin(menu_dict.keys()) & (ground.cat2 != ground.cat2_sim)
+        mismatch |= ground.direction.isin(menu_dict.keys()) & (ground.direction != ground.direction_sim)
+        result['ground_rows'] = len(ground)
+        result['ground_mismatches'] = int(mismatch.sum())
+
+    return result
+
+
+def compare_interpolated(editor: SimulatedEditor, map_df: pandas.DataFrame, max_error: float) -> Dict[str, float]:
+    """
+    Interpolate the elevation between the squares set in the simulated editor and compare it with all elevation rows of
+    the input map.
+    """
+    heights = editor.height_map()
+    rows = map_df[map_df.z >= 0]
+    if len(rows) == 0:
+        return {'height_rows': 0, 'max_error': 0.0, 'over_bound': 0}
+    z = interpolate_heights(heights.x.values, heights.y.values, heights.z.values, rows.x.values, rows.y.values)
+    error = np.abs(z - rows.z.values)
+    return {
+        'height_rows': len(rows),
+        'max_error': float(np.nanmax(error)),
+        'over_bound': int((~(error <= max_error)).sum()),
+    }
+
+
+def compare_editors(editor_a: SimulatedEditor, editor_b: SimulatedEditor) -> Dict[str, int]:
+    """
+    Count the squares in which two simulated maps differ, e.g. the result of an optimised planner against the reference.
+    """
+    heights = editor_a.height_map().merge(editor_b.height_map(), on=['x', 'y'], how='outer', suffixes=('_a', '_b'))
+    ground = editor_a.ground_map().merge(editor_b.ground_map(), on=['layer', 'x', 'y'], how='outer', suffixes=('_a', '_b'))
+    ground_diff = np.zeros(len(ground), dtype=bool)
+    for col in ['menu', 'cat1', 'cat2', 'direction']:
+        ground_diff |= ground[col + '_a'].fillna('').astype(str) != ground[col + '_b'].fillna('').astype(str)
+
+    return {
+        'height_differences': int((heights.z_a != heights.z_b).sum()),
+        'ground_differences': int(ground_diff.sum()),
+    }
+
+
+def format_report(editor: SimulatedEditor) -> str:
+    lines = ['simulated time: {:.1f} s ({:.2f} h)'.format(editor.time, editor.time / 3600)]
+    lines.extend('{}: {}'.format(key, round(value, 1)) for key, value in editor.stats.items())
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Replay a map or plan in a simulated scenario editor and report clicks, key presses and time.')
+    arg_parser.add_argument('-i', '--input', required=True, help='map csv-file (or compiled .npz plan together with --map)')
+    arg_parser.add_argument('-m', '--map', required=False, help='map csv-file the plan was compiled from, used to check the result')
+    arg_parser.add_argument('-p', '--profile', required=False, default='cold_war', type=str)
+    arg_parser.add_argument('-t', '--min-time', required=False, default=0.05, type=float, help='pyautogui pause after every click [s]')
+    arg_parser.add_argument('--key-time', required=False, default=0.0, type=float, help='time per key press [s]')
+    arg_parser.add_argument('--travel-time', required=False, default=0.0, type=float, help='time per pixel of cursor movement [s]')
+    arg_parser.add_argument('--start-size-from-file', required=False, action='store_true', default=False)
+    arg_parser.add_argument('--height-order', required=False, default='sweep', choices=['sweep', 'ascending'])
+    arg_parser.add_argument('--click-order', required=False, default='tour', choices=CLICK_ORDERS)
+    arg_parser.add_argument('--page-order', required=False, default='planned', choices=PAGE_ORDERS)
+    arg_parser.add_argument('--elevation-error', required=False, type=float, help='only set the squares needed to interpolate the elevation within this error')
+    arg_parser.add_argument('--applied', required=False, help='previously applied map csv-file, only changed squares are planned')
+    arg_parser.add_argument('--brush-planner', required=False, default='layered', choices=BRUSH_PLANNERS)
+    arg_parser.add_argument('--telemetry', required=False, help='write a run summary (JSON) in simulated time, as cmautoeditor does')
+    arg_parser.add_argument('--geometry', required=False, help='canvas geometry (.json, see editor_utils.canvas) to plan the pages for')
+    arg_parser.add_argument('--all-squares', required=False, action='store_true', default=False, help='also plan the squares that already have the start elevation or the default ground of a new map')
+    args = arg_parser.parse_args()
+
+    map_df = load_map(args.map if args.map is not None else args.input)
+    if args.applied is not None:
+        map_df, diff_stats = mark_unchanged(map_df, load_map(args.applied))
+        print(format_diff_stats(diff_stats))
+    elif not (args.start_size_from_file or args.all_squares or args.input.endswith('.npz') and not is_map_bundle(args.input)):
+        map_df, initial_stats = mark_initial(map_df, args.profile, args.elevation_error is None)
+        print(format_initial_stats(initial_stats))
+    t_start = time.time()
+    if args.input.endswith('.npz') and not is_map_bundle(args.input):
+        plan = read_plan(args.input)
+    else:
+        plan = compile_plan(map_df, args.profile, args.start_size_from_file or args.applied is not None, height_order=args.height_order, click_order=args.click_order,
+                            brush_planner=args.brush_planner, page_order=args.page_order, elevation_error=args.elevation_error,
+                            geometry=read_geometry(args.geometry))
+    print('planning: {:.2f} s, {} actions'.format(time.time() - t_start, len(plan)))
+    if 'height_keys' in plan.meta:
+        print('elevation key presses: {planned} (ascending order: {ascending})'.format(**plan.meta['height_keys']))
+    if 'height_rows' in plan.meta:
+        print('elevation squares: {planned} of {all}'.format(**plan.meta['height_rows']))
+    if 'resize_clicks' in plan.meta:
+        print('resize clicks: {planned} (all pages row by row: {rows})'.format(**plan.meta['resize_clicks']))
+
+    editor = simulate_plan(plan, map_df, telemetry=args.telemetry is not None, pause=args.min_time, key_time=args.key_time, travel_time=args.travel_time)
+    if args.telemetry is not None:
+        editor.telemetry.write(args.telemetry)
+    print(format_report(editor))
+    if args.elevation_error is not None:
+        print(compare_interpolated(editor, map_df, args.elevation_error))
+        map_df = thin_heights(map_df, args.elevation_error)
+    print(compare_with_map(editor, map_df[map_df.done == 0], plan))
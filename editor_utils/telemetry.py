@@ -0,0 +1,150 @@
+# Copyright (C) 2022  Nicolas Möser
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import time
+from typing import Dict
+
+import numpy as np
+
+from editor_utils.plan import *
+
+# counted events, the time of sleeps and checkpoints goes to the phase of the action before them
+EVENTS = {
+    OP_SQUARE: 'clicks',
+    OP_KEY: 'keys',
+    OP_RESIZE: 'resizes',
+    OP_MENU: 'menu_switches',
+    OP_BRUSH: 'brush_switches',
+}
+
+
+def empty_counts() -> Dict:
+    counts = {event: 0 for event in EVENTS.values()}
+    counts['time'] = 0.0
+    return counts
+
+
+def get_phase(op: int, ground: bool, previous: str) -> str:
+    """
+    'window' for resizing, 'elevation' for key presses and the clicks before the first menu or brush click of a page
+    (ground groups always start with one), 'ground' for the menu, brush and square clicks after it.
+    """
+    if op in (OP_SLEEP, OP_CHECKPOINT, OP_PAGE):
+        return previous
+    if op == OP_RESIZE:
+        return 'window'
+    if op == OP_KEY or (op == OP_SQUARE and not ground):
+        return 'elevation'
+    return 'ground'
+
+
+class RunTelemetry:
+    """
+    Counts and times the actions of a replay per page and phase, pass it as after_action to replay_plan. Actions
+    replayed with index None (resume preludes, repairs) are counted as phase 'extra'. The remaining time is estimated
+    from the measured mean time of each kind of action and the actions of the plan still to come, and printed every
+    report_interval seconds. clock returns the current time in seconds, the simulator passes its simulated time.
+    """
+    def __init__(self, plan: ActionPlan, start: int = 0, clock=None, report_interval: float = 30.0):
+        self.plan = plan
+        self.clock = clock if clock is not None else time.perf_counter
+        self.report_interval = report_interval
+        self.start_time = self.last_time = self.last_report = self.clock()
+        self.start = start
+        self.done = start
+
+        ops = plan.ops[start:, 0]
+        self.remaining = {op: int((ops == op).sum()) for op in np.unique(ops).tolist()}
+        self.op_counts = {}
+        self.op_time = {}
+        self.phases = {}
+        self.pages = []
+        self.ground = False
+        self.phase = 'window'
+
+    def _page(self, a, b, c):
+        self.pages.append({'page': [a, b], 'ordinal': c, 'phases': {}})
+        self.ground = False
+
+    def __call__(self, index, op, a, b, c):
+        now = self.clock()
+        duration = now - self.last_time
+        self.last_time = now
+
+        if op == OP_PAGE and index is not None:
+            self._page(a, b, c)
+        if op in (OP_MENU, OP_BRUSH):
+            self.ground = True
+
+        if index is None:
+            phase = 'extra'
+        else:
+            phase = self.phase = get_phase(op, self.ground, self.phase)
+            self.done = index + 1
+            self.remaining[op] -= 1
+            self.op_counts[op] = self.op_counts.get(op, 0) + 1
+            self.op_time[op] = self.op_time.get(op, 0.0) + duration
+
+        targets = [self.phases.setdefault(phase, empty_counts())]
+        if len(self.pages) > 0:
+            targets.append(self.pages[-1]['phases'].setdefault(phase, empty_counts()))
+        for counts in targets:
+            counts['time'] += duration
+            if op in EVENTS:
+                counts[EVENTS[op]] += 1
+
+        if now - self.last_report >= self.report_interval:
+            self.last_report = now
+            print(self.progress())
+
+    def eta(self) -> float:
+        """
+        Estimated seconds until the plan is finished.
+        """
+        total_time = sum(self.op_time.values())
+        total_count = sum(self.op_counts.values())
+        mean_time = total_time / total_count if total_count > 0 else 0.0
+        return sum(count * (self.op_time[op] / self.op_counts[op] if self.op_counts.get(op, 0) > 0 else mean_time)
+                   for op, count in self.remaining.items())
+
+    def progress(self) -> str:
+        elapsed = self.clock() - self.start_time
+        page = self.pages[-1]['ordinal'] + 1 if len(self.pages) > 0 else 0
+        return '{:.1f}% of {} actions, page {} of {}, {:.0f} min elapsed, about {:.0f} min left'.format(
+            100 * self.done / max(len(self.plan), 1), len(self.plan), page, self.plan.n_pages, elapsed / 60, self.eta() / 60)
+
+    def rates(self) -> Dict[str, float]:
+        """
+        Measured actions per second of each kind.
+        """
+        return {OP_NAMES[op]: self.op_counts[op] / self.op_time[op] for op in sorted(self.op_counts)
+                if op in EVENTS and self.op_time[op] > 0}
+
+    def summary(self) -> Dict:
+        return {
+            'actions': len(self.plan),
+            'start': self.start,
+            'done': self.done,
+            'elapsed': self.clock() - self.start_time,
+            'eta': self.eta(),
+            'phases': self.phases,
+            'rates': self.rates(),
+            'pages': self.pages,
+        }
+
+    def write(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=1)
@@ -35,6 +35,7 @@ from shapely.ops import nearest_points, snap, split, transform
 from tqdm import tqdm
 
 import osm_utils.processing
+from editor_utils.map_stream import MapStream, page_bands
 from osm_utils.grid import get_all_grids, get_reference_rectanlge_points
 from profiles import available_profiles
 import PySimpleGUI as sg
@@ -608,6 +609,39 @@ class OSMProcessor:
 
         
 
+    def stream_to(self, stream_path: str):
+        # post-processing only looks at the rows of one square at a time, so every row of editor pages is published to
+        # the map stream as soon as its squares are done, and cmautoeditor clicks it while the next ones are processed
+        n_squares_x = int(self.idx_bbox[2] - self.idx_bbox[0]) + 1
+        n_squares_y = int(self.idx_bbox[3] - self.idx_bbox[1]) + 1
+        stream = MapStream(stream_path, 'osm2cm', n_squares_x, n_squares_y, ['ground', 'foliage', 'roads', 'buildings', 'other'])
+
+        df = self.df
+        bands = page_bands(pandas.DataFrame({'x': df.xidx.values - self.idx_bbox[0], 'y': df.yidx.values - self.idx_bbox[1]}), n_squares_x, n_squares_y)
+        processed = []
+        for band in bands:
+            self.df = df.iloc[band]
+            self.post_process()
+            processed.append(self.df)
+            stream.publish(self._to_map_coordinates(self.df))
+        stream.close()
+
+        # squares outside the pages are not clicked, but belong into the csv-file
+        outside = np.ones(len(df), dtype=bool)
+        if len(bands) > 0:
+            outside[np.concatenate(bands)] = False
+        self.df = df.iloc[outside]
+        self.post_process()
+        self.df = pandas.concat(processed + [self.df])
+
+    def _to_map_coordinates(self, df: pandas.DataFrame) -> pandas.DataFrame:
+        df = df.rename(columns={"xidx": "x", "yidx": "y"})
+        df = df.loc[
+            (df.x.between(self.idx_bbox[0], self.idx_bbox[2])) &
+            (df.y.between(self.idx_bbox[1], self.idx_bbox[3]))
+        ]
+        return df.assign(x=df.x - self.idx_bbox[0], y=df.y - self.idx_bbox[1])
+
     def write_to_file(self, output_file_name):
         xmax = self.idx_bbox[2]
         ymax = self.idx_bbox[3]
@@ -634,6 +668,8 @@ if __name__ == '__main__':
     argparser.add_argument('-c', '--config-file', required=False, default='default_osm_config.json')
     argparser.add_argument('-o', '--output-file', required=True)
     argparser.add_argument('-p', '--profile', type=str, required=False, default='cold_war')
+    argparser.add_argument('--stream', required=False, help='publish the map row of editor pages by row of pages to this map stream directory while it is post-processed, '
+        'cmautoeditor.py --stream clicks it from there (see editor_utils.map_stream)')
 
     if len(sys.argv) == 1:
         argv_list = run_startup_gui()
@@ -656,7 +692,10 @@ if __name__ == '__main__':
 
     osm_processor.preprocess_osm_data(osm_data=osm_data)
     osm_processor.run_processors()
-    osm_processor.post_process()
+    if args.stream is not None:
+        osm_processor.stream_to(args.stream)
+    else:
+        osm_processor.post_process()
     osm_processor.write_to_file(args.output_file)
 
     sg.popup('OSM conversion complete.')
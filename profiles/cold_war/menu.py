@@ -13,155 +13,158 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import pyautogui
+from ..general.point import Point
 
 MENU_DICT = {
-    'Ground 1': pyautogui.Point(113, 107),
-    'Ground 2': pyautogui.Point(105, 123),
-    'Ground 3': pyautogui.Point(105, 144),
-    'Brush': pyautogui.Point(107, 165),
-    'Foliage': pyautogui.Point(110, 185),
-    'Roads': pyautogui.Point(107, 203),
-    "Walls/Fences": pyautogui.Point(105, 224),
-    "Independent Buildings": pyautogui.Point(105, 264),
-    "Modular Buildings": pyautogui.Point(105, 245),
-    "Flavor Objects 1": pyautogui.Point(105, 285),
-    "Flavor Objects 2": pyautogui.Point(105, 306),
-    'Water': pyautogui.Point(81, 438),
-    'Plow NS': pyautogui.Point(135, 552),
-    'Plow EW': pyautogui.Point(188, 552),
-    'Crop 1': pyautogui.Point(26, 383),
-    'Crop 2': pyautogui.Point(87, 383),
-    'Crop 3': pyautogui.Point(135, 383),
-    'Crop 4': pyautogui.Point(188, 383),
-    'Crop 5': pyautogui.Point(26, 440),
-    'Crop 6': pyautogui.Point(87, 440),
-    'Tree A': pyautogui.Point(110, 381),
-    'Tree B': pyautogui.Point(180, 380),
-    'Tree C': pyautogui.Point(39, 438),
-    'Tree D': pyautogui.Point(114, 438),
-    'Tree E': pyautogui.Point(183, 438),
-    'Tree F': pyautogui.Point(39, 498),
-    'Tree G': pyautogui.Point(114, 498),
-    'Tree H': pyautogui.Point(183, 498),
-    'Bush A': pyautogui.Point(39, 555),
-    'Bush B': pyautogui.Point(114, 555),
-    'Bush C': pyautogui.Point(183, 555),
-    'density 1': pyautogui.Point(38, 617),
-    'density 2': pyautogui.Point(110, 617),
-    'density 3': pyautogui.Point(180, 617),
-    'density 4': pyautogui.Point(38, 657),
-    'Grass': pyautogui.Point(189, 438),
-    'Flowers': pyautogui.Point(137, 498),
-    'Clover': pyautogui.Point(82, 495),
-    'Grass T': pyautogui.Point(191, 498),
-    'Grass TY': pyautogui.Point(27, 554),
-    'Weeds': pyautogui.Point(80, 554),
-    'Grass XT': pyautogui.Point(135, 554),
-    'Grass XTY': pyautogui.Point(191, 554),
-    'Dirt': pyautogui.Point(27, 383),
-    'Pavement 1': pyautogui.Point(81, 495),
-    'Direction 1': pyautogui.Point(248,17),
-    'Direction 2': pyautogui.Point(278,17),
-    'Direction 3': pyautogui.Point(308,17),
-    'Direction 4': pyautogui.Point(338,17),
-    'Road Tile 1': pyautogui.Point(36,615),
-    'Road Tile 2': pyautogui.Point(108,615),
-    'Road Tile 3': pyautogui.Point(182,615),
-    'Road Tile 4': pyautogui.Point(36,659),
-    'Road Tile 5': pyautogui.Point(108,659),
-    'Road Tile 6': pyautogui.Point(182,659),
-    'Road Tile 7': pyautogui.Point(36,696),
-    'Road Tile 8': pyautogui.Point(108,696),
-    'Road Tile 9': pyautogui.Point(182,696),
-    'Road Tile 10': pyautogui.Point(36,740),
-    'Road Tile 11': pyautogui.Point(108,740),
-    'Road Tile 12': pyautogui.Point(182,740),
-    'Paved 1': pyautogui.Point(36,440),
-    'Paved 2': pyautogui.Point(108,440),
-    'Foot Path': pyautogui.Point(183,440),
-    'Gravel Road': pyautogui.Point(183,383),
-    'Marsh': pyautogui.Point(189, 381),
-    'Mud': pyautogui.Point(136, 383),
-    'Deep Ford': pyautogui.Point(27, 495),
-    'Dirt Red': pyautogui.Point(83, 383),
-    'Gravel': pyautogui.Point(27, 554),
-    'Sand': pyautogui.Point(134, 440),
-    'Railroad': pyautogui.Point(36, 497),
-    'Stream': pyautogui.Point(108, 497),
-    'Stone': pyautogui.Point(81, 381),
-    'Tall Stone': pyautogui.Point(135, 381),
-    'Brick': pyautogui.Point(189, 381),
-    'Tall Brick': pyautogui.Point(27, 441),
-    'Rural Stone': pyautogui.Point(81, 441),
-    'Hedge': pyautogui.Point(135, 441),
-    'Low Bocage': pyautogui.Point(189, 441),
-    'Wood Fence': pyautogui.Point(27, 498),
-    'Wire Fence': pyautogui.Point(81, 498),
-    'Picket': pyautogui.Point(135, 498),
-    'Sticks': pyautogui.Point(189, 498),
-    'Lt Forest': pyautogui.Point(27, 383),
-    'Hvy Forest': pyautogui.Point(81, 383),
-    'Deep Marsh': pyautogui.Point(27, 440),
-    'Brush_brush': pyautogui.Point(110, 383),
-    'Ground 2 Paved 2': pyautogui.Point(135, 497),
-    'Cobblestone': pyautogui.Point(190, 497),
-    'House': pyautogui.Point(110, 383),
-    'Barn': pyautogui.Point(36, 440),
-    'Church': pyautogui.Point(110, 440),
-    '1 Story': pyautogui.Point(81, 383),
-    '2 Story': pyautogui.Point(134, 383),
-    '3 Story': pyautogui.Point(189, 383),
-    'Building 1': pyautogui.Point(27, 617),
-    'Building 2': pyautogui.Point(80, 617),
-    'Building 3': pyautogui.Point(135, 617),
-    'Building 4': pyautogui.Point(188, 617),
-    'Building 5': pyautogui.Point(27, 657),
-    'Building 6': pyautogui.Point(80, 657),
-    'Building 7': pyautogui.Point(135, 657),
-    'Building 8': pyautogui.Point(188, 657),
-    'Building 9': pyautogui.Point(27, 699),
-    'Building 10': pyautogui.Point(80, 699),
-    'Building 11': pyautogui.Point(135, 699),
-    'Building 12': pyautogui.Point(188, 699),
-    'Building 13': pyautogui.Point(27, 740),
-    'Building 14': pyautogui.Point(80, 740),
-    'Building 15': pyautogui.Point(135, 740),
-    'Building 16': pyautogui.Point(188, 740),
-    'Church 1': pyautogui.Point(38, 615),
-    'Church 2': pyautogui.Point(110, 615),
-    'Church 3': pyautogui.Point(183, 615),
-    'Church 4': pyautogui.Point(38, 657),
-    'Church 5': pyautogui.Point(110, 657),
-    'Church 6': pyautogui.Point(183, 657),
-    'Church 7': pyautogui.Point(38, 696),
-    'Church 8': pyautogui.Point(110, 696),
-    'Church 9': pyautogui.Point(183, 696),
-    'Barn 1': pyautogui.Point(38, 615),
-    'Barn 2': pyautogui.Point(110, 615),
-    'Barn 3': pyautogui.Point(183, 615),
-    'Barn 4': pyautogui.Point(38, 657),
-    'Barn 5': pyautogui.Point(110, 657),
-    'Barn 6': pyautogui.Point(183, 657),
-    'Gravestone': pyautogui.Point(188, 441),
-    'Junk': pyautogui.Point(27, 498),
-    'Pallet': pyautogui.Point(188, 498),
-    'Bin': pyautogui.Point(188, 384),
-    'Shed': pyautogui.Point(188, 384),
-    'Shelter': pyautogui.Point(27, 438),
-    'Fountain': pyautogui.Point(135, 440),
-    'Pond': pyautogui.Point(81, 554),
-    'Bench': pyautogui.Point(135, 383),
-    'Roadside': pyautogui.Point(191, 554),
-    'Tel Pole': pyautogui.Point(27, 494),
-    'Object 1': pyautogui.Point(36, 614),
-    'Object 2': pyautogui.Point(110, 614),
-    'Object 3': pyautogui.Point(185, 614),
-    'Object 4': pyautogui.Point(36, 657),
-    'Object 5': pyautogui.Point(110, 657),
-    'Object 6': pyautogui.Point(185, 657),
-    'Object 7': pyautogui.Point(36, 701),
-    'Object 8': pyautogui.Point(110, 701),
-    'Object 9': pyautogui.Point(185, 701),
-    'Dirt Road': pyautogui.Point(110, 382),
+    'Ground 1': Point(113, 107),
+    'Ground 2': Point(105, 123),
+    'Ground 3': Point(105, 144),
+    'Brush': Point(107, 165),
+    'Foliage': Point(110, 185),
+    'Roads': Point(107, 203),
+    "Walls/Fences": Point(105, 224),
+    "Independent Buildings": Point(105, 264),
+    "Modular Buildings": Point(105, 245),
+    "Flavor Objects 1": Point(105, 285),
+    "Flavor Objects 2": Point(105, 306),
+    'Water': Point(81, 438),
+    'Plow NS': Point(135, 552),
+    'Plow EW': Point(188, 552),
+    'Crop 1': Point(26, 383),
+    'Crop 2': Point(87, 383),
+    'Crop 3': Point(135, 383),
+    'Crop 4': Point(188, 383),
+    'Crop 5': Point(26, 440),
+    'Crop 6': Point(87, 440),
+    'Tree A': Point(110, 381),
+    'Tree B': Point(180, 380),
+    'Tree C': Point(39, 438),
+    'Tree D': Point(114, 438),
+    'Tree E': Point(183, 438),
+    'Tree F': Point(39, 498),
+    'Tree G': Point(114, 498),
+    'Tree H': Point(183, 498),
+    'Bush A': Point(39, 555),
+    'Bush B': Point(114, 555),
+    'Bush C': Point(183, 555),
+    'density 1': Point(38, 617),
+    'density 2': Point(110, 617),
+    'density 3': Point(180, 617),
+    'density 4': Point(38, 657),
+    'Grass': Point(189, 438),
+    'Flowers': Point(137, 498),
+    'Clover': Point(82, 495),
+    'Grass T': Point(191, 498),
+    'Grass TY': Point(27, 554),
+    'Weeds': Point(80, 554),
+    'Grass XT': Point(135, 554),
+    'Grass XTY': Point(191, 554),
+    'Dirt': Point(27, 383),
+    'Pavement 1': Point(81, 495),
+    'Direction 1': Point(248,17),
+    'Direction 2': Point(278,17),
+    'Direction 3': Point(308,17),
+    'Direction 4': Point(338,17),
+    'Road Tile 1': Point(36,615),
+    'Road Tile 2': Point(108,615),
+    'Road Tile 3': Point(182,615),
+    'Road Tile 4': Point(36,659),
+    'Road Tile 5': Point(108,659),
+    'Road Tile 6': Point(182,659),
+    'Road Tile 7': Point(36,696),
+    'Road Tile 8': Point(108,696),
+    'Road Tile 9': Point(182,696),
+    'Road Tile 10': Point(36,740),
+    'Road Tile 11': Point(108,740),
+    'Road Tile 12': Point(182,740),
+    'Paved 1': Point(36,440),
+    'Paved 2': Point(108,440),
+    'Foot Path': Point(183,440),
+    'Gravel Road': Point(183,383),
+    'Marsh': Point(189, 381),
+    'Mud': Point(136, 383),
+    'Deep Ford': Point(27, 495),
+    'Dirt Red': Point(83, 383),
+    'Gravel': Point(27, 554),
+    'Sand': Point(134, 440),
+    'Railroad': Point(36, 497),
+    'Stream': Point(108, 497),
+    'Stone': Point(81, 381),
+    'Tall Stone': Point(135, 381),
+    'Brick': Point(189, 381),
+    'Tall Brick': Point(27, 441),
+    'Rural Stone': Point(81, 441),
+    'Hedge': Point(135, 441),
+    'Low Bocage': Point(189, 441),
+    'Wood Fence': Point(27, 498),
+    'Wire Fence': Point(81, 498),
+    'Picket': Point(135, 498),
+    'Sticks': Point(189, 498),
+    'Lt Forest': Point(27, 383),
+    'Hvy Forest': Point(81, 383),
+    'Deep Marsh': Point(27, 440),
+    'Brush_brush': Point(110, 383),
+    'Ground 2 Paved 2': Point(135, 497),
+    'Cobblestone': Point(190, 497),
+    'House': Point(110, 383),
+    'Barn': Point(36, 440),
+    'Church': Point(110, 440),
+    '1 Story': Point(81, 383),
+    '2 Story': Point(134, 383),
+    '3 Story': Point(189, 383),
+    'Building 1': Point(27, 617),
+    'Building 2': Point(80, 617),
+    'Building 3': Point(135, 617),
+    'Building 4': Point(188, 617),
+    'Building 5': Point(27, 657),
+    'Building 6': Point(80, 657),
+    'Building 7': Point(135, 657),
+    'Building 8': Point(188, 657),
+    'Building 9': Point(27, 699),
+    'Building 10': Point(80, 699),
+    'Building 11': Point(135, 699),
+    'Building 12': Point(188, 699),
+    'Building 13': Point(27, 740),
+    'Building 14': Point(80, 740),
+    'Building 15': Point(135, 740),
+    'Building 16': Point(188, 740),
+    'Church 1': Point(38, 615),
+    'Church 2': Point(110, 615),
+    'Church 3': Point(183, 615),
+    'Church 4': Point(38, 657),
+    'Church 5': Point(110, 657),
+    'Church 6': Point(183, 657),
+    'Church 7': Point(38, 696),
+    'Church 8': Point(110, 696),
+    'Church 9': Point(183, 696),
+    'Barn 1': Point(38, 615),
+    'Barn 2': Point(110, 615),
+    'Barn 3': Point(183, 615),
+    'Barn 4': Point(38, 657),
+    'Barn 5': Point(110, 657),
+    'Barn 6': Point(183, 657),
+    'Gravestone': Point(188, 441),
+    'Junk': Point(27, 498),
+    'Pallet': Point(188, 498),
+    'Bin': Point(188, 384),
+    'Shed': Point(188, 384),
+    'Shelter': Point(27, 438),
+    'Fountain': Point(135, 440),
+    'Pond': Point(81, 554),
+    'Bench': Point(135, 383),
+    'Roadside': Point(191, 554),
+    'Tel Pole': Point(27, 494),
+    'Object 1': Point(36, 614),
+    'Object 2': Point(110, 614),
+    'Object 3': Point(185, 614),
+    'Object 4': Point(36, 657),
+    'Object 5': Point(110, 657),
+    'Object 6': Point(185, 657),
+    'Object 7': Point(36, 701),
+    'Object 8': Point(110, 701),
+    'Object 9': Point(185, 701),
+    'Dirt Road': Point(110, 382),
 }
+
+# ground entry (menu, cat1) a new map is covered with
+DEFAULT_GROUND = ('Ground 1', 'Grass')
@@ -13,24 +13,24 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import pyautogui
-
-POS_HORIZONTAL_PLUS = pyautogui.Point(764, 10)
-POS_HORIZONTAL_MINUS = pyautogui.Point(764, 26)
-POS_HORIZONTAL_PLUS2 = pyautogui.Point(874, 10)
-POS_HORIZONTAL_MINUS2 = pyautogui.Point(874, 27)
-
-POS_VERTICAL_PLUS = pyautogui.Point(1014, 10)
-POS_VERTICAL_MINUS = pyautogui.Point(903, 10)
-POS_VERTICAL_PLUS2 = pyautogui.Point(1014, 27)
-POS_VERTICAL_MINUS2 = pyautogui.Point(903, 27)
-
-DIRECTION_1 = pyautogui.Point(248,17)
-DIRECTION_2 = pyautogui.Point(278,17)
-DIRECTION_3 = pyautogui.Point(308,17)
-DIRECTION_4 = pyautogui.Point(338,17)
-
-BRUSH_1 = pyautogui.Point(411, 20)
-BRUSH_3 = pyautogui.Point(441, 20)
-BRUSH_7 = pyautogui.Point(471, 20)
-BRUSH_15 = pyautogui.Point(503, 20)
+from .point import Point
+
+POS_HORIZONTAL_PLUS = Point(764, 10)
+POS_HORIZONTAL_MINUS = Point(764, 26)
+POS_HORIZONTAL_PLUS2 = Point(874, 10)
+POS_HORIZONTAL_MINUS2 = Point(874, 27)
+
+POS_VERTICAL_PLUS = Point(1014, 10)
+POS_VERTICAL_MINUS = Point(903, 10)
+POS_VERTICAL_PLUS2 = Point(1014, 27)
+POS_VERTICAL_MINUS2 = Point(903, 27)
+
+DIRECTION_1 = Point(248,17)
+DIRECTION_2 = Point(278,17)
+DIRECTION_3 = Point(308,17)
+DIRECTION_4 = Point(338,17)
+
+BRUSH_1 = Point(411, 20)
+BRUSH_3 = Point(441, 20)
+BRUSH_7 = Point(471, 20)
+BRUSH_15 = Point(503, 20)
@@ -13,10 +13,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import pyautogui
+from .point import Point
 
-UPPER_LEFT_SQUARE = pyautogui.Point(233,50)
-LOWER_RIGHT_SQUARE = pyautogui.Point(633,451)
+UPPER_LEFT_SQUARE = Point(233,50)
+LOWER_RIGHT_SQUARE = Point(633,451)
 
 SQUARE_SIZE_X = 16
 SQUARE_SIZE_Y = 16